@@ -11,21 +11,42 @@ from .constants import DEFAULT_TIMEOUT_SECONDS, COLORS
 
 log = logging.getLogger("guardian.base_cog")
 
+# Permission name -> bit, so permission checks are one integer AND.
+# The require_* helpers below test their single bit inline; check_permissions
+# builds a mask for arbitrary combinations.
+_PERM_BITS: dict[str, int] = dict(discord.Permissions.VALID_FLAGS)
+_ADMIN_MASK = _PERM_BITS["administrator"]
+_MANAGE_GUILD_MASK = _PERM_BITS["manage_guild"]
+_MANAGE_CHANNELS_MASK = _PERM_BITS["manage_channels"]
+_MANAGE_ROLES_MASK = _PERM_BITS["manage_roles"]
+
+
+def _has_mask(interaction: discord.Interaction, mask: int) -> bool:
+    perms = interaction.app_permissions
+    if not perms:
+        return False
+    return (perms.value & mask) == mask
+
 
 class BaseCog(commands.Cog):
     """Base class for all cogs with common functionality."""
     
+    # commands.Cog instances still carry a __dict__ (discord.py stores its own
+    # per-instance state there); the slots make these hot attributes direct.
+    __slots__ = ("bot", "log", "_cls_name")
+    
     def __init__(self, bot: commands.Bot) -> None:
         self.bot = bot
-        self.log = logging.getLogger(f"guardian.cog.{self.__class__.__name__.lower()}")
+        self._cls_name = type(self).__name__
+        self.log = logging.getLogger(f"guardian.cog.{self._cls_name.lower()}")
     
     async def cog_load(self) -> None:
         """Called when the cog is loaded."""
-        self.log.info(f"Loaded {self.__class__.__name__}")
+        self.log.info("Loaded %s", self._cls_name)
     
     async def cog_unload(self) -> None:
         """Called when the cog is unloaded."""
-        self.log.info(f"Unloaded {self.__class__.__name__}")
+        self.log.info("Unloaded %s", self._cls_name)
     
     def error_embed(self, message: str) -> discord.Embed:
         """Create a standardized error embed."""
@@ -67,40 +88,50 @@ class BaseCog(commands.Cog):
     
     def check_permissions(self, interaction: discord.Interaction, **permissions: bool) -> bool:
         """Check if the user has the required permissions."""
-        if not interaction.app_permissions:
-            return False
-        
+        mask = 0
         for perm, required in permissions.items():
-            if required and not getattr(interaction.app_permissions, perm, False):
-                return False
-        return True
+            if required:
+                bit = _PERM_BITS.get(perm)
+                if bit is None:
+                    return False
+                mask |= bit
+        return _has_mask(interaction, mask)
     
     def require_admin(self, interaction: discord.Interaction) -> bool:
         """Check if the user is an administrator."""
-        return self.check_permissions(interaction, administrator=True)
+        perms = interaction.app_permissions
+        return bool(perms) and bool(perms.value & _ADMIN_MASK)
     
     def require_manage_guild(self, interaction: discord.Interaction) -> bool:
         """Check if the user can manage the guild."""
-        return self.check_permissions(interaction, manage_guild=True)
+        perms = interaction.app_permissions
+        return bool(perms) and bool(perms.value & _MANAGE_GUILD_MASK)
     
     def require_manage_channels(self, interaction: discord.Interaction) -> bool:
         """Check if the user can manage channels."""
-        return self.check_permissions(interaction, manage_channels=True)
+        perms = interaction.app_permissions
+        return bool(perms) and bool(perms.value & _MANAGE_CHANNELS_MASK)
     
     def require_manage_roles(self, interaction: discord.Interaction) -> bool:
         """Check if the user can manage roles."""
-        return self.check_permissions(interaction, manage_roles=True)
+        perms = interaction.app_permissions
+        return bool(perms) and bool(perms.value & _MANAGE_ROLES_MASK)
 
 
 class AdminCog(BaseCog):
     """Base class for admin-only cogs."""
     
+    __slots__ = ()
+    
+    # Built once per class; the denial message never changes.
+    _DENY_EMBED = safe_embed("Error", "You need administrator permissions to use this command.", COLORS["error"])
+    
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
         """Check if the user has admin permissions."""
         if not self.require_admin(interaction):
             await self.safe_response(
                 interaction, 
-                embed=self.error_embed("You need administrator permissions to use this command."),
+                embed=self._DENY_EMBED,
                 ephemeral=True
             )
             return False
@@ -110,12 +141,17 @@ class AdminCog(BaseCog):
 class ModeratorCog(BaseCog):
     """Base class for moderator cogs."""
     
+    __slots__ = ()
+    
+    # Built once per class; the denial message never changes.
+    _DENY_EMBED = safe_embed("Error", "You need moderator permissions to use this command.", COLORS["error"])
+    
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
         """Check if the user has moderator permissions."""
         if not (self.require_admin(interaction) or self.require_manage_guild(interaction)):
             await self.safe_response(
                 interaction,
-                embed=self.error_embed("You need moderator permissions to use this command."),
+                embed=self._DENY_EMBED,
                 ephemeral=True
             )
             return False
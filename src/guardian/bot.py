@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import importlib
+import json
 import logging
+import time
+from contextlib import suppress
 
 import discord
 from discord.ext import commands
 
 from .config import Settings
 from .constants import CACHE_TTL_SECONDS
-from .database import initialize_database
+from .database import SqlitePool, initialize_database
 from .error_handlers import setup_error_handlers
 from .services.task_queue import QueuePolicy, TaskQueue
 from .services.guild_store import GuildStore
@@ -30,73 +36,201 @@ from .startup_diagnostics import StartupDiagnostics
 from .services.panel_store import PanelStore
 from .permissions import validate_command_permissions
 from .services.role_config_store import RoleConfigStore
-from .services.profiles_store import ProfilesStore
-from .services.titles_store import TitlesStore
 from .services.root_store import RootStore
 from .services.bootstrap_state_store import BootstrapStateStore
+from .services.channel_bootstrapper import ChannelBootstrapper
 from .ui.persistent import register_all_views
 from .observability import observability
 from .migration import initialize_migration_system
+from .services.base import BaseService
 
 log = logging.getLogger("guardian.bot")
 
-
-import asyncio
-from datetime import datetime
+# Stores built for every configuration: (bot attribute, store class, takes the cache TTL).
+# Optional community stores are added in GuardianBot.__init__ when enabled.
+_STORE_SPECS: tuple[tuple[str, type[BaseService], bool], ...] = (
+    ("guild_store", GuildStore, True),
+    ("warnings_store", WarningsStore, True),
+    ("levels_store", LevelsStore, True),
+    ("levels_config_store", LevelsConfigStore, True),
+    ("levels_ledger_store", LevelsLedgerStore, True),
+    ("level_rewards_store", LevelRewardsStore, True),
+    ("starboard_store", StarboardStore, True),
+    ("server_config_store", ServerConfigStore, True),
+    ("onboarding_store", OnboardingStore, True),
+    ("cases_store", CasesStore, True),
+    ("reputation_store", ReputationStore, True),
+    ("suggestions_store", SuggestionsStore, True),
+    ("root_store", RootStore, False),
+    ("panel_store", PanelStore, False),
+    ("role_config_store", RoleConfigStore, False),
+    ("bootstrap_state_store", BootstrapStateStore, True),
+)
+
+# Startup cog load plan, in load order:
+# (settings flag gating the cog or None, module, class, needs the message content intent).
+_COG_PLAN: tuple[tuple[str | None, str, str, bool], ...] = (
+    # Core configuration + server lifecycle
+    (None, "guardian.cogs.admin", "AdminCog", False),
+    (None, "guardian.cogs.setup_autoconfig", "SetupAutoConfigCog", False),
+    (None, "guardian.cogs.dm_cleanup", "DMCleanupCog", False),
+    (None, "guardian.cogs.admin_management", "AdminManagementCog", False),
+    (None, "guardian.cogs.root_management", "RootManagementCog", False),
+    # Community + onboarding
+    (None, "guardian.cogs.welcome", "WelcomeCog", False),
+    (None, "guardian.cogs.onboarding", "OnboardingCog", False),
+    (None, "guardian.cogs.suggestions", "SuggestionsCog", False),
+    # Core systems
+    (None, "guardian.cogs.levels_full", "LevelsCog", False),
+    (None, "guardian.cogs.starboard", "StarboardCog", False),
+    (None, "guardian.cogs.reputation", "ReputationCog", False),
+    (None, "guardian.cogs.utilities", "UtilitiesCog", False),
+    # Community systems (non-moderation)
+    ("profiles_enabled", "guardian.cogs.profiles", "ProfilesCog", False),
+    ("titles_enabled", "guardian.cogs.titles", "TitlesCog", False),
+    # Community vibe systems (non-moderation)
+    ("prefix_commands_enabled", "guardian.cogs.prefix_community", "PrefixCommunityCog", True),
+    # Production-ready systems
+    (None, "guardian.cogs.setup_wizard", "SetupWizardCog", False),
+    # Server template overhaul command (idempotent structural deploy)
+    (None, "guardian.cogs.server_template_overhaul", "ServerTemplateOverhaulCog", False),
+    (None, "guardian.cogs.ticket_system", "TicketSystemCog", False),
+    (None, "guardian.cogs.role_assignment", "RoleAssignmentCog", False),
+    (None, "guardian.cogs.activity_manager", "ActivityCog", False),
+    (None, "guardian.cogs.health_check", "HealthCheckCog", False),
+    ("reaction_roles_enabled", "guardian.cogs.reaction_roles_new", "ReactionRolesCog", False),
+    # Persistent panels
+    (None, "guardian.cogs.verify_panel", "VerifyPanelCog", False),
+    (None, "guardian.cogs.role_panel", "RolePanelCog", False),
+    (None, "guardian.cogs.role_panel", "RoleSelectCog", False),
+)
+
+
+# Upper bound for bootstrapping a single guild in on_ready.
+_BOOTSTRAP_TIMEOUT_SECONDS = 30.0
+
+# Never ping @everyone or roles from bot output; these are shared by every
+# GuardianBot instance (discord.py only reads them).
+_ALLOWED_MENTIONS = discord.AllowedMentions(everyone=False, roles=False, users=True)
+_COMMAND_PREFIX = commands.when_mentioned_or("!", "?")
+
+
+def _build_intents(*, message_content: bool) -> discord.Intents:
+    """Gateway intents for the bot; members is always required."""
+    intents = discord.Intents.default()
+    intents.members = True
+    intents.message_content = message_content
+    return intents
+
+
+def _cog_load_plan(settings: Settings, *, message_content: bool) -> list[tuple[str, str]]:
+    """Return the (module, class) pairs to load for these settings, in load order."""
+    specs: list[tuple[str, str]] = []
+    for flag, import_path, class_name, needs_message_content in _COG_PLAN:
+        if flag is not None and not getattr(settings, flag, True):
+            log.info("%s disabled by settings; skipping %s", flag, class_name)
+            continue
+        if needs_message_content and not message_content:
+            log.warning("%s requires the message_content intent, which is disabled; skipping it", class_name)
+            continue
+        specs.append((import_path, class_name))
+    return specs
 
 
 class _CommandSyncManager:
+    __slots__ = ("bot", "_log", "_lock", "_startup_synced")
+
     def __init__(self, bot: "GuardianBot") -> None:
         self.bot = bot
+        self._log = getattr(bot, "log", log)
         self._lock = asyncio.Lock()
+        self._startup_synced = False
 
     async def sync_startup(self) -> None:
+        # One-shot: setup_hook only runs once, but guard against repeated calls
+        # and don't queue behind a sync that is already in flight.
+        if self._startup_synced or self._lock.locked():
+            return
+        self._startup_synced = True
+
         # Use sync_guild_id if set, otherwise dev_guild_id, else global
-        if self.bot.settings.sync_guild_id:
-            await self.sync_guild(self.bot.settings.sync_guild_id)
-        elif self.bot.settings.dev_guild_id:
-            await self.sync_guild(self.bot.settings.dev_guild_id)
+        guild_id = self.bot.settings.sync_guild_id or self.bot.settings.dev_guild_id
+
+        # Syncing is a rate-limited round-trip to Discord; skip it when the
+        # command tree is identical to the one last synced to this target.
+        state_key = f"cmd_tree_hash:{self.bot.application_id}:{guild_id or 'global'}"
+        digest = self._tree_digest()
+        try:
+            unchanged = await self.bot.server_config_store.get_state(state_key) == digest
+        except Exception:
+            self._log.warning("Could not read the last command tree hash; syncing anyway", exc_info=True)
+            unchanged = False
+        if unchanged:
+            self._log.info("Command tree unchanged since last sync; skipping sync")
+            return
+
+        if guild_id:
+            await self.sync_guild(guild_id)
         else:
             await self.sync_global()
 
+        try:
+            await self.bot.server_config_store.set_state(state_key, digest)
+        except Exception:
+            self._log.warning("Could not store the command tree hash", exc_info=True)
+
+    def _tree_digest(self) -> str:
+        """Stable hash of the global command payloads that a sync would upload."""
+        tree = self.bot.tree
+        payload = sorted(
+            (c.to_dict(tree) for c in tree.get_commands()),
+            key=lambda d: (d.get("type", 1), d["name"]),
+        )
+        raw = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
     async def sync_global(self) -> None:
         async with self._lock:
             await self.bot.tree.sync()
-            getattr(self.bot, "log", log).info("Commands synced globally")
+            self._log.info("Commands synced globally")
 
             # Deterministic visibility check: ensure the tree isn't empty.
             cmds = self.bot.tree.get_commands()
-            getattr(self.bot, "log", log).info("Tree commands loaded: %d", len(cmds))
-            for c in cmds:
-                getattr(self.bot, "log", log).info(" - /%s", c.name)
+            self._log.info("Tree commands loaded: %d", len(cmds))
+            if self._log.isEnabledFor(logging.DEBUG):
+                self._log.debug("Tree commands: %s", ", ".join(f"/{c.name}" for c in cmds))
 
     async def sync_guild(self, guild_id: int) -> None:
         async with self._lock:
             guild = discord.Object(id=guild_id)
+            # Cogs register their commands globally; a guild-scoped sync only
+            # pushes the guild's own copy, so mirror the global set into it.
+            # Guild commands update instantly, unlike the global round-trip.
+            self.bot.tree.copy_global_to(guild=guild)
             await self.bot.tree.sync(guild=guild)
-            getattr(self.bot, "log", log).info("Commands synced to guild %d", guild_id)
+            self._log.info("Commands synced to guild %d", guild_id)
 
             # Deterministic visibility check: ensure the tree isn't empty.
             cmds = self.bot.tree.get_commands()
-            getattr(self.bot, "log", log).info("Tree commands loaded: %d", len(cmds))
-            for c in cmds:
-                getattr(self.bot, "log", log).info(" - /%s", c.name)
+            self._log.info("Tree commands loaded: %d", len(cmds))
+            if self._log.isEnabledFor(logging.DEBUG):
+                self._log.debug("Tree commands: %s", ", ".join(f"/{c.name}" for c in cmds))
 
 
 class GuardianBot(commands.Bot):
     def __init__(self, settings: Settings) -> None:
         self.log = log
-        intents = discord.Intents.default()
-        intents.members = True
         # We prefer slash commands; message content intent is optional.
-        intents.message_content = bool(settings.message_content_intent)
+        message_content = bool(settings.message_content_intent)
+        intents = _build_intents(message_content=message_content)
 
-        log.info("INTENTS: guilds=%s members=%s message_content=%s", intents.guilds, intents.members, intents.message_content)
+        # guilds is on in Intents.default() and _build_intents forces members on.
+        log.info("INTENTS: %r", {"guilds": True, "members": True, "message_content": message_content})
 
         super().__init__(
-            command_prefix=commands.when_mentioned_or("!", "?"),
+            command_prefix=_COMMAND_PREFIX,
             intents=intents,
-            allowed_mentions=discord.AllowedMentions(everyone=False, roles=False, users=True),
+            allowed_mentions=_ALLOWED_MENTIONS,
             help_command=None,
         )
 
@@ -113,63 +247,51 @@ class GuardianBot(commands.Bot):
             stats=self.stats,
         )
 
+        # All stores share one pooled set of SQLite connections (opened in setup_hook)
+        self.db_pool = SqlitePool(settings.sqlite_path, readers=settings.sqlite_readers)
+
         # Initialize all stores with centralized cache TTL
         cache_ttl = settings.cache_default_ttl_seconds or CACHE_TTL_SECONDS
         
-        self.guild_store = GuildStore(settings.sqlite_path, cache_ttl)
-        self.warnings_store = WarningsStore(settings.sqlite_path, cache_ttl)
-        self.levels_store = LevelsStore(settings.sqlite_path, cache_ttl)
-        self.levels_config_store = LevelsConfigStore(settings.sqlite_path, cache_ttl)
-        self.levels_ledger_store = LevelsLedgerStore(settings.sqlite_path, cache_ttl)
-        self.level_rewards_store = LevelRewardsStore(settings.sqlite_path, cache_ttl)
-        self.starboard_store = StarboardStore(settings.sqlite_path, cache_ttl)
-        self.server_config_store = ServerConfigStore(settings.sqlite_path, cache_ttl)
-        self.onboarding_store = OnboardingStore(settings.sqlite_path, cache_ttl)
-        self.cases_store = CasesStore(settings.sqlite_path, cache_ttl)
-        self.reputation_store = ReputationStore(settings.sqlite_path, cache_ttl)
-        self.suggestions_store = SuggestionsStore(settings.sqlite_path, cache_ttl)
-        self.profiles_store = ProfilesStore(settings.sqlite_path, cache_ttl)
-        self.titles_store = TitlesStore(settings.sqlite_path, cache_ttl)
-        self.root_store = RootStore(settings.sqlite_path)
-        self.panel_store = PanelStore(settings.sqlite_path)
-        log.info("PanelStore loaded: %s", PanelStore.__name__)
-        self.role_config_store = RoleConfigStore(settings.sqlite_path)
-        self.bootstrap_state_store = BootstrapStateStore(settings.sqlite_path, cache_ttl)
+        self._stores: list[BaseService] = []
+        for attr, store_cls, uses_ttl in _STORE_SPECS:
+            store = store_cls(self.db_pool, cache_ttl) if uses_ttl else store_cls(self.db_pool)
+            setattr(self, attr, store)
+            self._stores.append(store)
+
+        # Optional community stores are imported only when a cog that uses them
+        # can load (profile cards also show titles; prefix commands use both).
+        self.profiles_store = None
+        self.titles_store = None
+        if settings.profiles_enabled or settings.prefix_commands_enabled:
+            from .services.profiles_store import ProfilesStore
+
+            self.profiles_store = ProfilesStore(self.db_pool, cache_ttl)
+            self._stores.append(self.profiles_store)
+        if settings.profiles_enabled or settings.titles_enabled or settings.prefix_commands_enabled:
+            from .services.titles_store import TitlesStore
+
+            self.titles_store = TitlesStore(self.db_pool, cache_ttl)
+            self._stores.append(self.titles_store)
         
         # Initialize panel registry
         self.panel_registry = PanelRegistry(self, self.panel_store)
+        self.channel_bootstrapper = ChannelBootstrapper(self, self.bootstrap_state_store)
+        self._bootstrapped_guilds: set[int] = set()
         
         # Initialize bot-specific services
         self._sync_mgr = _CommandSyncManager(self)
+        self._sync_task: asyncio.Task | None = None
         self.status_reporter = StatusReporter(self)
         self.guild_logger = GuildLogger(self)
 
     async def setup_hook(self) -> None:
-        start_time = datetime.utcnow()
+        start_time = time.perf_counter()
         
         # Initialize all stores with centralized database initialization
-        stores = [
-            self.guild_store,
-            self.warnings_store,
-            self.levels_store,
-            self.levels_config_store,
-            self.levels_ledger_store,
-            self.level_rewards_store,
-            self.starboard_store,
-            self.server_config_store,
-            self.onboarding_store,
-            self.cases_store,
-            self.reputation_store,
-            self.suggestions_store,
-            self.profiles_store,
-            self.titles_store,
-            self.root_store,
-            self.panel_store,
-            self.role_config_store,
-            self.bootstrap_state_store,
-        ]
-        
-        await initialize_database(self.settings.sqlite_path, stores)
+        await self.db_pool.open()
+        await initialize_database(self.db_pool, self._stores)
+        self.db_pool.start_optimizer()
         observability.log_startup_event("database", "OK")
         
         # Initialize persistent UI framework
@@ -178,7 +300,7 @@ class GuardianBot(commands.Bot):
         observability.log_startup_event("views_registered", "OK")
         
         # Initialize production systems
-        initialize_migration_system(self.settings.sqlite_path)
+        initialize_migration_system(self.db_pool)
         observability.log_startup_event("migration_system", "OK")
         
         # Initialize panel registry renderers (will be done by cogs)
@@ -195,84 +317,64 @@ class GuardianBot(commands.Bot):
         failed: list[str] = []
 
         # Cogs are loaded defensively so one bad cog cannot prevent command registration.
-        async def _load_cog(import_path: str, class_name: str) -> None:
+        def _resolve_cog(import_path: str, class_name: str) -> type[commands.Cog] | None:
+            name = f"{import_path}.{class_name}"
+            log.info("Loading cog: %s", name)
             try:
-                log.info("Loading cog: %s.%s", import_path, class_name)
-                mod = __import__(import_path, fromlist=[class_name])
-                cls = getattr(mod, class_name)
-                await self.add_cog(cls(self))
-                log.info("Loaded cog: %s.%s", import_path, class_name)
-                loaded.append(f"{import_path}.{class_name}")
+                # import_module returns straight from sys.modules for modules
+                # that provide several cogs (role_panel).
+                mod = importlib.import_module(import_path)
             except ModuleNotFoundError as e:
-                log.error("Module not found for cog %s.%s: %s", import_path, class_name, e)
-                failed.append(f"{import_path}.{class_name} (ModuleNotFoundError)")
-            except AttributeError as e:
-                log.error("Class %s not found in module %s: %s", class_name, import_path, e)
-                # Log available attributes for debugging
-                try:
-                    mod = __import__(import_path, fromlist=[class_name])
-                    available = [attr for attr in dir(mod) if not attr.startswith('_')]
-                    log.error("Available attributes in %s: %s", import_path, available)
-                except Exception as e:
-                    log.error("Failed to import cog %s.%s: %s", import_path, class_name, e)
-                failed.append(f"{import_path}.{class_name} (AttributeError)")
+                log.error("Module not found for cog %s: %s", name, e)
+                failed.append(f"{name} (ModuleNotFoundError)")
+                return None
             except Exception as e:
-                log.exception("Failed to load cog: %s.%s", import_path, class_name)
-                failed.append(f"{import_path}.{class_name} ({type(e).__name__})")
-
-        # Core configuration + server lifecycle
-        await _load_cog("guardian.cogs.admin", "AdminCog")
-        await _load_cog("guardian.cogs.setup_autoconfig", "SetupAutoConfigCog")
-        await _load_cog("guardian.cogs.dm_cleanup", "DMCleanupCog")
-        await _load_cog("guardian.cogs.admin_management", "AdminManagementCog")
-        await _load_cog("guardian.cogs.root_management", "RootManagementCog")
-        
-        # Community + onboarding
-        await _load_cog("guardian.cogs.welcome", "WelcomeCog")
-        await _load_cog("guardian.cogs.onboarding", "OnboardingCog")
-        await _load_cog("guardian.cogs.suggestions", "SuggestionsCog")
-
-
-        # Core systems
-        await _load_cog("guardian.cogs.levels_full", "LevelsCog")
-        await _load_cog("guardian.cogs.starboard", "StarboardCog")
-        await _load_cog("guardian.cogs.reputation", "ReputationCog")
-        await _load_cog("guardian.cogs.utilities", "UtilitiesCog")
-
-        # Community systems (non-moderation)
-        if self.settings.profiles_enabled:
-            await _load_cog("guardian.cogs.profiles", "ProfilesCog")
-        if self.settings.titles_enabled:
-            await _load_cog("guardian.cogs.titles", "TitlesCog")
-
-        # Community vibe systems (non-moderation)
-        if self.settings.prefix_commands_enabled and not self.intents.message_content:
-            log.warning("PREFIX_COMMANDS_ENABLED but message_content intent is disabled; prefix commands will remain unavailable")
-        elif self.settings.prefix_commands_enabled:
-            await _load_cog("guardian.cogs.prefix_community", "PrefixCommunityCog")
-
-        
-        # Production-ready systems
-        await _load_cog("guardian.cogs.setup_wizard", "SetupWizardCog")
-        # Server template overhaul command (idempotent structural deploy)
-        await _load_cog("guardian.cogs.server_template_overhaul", "ServerTemplateOverhaulCog")
-        await _load_cog("guardian.cogs.ticket_system", "TicketSystemCog")
-        await _load_cog("guardian.cogs.role_assignment", "RoleAssignmentCog")
-        await _load_cog("guardian.cogs.activity_manager", "ActivityCog")
-        await _load_cog("guardian.cogs.health_check", "HealthCheckCog")
-        if getattr(self.settings, "reaction_roles_enabled", True):
-            await _load_cog("guardian.cogs.reaction_roles_new", "ReactionRolesCog")
-        else:
-            log.info("Reaction roles disabled by settings; skipping ReactionRolesCog")
-        
-        # Persistent panels
-        await _load_cog("guardian.cogs.verify_panel", "VerifyPanelCog")
-        await _load_cog("guardian.cogs.role_panel", "RolePanelCog")
-        await _load_cog("guardian.cogs.role_panel", "RoleSelectCog")
-        
+                log.exception("Failed to import cog: %s", name)
+                failed.append(f"{name} ({type(e).__name__})")
+                return None
+
+            cls = getattr(mod, class_name, None)
+            if cls is None:
+                log.error("Class %s not found in module %s", class_name, import_path)
+                # Log available attributes for debugging, from the module we already imported
+                available = [attr for attr in dir(mod) if not attr.startswith('_')]
+                log.error("Available attributes in %s: %s", import_path, available)
+                failed.append(f"{name} (AttributeError)")
+                return None
+            return cls
+
+        async def _add_cog(name: str, cls: type[commands.Cog]) -> None:
+            try:
+                await self.add_cog(cls(self))
+                log.info("Loaded cog: %s", name)
+                loaded.append(name)
+            except Exception as e:
+                log.exception("Failed to load cog: %s", name)
+                failed.append(f"{name} ({type(e).__name__})")
+
+        cog_specs = _cog_load_plan(self.settings, message_content=self.intents.message_content)
+
+        # Resolve every class up front, then add the cogs together: they are
+        # independent, so their cog_load work (DB init, view registration)
+        # overlaps instead of running one after another. The imports read and
+        # compile source, so they run in a worker thread to keep the loop (and
+        # the task queue started above) responsive; they stay sequential there
+        # because cog modules import each other.
+        def _resolve_all() -> list[tuple[str, type[commands.Cog]]]:
+            resolved = []
+            for import_path, class_name in cog_specs:
+                cls = _resolve_cog(import_path, class_name)
+                if cls is not None:
+                    resolved.append((f"{import_path}.{class_name}", cls))
+            return resolved
+
+        resolved = await asyncio.to_thread(_resolve_all)
+
+        # _add_cog never raises; return_exceptions is belt-and-braces.
+        await asyncio.gather(*(_add_cog(name, cls) for name, cls in resolved), return_exceptions=True)
 
         log.info("Startup cog load summary: loaded=%d failed=%d", len(loaded), len(failed))
-        if loaded:
+        if loaded and log.isEnabledFor(logging.INFO):
             log.info("Successfully loaded cogs: %s", ", ".join(loaded))
         if failed:
             for name in failed:
@@ -288,20 +390,38 @@ class GuardianBot(commands.Bot):
         log.info(f"Panel repair completed: {repair_results}")
         observability.log_startup_event("panel_registry_ready", "OK")
         
-        await self._sync_mgr.sync_startup()
-        log.info("Command sync complete")
+        # Command sync is an HTTP round-trip to Discord; run it in the background
+        # so the gateway can start handling interactions while it completes.
+        self._sync_task = asyncio.create_task(self._sync_mgr.sync_startup(), name="cmd-sync")
+        self._sync_task.add_done_callback(self._on_command_sync_done)
         observability.log_startup_event("command_sync", "OK")
-        observability.log_startup_event("command_sync_done", "OK")
         
         # Log startup complete with health summary
-        startup_duration = (datetime.utcnow() - start_time).total_seconds() * 1000 if 'start_time' in locals() else 0
-        observability.log_startup_complete(startup_duration)
+        startup_duration = (time.perf_counter() - start_time) * 1000
+        pending = () if self._sync_task.done() else ("command_sync_done",)
+        observability.log_startup_complete(startup_duration, pending=pending)
         
         # Run startup self-check
         await self._run_startup_self_check()
         
         log.info("🚀 Guardian Bot startup complete - All systems operational")
     
+    def _on_command_sync_done(self, task: asyncio.Task) -> None:
+        if task.cancelled():
+            log.warning("Command sync cancelled")
+            return
+        exc = task.exception()
+        if exc is not None:
+            log.error("Command sync failed: %s", exc, exc_info=exc)
+            observability.log_startup_event(
+                "command_sync_done",
+                "FAILED",
+                {"component": "command_sync_done", "status": "FAILED", "error": str(exc)},
+            )
+            return
+        log.info("Command sync complete")
+        observability.log_startup_event("command_sync_done", "OK")
+
     async def _run_startup_self_check(self):
         """Run comprehensive startup self-check."""
         try:
@@ -383,11 +503,18 @@ class GuardianBot(commands.Bot):
             log.error(f"❌ Startup self-check failed with exception: {e}")
 
     async def close(self) -> None:
-        try:
-            # Drift verifier removed: channel/schema enforcement must be invoked manually.
+        if self._sync_task is not None and not self._sync_task.done():
+            self._sync_task.cancel()
+            with suppress(asyncio.CancelledError, Exception):
+                await self._sync_task
+        # Drift verifier removed: channel/schema enforcement must be invoked manually.
+        with suppress(Exception):
             await self.task_queue.stop()
-        finally:
-            await super().close()
+        with suppress(Exception):
+            await self.guild_logger.close()
+        with suppress(Exception):
+            await self.db_pool.close()
+        await super().close()
 
     async def on_command_error(self, context: commands.Context, exception: commands.CommandError) -> None:
         # Prefix/hybrid command errors
@@ -399,10 +526,34 @@ class GuardianBot(commands.Bot):
 
 
     async def on_ready(self):
-        try:
-            for g in list(self.guilds):
-                # Bootstrap posting is manual-only to prevent redeploy spam. Use the dedicated bootstrap command if needed.
-                # await self.channel_bootstrapper.ensure_first_posts(g)
-                pass
-        except Exception as e:
-            log.warning("Failed to ensure first posts for guilds: %s", e)
+        # Bootstrap posting is manual-only by default to prevent redeploy spam;
+        # BOOTSTRAP_AUTORUN opts into running it for every guild on ready.
+        if not self.settings.bootstrap_autorun:
+            return
+
+        # on_ready fires again after every reconnect; only guilds not yet
+        # bootstrapped in this process need the REST/DB round-trips.
+        pending = [g for g in self.guilds if g.id not in self._bootstrapped_guilds]
+        if not pending:
+            return
+
+        # Guilds are bootstrapped concurrently, capped so the REST calls stay
+        # within Discord's rate limits.
+        semaphore = asyncio.Semaphore(8)
+
+        async def _bootstrap(guild: discord.Guild) -> None:
+            async with semaphore:
+                try:
+                    # One stalled guild must not hold a semaphore slot forever.
+                    await asyncio.wait_for(
+                        self.channel_bootstrapper.ensure_first_posts(guild),
+                        timeout=_BOOTSTRAP_TIMEOUT_SECONDS,
+                    )
+                except TimeoutError:
+                    log.warning("Timed out ensuring first posts for guild %s", guild.id)
+                except Exception:
+                    log.exception("Failed to ensure first posts for guild %s", guild.id)
+                else:
+                    self._bootstrapped_guilds.add(guild.id)
+
+        await asyncio.gather(*(_bootstrap(g) for g in pending))
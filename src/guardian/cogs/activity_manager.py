@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import asyncio
+import bisect
 import random
 import time
 import logging
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+from contextlib import suppress
+from typing import Any, Callable, Dict, List, Optional, Sequence
+from dataclasses import dataclass, field
 from enum import Enum
 
 import discord
@@ -25,7 +27,7 @@ class ActivityType(Enum):
     CUSTOM = "custom"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ActivityConfig:
     """Configuration for a bot activity."""
     name: str
@@ -34,6 +36,157 @@ class ActivityConfig:
     url: Optional[str] = None  # For streaming activities
     weight: int = 1  # Weight for random selection (higher = more frequent)
     duration_minutes: int = 5  # How long to display this activity
+    # discord.py presence object, built once from the fields above.
+    presence: discord.BaseActivity = field(init=False, repr=False, compare=False)
+    # Field text for `/activity list`, formatted once.
+    embed_value: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Frozen: the derived fields are filled in through object.__setattr__.
+        object.__setattr__(self, "presence", _build_presence(self))
+        object.__setattr__(self, "embed_value", _format_embed_value(self))
+
+    @property
+    def duration_seconds(self) -> int:
+        """How long to display this activity, in seconds."""
+        return self.duration_minutes * 60
+
+
+def _format_embed_value(activity: ActivityConfig) -> str:
+    value = (
+        f"**Type:** {activity.activity_type.value.title()}\n"
+        f"**Duration:** {activity.duration_minutes}m\n"
+        f"**Weight:** {activity.weight}"
+    )
+    if activity.state:
+        value += f"\n**State:** {activity.state}"
+    if activity.url:
+        value += f"\n**URL:** {activity.url}"
+    return value
+
+
+def _streaming_presence(activity: ActivityConfig) -> discord.BaseActivity:
+    if activity.url:
+        return discord.Streaming(name=activity.name, url=activity.url)
+    # Fallback to playing if no URL provided
+    return discord.Game(name=activity.name)
+
+
+# ActivityType -> builder for the matching discord.py activity object.
+_PRESENCE_BUILDERS: Dict[ActivityType, Callable[[ActivityConfig], discord.BaseActivity]] = {
+    ActivityType.PLAYING: lambda a: discord.Game(name=a.name),
+    ActivityType.WATCHING: lambda a: discord.Activity(type=discord.ActivityType.watching, name=a.name),
+    ActivityType.LISTENING: lambda a: discord.Activity(type=discord.ActivityType.listening, name=a.name),
+    ActivityType.STREAMING: _streaming_presence,
+    ActivityType.CUSTOM: lambda a: discord.Activity(
+        type=discord.ActivityType.custom,
+        name=a.name,
+        state=a.state or "Ready to assist",
+    ),
+}
+
+
+def _build_presence(activity: ActivityConfig) -> discord.BaseActivity:
+    """Build the discord.py activity object for an ActivityConfig."""
+    return _PRESENCE_BUILDERS[activity.activity_type](activity)
+
+
+# Default rotation for the Guardian Bot; ActivityConfig is treated as
+# immutable, so every ActivityManager starts from these shared instances.
+_DEFAULT_ACTIVITIES: tuple[ActivityConfig, ...] = (
+    # Primary activity - Watching for help command
+    ActivityConfig(
+        name="83ss for /help",
+        activity_type=ActivityType.WATCHING,
+        weight=3,  # Higher weight - more frequent
+        duration_minutes=10
+    ),
+    
+    # Server management activities
+    ActivityConfig(
+        name="the server",
+        activity_type=ActivityType.WATCHING,
+        weight=2,
+        duration_minutes=8
+    ),
+    
+    ActivityConfig(
+        name="for new members",
+        activity_type=ActivityType.WATCHING,
+        weight=2,
+        duration_minutes=6
+    ),
+    
+    # Gaming activities
+    ActivityConfig(
+        name="with the server setup",
+        activity_type=ActivityType.PLAYING,
+        weight=2,
+        duration_minutes=7
+    ),
+    
+    ActivityConfig(
+        name="with roles and permissions",
+        activity_type=ActivityType.PLAYING,
+        weight=1,
+        duration_minutes=5
+    ),
+    
+    ActivityConfig(
+        name="Guardian Bot Simulator",
+        activity_type=ActivityType.PLAYING,
+        weight=1,
+        duration_minutes=5
+    ),
+    
+    # Music/Listening activities
+    ActivityConfig(
+        name="server management tips",
+        activity_type=ActivityType.LISTENING,
+        weight=1,
+        duration_minutes=6
+    ),
+    
+    ActivityConfig(
+        name="the community's feedback",
+        activity_type=ActivityType.LISTENING,
+        weight=2,
+        duration_minutes=8
+    ),
+    
+    # Custom status activities
+    ActivityConfig(
+        name="Guardian Bot",
+        activity_type=ActivityType.CUSTOM,
+        state="Protecting the server",
+        weight=2,
+        duration_minutes=10
+    ),
+    
+    ActivityConfig(
+        name="Guardian Bot",
+        activity_type=ActivityType.CUSTOM,
+        state="Ready to assist",
+        weight=1,
+        duration_minutes=5
+    ),
+    
+    ActivityConfig(
+        name="Guardian Bot",
+        activity_type=ActivityType.CUSTOM,
+        state="Monitoring server health",
+        weight=1,
+        duration_minutes=7
+    ),
+    
+    ActivityConfig(
+        name="Guardian Bot",
+        activity_type=ActivityType.CUSTOM,
+        state="Keeping the server safe",
+        weight=2,
+        duration_minutes=8
+    ),
+)
 
 
 class ActivityManager:
@@ -44,121 +197,59 @@ class ActivityManager:
         self._current_activity_index = 0
         self._task: Optional[asyncio.Task] = None
         self._activities: List[ActivityConfig] = []
+        # Running weight totals, parallel to _activities; see _rebuild_weight_index.
+        self._cum_weights: List[int] = []
+        self._total_weight = 0
+        # name -> configs with that name, in rotation order (names may repeat).
+        self._by_name: Dict[str, List[ActivityConfig]] = {}
         self._is_running = False
+        self._stop_event = asyncio.Event()
+        # Rate limiting runs on the monotonic clock; _last_activity_update is
+        # the wall-clock time of the last change, shown by /health.
+        self._last_update_monotonic = float("-inf")
+        self._last_error_monotonic = float("-inf")
+        self._last_activity_update: Optional[float] = None
         
         # Initialize default activities
         self._setup_default_activities()
     
     def _setup_default_activities(self):
         """Set up default activities for the Guardian Bot."""
-        self._activities = [
-            # Primary activity - Watching for help command
-            ActivityConfig(
-                name="83ss for /help",
-                activity_type=ActivityType.WATCHING,
-                weight=3,  # Higher weight - more frequent
-                duration_minutes=10
-            ),
-            
-            # Server management activities
-            ActivityConfig(
-                name="the server",
-                activity_type=ActivityType.WATCHING,
-                weight=2,
-                duration_minutes=8
-            ),
-            
-            ActivityConfig(
-                name="for new members",
-                activity_type=ActivityType.WATCHING,
-                weight=2,
-                duration_minutes=6
-            ),
-            
-            # Gaming activities
-            ActivityConfig(
-                name="with the server setup",
-                activity_type=ActivityType.PLAYING,
-                weight=2,
-                duration_minutes=7
-            ),
-            
-            ActivityConfig(
-                name="with roles and permissions",
-                activity_type=ActivityType.PLAYING,
-                weight=1,
-                duration_minutes=5
-            ),
-            
-            ActivityConfig(
-                name="Guardian Bot Simulator",
-                activity_type=ActivityType.PLAYING,
-                weight=1,
-                duration_minutes=5
-            ),
-            
-            # Music/Listening activities
-            ActivityConfig(
-                name="server management tips",
-                activity_type=ActivityType.LISTENING,
-                weight=1,
-                duration_minutes=6
-            ),
-            
-            ActivityConfig(
-                name="the community's feedback",
-                activity_type=ActivityType.LISTENING,
-                weight=2,
-                duration_minutes=8
-            ),
-            
-            # Custom status activities
-            ActivityConfig(
-                name="Guardian Bot",
-                activity_type=ActivityType.CUSTOM,
-                state="Protecting the server",
-                weight=2,
-                duration_minutes=10
-            ),
-            
-            ActivityConfig(
-                name="Guardian Bot",
-                activity_type=ActivityType.CUSTOM,
-                state="Ready to assist",
-                weight=1,
-                duration_minutes=5
-            ),
-            
-            ActivityConfig(
-                name="Guardian Bot",
-                activity_type=ActivityType.CUSTOM,
-                state="Monitoring server health",
-                weight=1,
-                duration_minutes=7
-            ),
-            
-            ActivityConfig(
-                name="Guardian Bot",
-                activity_type=ActivityType.CUSTOM,
-                state="Keeping the server safe",
-                weight=2,
-                duration_minutes=8
-            )
-        ]
+        self._activities = list(_DEFAULT_ACTIVITIES)
+        self._by_name = {}
+        for activity in self._activities:
+            self._by_name.setdefault(activity.name, []).append(activity)
+        self._rebuild_weight_index()
+    
+    def _rebuild_weight_index(self):
+        """Recompute the cumulative weights used for weighted selection."""
+        acc = 0
+        cum_weights = []
+        for activity in self._activities:
+            acc += activity.weight
+            cum_weights.append(acc)
+        self._cum_weights = cum_weights
+        self._total_weight = acc
     
     def add_activity(self, activity: ActivityConfig):
         """Add a new activity to the rotation."""
         self._activities.append(activity)
+        self._by_name.setdefault(activity.name, []).append(activity)
+        self._rebuild_weight_index()
         log.info(f"Added activity: {activity.name} ({activity.activity_type.value})")
     
     def remove_activity(self, name: str) -> bool:
-        """Remove an activity by name."""
-        for i, activity in enumerate(self._activities):
-            if activity.name == name:
-                del self._activities[i]
-                log.info(f"Removed activity: {name}")
-                return True
-        return False
+        """Remove an activity by name (the first one, if several share it)."""
+        matches = self._by_name.get(name)
+        if not matches:
+            return False
+        activity = matches.pop(0)
+        if not matches:
+            del self._by_name[name]
+        self._activities.remove(activity)
+        self._rebuild_weight_index()
+        log.info(f"Removed activity: {name}")
+        return True
     
     def get_weighted_random_activity(self) -> ActivityConfig:
         """Get a random activity based on weights."""
@@ -169,20 +260,14 @@ class ActivityManager:
                 activity_type=ActivityType.WATCHING
             )
         
-        # Calculate total weight
-        total_weight = sum(activity.weight for activity in self._activities)
-        
-        # Select random activity based on weight
-        random_weight = random.randint(1, total_weight)
-        current_weight = 0
-        
-        for activity in self._activities:
-            current_weight += activity.weight
-            if random_weight <= current_weight:
-                return activity
+        if self._total_weight <= 0:
+            # Fallback to first activity
+            return self._activities[0]
         
-        # Fallback to first activity
-        return self._activities[0]
+        # Binary-search the running totals for a point in [0, total_weight);
+        # bisect_right skips zero-weight entries sharing a boundary.
+        index = bisect.bisect_right(self._cum_weights, random.random() * self._total_weight)
+        return self._activities[index]
     
     def get_next_activity(self) -> ActivityConfig:
         """Get the next activity in sequence (or random)."""
@@ -197,76 +282,24 @@ class ActivityManager:
     
     async def set_activity(self, activity: ActivityConfig):
         """Set the bot's activity with proper guardrails."""
-        # Validate bot is ready
-        if not self.bot:
-            log.error("Cannot set activity: bot is None")
+        # Rate limiting - don't spam presence updates; checked first so a
+        # skipped update does no other work.
+        time_since_last = time.monotonic() - self._last_update_monotonic
+        if time_since_last < 5:  # Minimum 5 seconds between updates
+            log.debug("Skipping activity update - too soon since last update (%.1fs ago)", time_since_last)
             return
         
-        if not hasattr(self.bot, 'user') or not self.bot.user:
+        # The cycling loop waits for ready before its first update, so this
+        # only trips for calls made before login.
+        if self.bot.user is None:
             log.error("Cannot set activity: bot.user is not available")
             return
         
-        # Wait for bot to be ready if needed
-        if not self.bot.is_ready():
-            try:
-                await self.bot.wait_until_ready()
-            except Exception as e:
-                log.error(f"Failed to wait for bot readiness: {e}")
-                return
-        
-        # Rate limiting - don't spam presence updates
-        if hasattr(self, '_last_activity_update'):
-            time_since_last = time.time() - self._last_activity_update
-            if time_since_last < 5:  # Minimum 5 seconds between updates
-                log.debug(f"Skipping activity update - too soon since last update ({time_since_last:.1f}s ago)")
-                return
-        
         try:
-            if activity.activity_type == ActivityType.PLAYING:
-                await self.bot.change_presence(
-                    activity=discord.Game(name=activity.name)
-                )
-            
-            elif activity.activity_type == ActivityType.WATCHING:
-                await self.bot.change_presence(
-                    activity=discord.Activity(
-                        type=discord.ActivityType.watching,
-                        name=activity.name
-                    )
-                )
-            
-            elif activity.activity_type == ActivityType.LISTENING:
-                await self.bot.change_presence(
-                    activity=discord.Activity(
-                        type=discord.ActivityType.listening,
-                        name=activity.name
-                    )
-                )
-            
-            elif activity.activity_type == ActivityType.STREAMING:
-                if activity.url:
-                    await self.bot.change_presence(
-                        activity=discord.Streaming(
-                            name=activity.name,
-                            url=activity.url
-                        )
-                    )
-                else:
-                    # Fallback to playing if no URL provided
-                    await self.bot.change_presence(
-                        activity=discord.Game(name=activity.name)
-                    )
-            
-            elif activity.activity_type == ActivityType.CUSTOM:
-                await self.bot.change_presence(
-                    activity=discord.Activity(
-                        type=discord.ActivityType.custom,
-                        name=activity.name,
-                        state=activity.state or "Ready to assist"
-                    )
-                )
+            await self.bot.change_presence(activity=activity.presence)
             
             # Update last activity timestamp
+            self._last_update_monotonic = time.monotonic()
             self._last_activity_update = time.time()
             log.info(f"Set activity: {activity.name} ({activity.activity_type.value})")
             
@@ -275,9 +308,10 @@ class ActivityManager:
             log.warning(f"Discord API error setting activity {activity.name}: {e}")
         except Exception as e:
             # Unexpected errors - log once per cycle
-            if not hasattr(self, '_last_activity_error') or time.time() - self._last_activity_error > 60:
+            now = time.monotonic()
+            if now - self._last_error_monotonic > 60:
                 log.error(f"Failed to set activity {activity.name}: {e}")
-                self._last_activity_error = time.time()
+                self._last_error_monotonic = now
             else:
                 log.debug(f"Failed to set activity {activity.name} (error already logged)")
     
@@ -288,6 +322,7 @@ class ActivityManager:
             return
         
         self._is_running = True
+        self._stop_event.clear()
         self._task = asyncio.create_task(self._activity_cycling_loop())
         log.info("Started activity cycling system")
     
@@ -297,17 +332,32 @@ class ActivityManager:
             return
         
         self._is_running = False
+        # Wake the loop out of its wait so it exits on its own.
+        self._stop_event.set()
         if self._task:
-            self._task.cancel()
-            try:
+            if not self.bot.is_ready():
+                # Still parked in wait_until_ready, which the event can't wake.
+                self._task.cancel()
+            with suppress(asyncio.CancelledError):
                 await self._task
-            except asyncio.CancelledError:
-                pass
+            self._task = None
         
         log.info("Stopped activity cycling system")
     
+    async def _wait_for_stop(self, timeout: float) -> bool:
+        """Wait up to ``timeout`` seconds; return True if cycling was stopped."""
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout=timeout)
+        except TimeoutError:
+            return False
+        return True
+    
     async def _activity_cycling_loop(self):
         """Main loop for cycling through activities."""
+        # Started from cog_load, before the gateway connects; presence can
+        # only be changed once the bot is ready.
+        await self.bot.wait_until_ready()
+        
         while self._is_running:
             try:
                 # Get next activity
@@ -317,14 +367,20 @@ class ActivityManager:
                 await self.set_activity(activity)
                 
                 # Wait for the duration
-                await asyncio.sleep(activity.duration_minutes * 60)
+                delay = activity.duration_seconds
                 
-            except asyncio.CancelledError:
-                break
             except Exception as e:
                 log.error(f"Error in activity cycling loop: {e}")
                 # Wait a bit before trying again
-                await asyncio.sleep(30)
+                delay = 30
+            
+            if await self._wait_for_stop(delay):
+                break
+    
+    @property
+    def activities(self) -> Sequence[ActivityConfig]:
+        """The current rotation, read-only; use add/remove_activity to change it."""
+        return self._activities
     
     def get_activity_count(self) -> int:
         """Get the number of configured activities."""
@@ -418,7 +474,7 @@ class ActivityCog(commands.Cog):
     
     async def _list_activities(self, interaction: discord.Interaction):
         """List all configured activities."""
-        activities = self.activity_manager.get_all_activities()
+        activities = self.activity_manager.activities
         
         if not activities:
             await interaction.followup.send("No activities configured.", ephemeral=True)
@@ -431,21 +487,9 @@ class ActivityCog(commands.Cog):
         )
         
         for i, activity in enumerate(activities, 1):
-            activity_type = activity["type"].title()
-            duration = activity["duration_minutes"]
-            weight = activity["weight"]
-            
-            value = f"**Type:** {activity_type}\n**Duration:** {duration}m\n**Weight:** {weight}"
-            
-            if activity["state"]:
-                value += f"\n**State:** {activity['state']}"
-            
-            if activity["url"]:
-                value += f"\n**URL:** {activity['url']}"
-            
             embed.add_field(
-                name=f"{i}. {activity['name']}",
-                value=value,
+                name=f"{i}. {activity.name}",
+                value=activity.embed_value,
                 inline=False
             )
         
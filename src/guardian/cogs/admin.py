@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+from dataclasses import replace
+
 import discord
 from discord import app_commands
 from discord.ext import commands
 
-from ..services.guild_store import GuildConfig
+from ..services.discord_safety import safe_send
 
 
 class AdminCog(commands.Cog):
@@ -19,15 +21,7 @@ class AdminCog(commands.Cog):
         assert interaction.guild is not None
         await interaction.response.defer(ephemeral=True)
         cfg = await self.bot.guild_store.get(interaction.guild.id)  # type: ignore[attr-defined]
-        new_cfg = GuildConfig(
-            guild_id=cfg.guild_id,
-            welcome_channel_id=channel.id,
-            autorole_id=cfg.autorole_id,
-            log_channel_id=cfg.log_channel_id,
-            anti_spam_max_msgs=cfg.anti_spam_max_msgs,
-            anti_spam_window_seconds=cfg.anti_spam_window_seconds,
-            anti_spam_timeout_seconds=cfg.anti_spam_timeout_seconds,
-        )
+        new_cfg = replace(cfg, welcome_channel_id=channel.id)
         await self.bot.guild_store.upsert(new_cfg)  # type: ignore[attr-defined]
         await interaction.followup.send(f"Welcome channel set to {channel.mention}", ephemeral=True)
 
@@ -39,15 +33,7 @@ class AdminCog(commands.Cog):
         assert interaction.guild is not None
         await interaction.response.defer(ephemeral=True)
         cfg = await self.bot.guild_store.get(interaction.guild.id)  # type: ignore[attr-defined]
-        new_cfg = GuildConfig(
-            guild_id=cfg.guild_id,
-            welcome_channel_id=cfg.welcome_channel_id,
-            autorole_id=role.id,
-            log_channel_id=cfg.log_channel_id,
-            anti_spam_max_msgs=cfg.anti_spam_max_msgs,
-            anti_spam_window_seconds=cfg.anti_spam_window_seconds,
-            anti_spam_timeout_seconds=cfg.anti_spam_timeout_seconds,
-        )
+        new_cfg = replace(cfg, autorole_id=role.id)
         await self.bot.guild_store.upsert(new_cfg)  # type: ignore[attr-defined]
         await interaction.followup.send(f"Autorole set to {role.mention}", ephemeral=True)
 
@@ -59,15 +45,7 @@ class AdminCog(commands.Cog):
         assert interaction.guild is not None
         await interaction.response.defer(ephemeral=True)
         cfg = await self.bot.guild_store.get(interaction.guild.id)  # type: ignore[attr-defined]
-        new_cfg = GuildConfig(
-            guild_id=cfg.guild_id,
-            welcome_channel_id=cfg.welcome_channel_id,
-            autorole_id=cfg.autorole_id,
-            log_channel_id=channel.id,
-            anti_spam_max_msgs=cfg.anti_spam_max_msgs,
-            anti_spam_window_seconds=cfg.anti_spam_window_seconds,
-            anti_spam_timeout_seconds=cfg.anti_spam_timeout_seconds,
-        )
+        new_cfg = replace(cfg, log_channel_id=channel.id)
         await self.bot.guild_store.upsert(new_cfg)  # type: ignore[attr-defined]
         await interaction.followup.send(f"Log channel set to {channel.mention}", ephemeral=True)
 
@@ -85,11 +63,8 @@ class AdminCog(commands.Cog):
         assert interaction.guild is not None
         await interaction.response.defer(ephemeral=True)
         cfg = await self.bot.guild_store.get(interaction.guild.id)  # type: ignore[attr-defined]
-        new_cfg = GuildConfig(
-            guild_id=cfg.guild_id,
-            welcome_channel_id=cfg.welcome_channel_id,
-            autorole_id=cfg.autorole_id,
-            log_channel_id=cfg.log_channel_id,
+        new_cfg = replace(
+            cfg,
             anti_spam_max_msgs=int(max_messages),
             anti_spam_window_seconds=int(window_seconds),
             anti_spam_timeout_seconds=int(timeout_seconds),
@@ -120,9 +95,6 @@ class AdminCog(commands.Cog):
     @queue_status.error
     async def _on_app_command_error(self, interaction: discord.Interaction, error: app_commands.AppCommandError) -> None:
         if isinstance(error, app_commands.MissingPermissions):
-            if interaction.response.is_done():
-                await interaction.followup.send("Missing permissions.", ephemeral=True)
-            else:
-                await interaction.response.send_message("Missing permissions.", ephemeral=True)
+            await safe_send(interaction, "Missing permissions.")
             return
         raise error
@@ -4,7 +4,6 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 import discord.ui
-import datetime
 
 from ..security.auth import is_bot_owner
 from ..utils import safe_embed
@@ -16,6 +15,82 @@ class AdminManagementCog(commands.Cog):
     
     def __init__(self, bot: commands.Bot) -> None:
         self.bot = bot  # type: ignore[assignment]
+        # guild_id -> Admin role id, and (guild_id, name) -> channel id.
+        # Filled lazily on first lookup; stale entries are dropped by the
+        # role/channel listeners below.
+        self._admin_role_cache: dict[int, int] = {}
+        self._named_channel_cache: dict[tuple[int, str], int] = {}
+        # guild_id -> position of the bot's top role; dropped whenever the
+        # bot's roles or the guild's role order may have changed.
+        self._bot_top_pos_cache: dict[int, int] = {}
+    
+    def _find_admin_role(self, guild: discord.Guild) -> discord.Role | None:
+        """Return the guild's Admin role, scanning roles only on a cache miss."""
+        role_id = self._admin_role_cache.get(guild.id)
+        if role_id is not None:
+            role = guild.get_role(role_id)
+            if role is not None:
+                return role
+            self._admin_role_cache.pop(guild.id, None)
+        
+        role = find_role(guild, "Admin")
+        if role is not None:
+            self._admin_role_cache[guild.id] = role.id
+        return role
+    
+    def _find_named_channel(self, guild: discord.Guild, name: str) -> discord.TextChannel | None:
+        """Return a well-known text channel by name, scanning only on a cache miss."""
+        key = (guild.id, name)
+        channel_id = self._named_channel_cache.get(key)
+        if channel_id is not None:
+            channel = guild.get_channel(channel_id)
+            if isinstance(channel, discord.TextChannel):
+                return channel
+            self._named_channel_cache.pop(key, None)
+        
+        channel = find_text_channel(guild, name)
+        if channel is not None:
+            self._named_channel_cache[key] = channel.id
+        return channel
+    
+    def _forget_channel(self, channel: discord.abc.GuildChannel) -> None:
+        for key in [k for k, v in self._named_channel_cache.items() if v == channel.id]:
+            del self._named_channel_cache[key]
+    
+    @commands.Cog.listener()
+    async def on_guild_role_create(self, role: discord.Role) -> None:
+        self._bot_top_pos_cache.pop(role.guild.id, None)
+    
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role) -> None:
+        self._bot_top_pos_cache.pop(role.guild.id, None)
+        if self._admin_role_cache.get(role.guild.id) == role.id:
+            del self._admin_role_cache[role.guild.id]
+    
+    @commands.Cog.listener()
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role) -> None:
+        if before.position != after.position:
+            self._bot_top_pos_cache.pop(after.guild.id, None)
+        # A rename can make another role the better "Admin" match, so drop
+        # the guild's entry and let the next lookup rescan.
+        if before.name != after.name:
+            self._admin_role_cache.pop(after.guild.id, None)
+    
+    @commands.Cog.listener()
+    async def on_member_update(self, before: discord.Member, after: discord.Member) -> None:
+        if self.bot.user is not None and after.id == self.bot.user.id:
+            self._bot_top_pos_cache.pop(after.guild.id, None)
+    
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel) -> None:
+        self._forget_channel(channel)
+    
+    @commands.Cog.listener()
+    async def on_guild_channel_update(
+        self, before: discord.abc.GuildChannel, after: discord.abc.GuildChannel
+    ) -> None:
+        if before.name != after.name:
+            self._forget_channel(after)
     
     async def _check_bot_owner(self, interaction: discord.Interaction) -> bool:
         """Check if user is bot owner or team member."""
@@ -30,7 +105,7 @@ class AdminManagementCog(commands.Cog):
     async def _get_or_create_admin_role(self, guild: discord.Guild) -> discord.Role:
         """Get or create the Admin role with proper permissions."""
         # Try to find existing Admin role
-        admin_role = find_role(guild, "Admin")
+        admin_role = self._find_admin_role(guild)
         
         if admin_role is None:
             # Create Admin role with administrator permissions
@@ -40,18 +115,23 @@ class AdminManagementCog(commands.Cog):
                 reason="Created by bot owner command",
                 color=discord.Color.orange()
             )
+            self._admin_role_cache[guild.id] = admin_role.id
+            # The new role shifts positions before the gateway event lands.
+            self._bot_top_pos_cache.pop(guild.id, None)
         
         return admin_role
     
     async def _check_role_hierarchy(self, guild: discord.Guild, target_role: discord.Role) -> bool:
         """Check if bot can manage the target role."""
-        bot_member = guild.me or guild.get_member(self.bot.user.id)  # type: ignore[attr-defined]
-        if not bot_member:
-            return False
+        top_pos = self._bot_top_pos_cache.get(guild.id)
+        if top_pos is None:
+            bot_member = guild.me
+            if not bot_member:
+                return False
+            top_pos = self._bot_top_pos_cache[guild.id] = bot_member.top_role.position
         
         # Bot's highest role must be higher than target role
-        bot_top_role = bot_member.top_role
-        return bot_top_role.position > target_role.position
+        return top_pos > target_role.position
     
     async def _log_admin_action(
         self, 
@@ -69,7 +149,7 @@ class AdminManagementCog(commands.Cog):
         )
         
         # Try to log to mod-logs channel
-        mod_logs_channel = find_text_channel(guild, "mod-logs")
+        mod_logs_channel = self._find_named_channel(guild, "mod-logs")
         if mod_logs_channel:
             embed = safe_embed(
                 title=f"🔐 Admin {action.title()}",
@@ -77,7 +157,7 @@ class AdminManagementCog(commands.Cog):
             )
             embed.add_field(name="Target User", value=f"{target_user.mention} ({target_user.id})", inline=False)
             embed.add_field(name="Performed By", value=f"{performed_by.mention} ({performed_by.id})", inline=False)
-            embed.add_field(name="Timestamp", value=datetime.datetime.utcnow().isoformat(), inline=False)
+            embed.add_field(name="Timestamp", value=discord.utils.utcnow().isoformat(timespec="seconds"), inline=False)
             embed.set_footer(text="Bot Owner Action")
             
             try:
@@ -228,7 +308,7 @@ class AdminManagementCog(commands.Cog):
         
         try:
             # Find Admin role
-            admin_role = discord.utils.get(interaction.guild.roles, name="Admin")
+            admin_role = self._find_admin_role(interaction.guild)
             
             if not admin_role:
                 await interaction.followup.send(
@@ -3,11 +3,12 @@ from __future__ import annotations
 import asyncio
 import logging
 import random
+from contextlib import suppress
 
 import discord
 from discord.ext import commands
 
-from ..utils import find_text_channel_fuzzy
+from ..lookup import find_text_channel
 
 log = logging.getLogger("guardian.bump_reminder")
 
@@ -23,6 +24,22 @@ class BumpReminderCog(commands.Cog):
         self.bot = bot
         self._task: asyncio.Task | None = None
         self._ready_once = False
+        self._empty_cache_logged: set[int] = set()
+        self._rng = random.Random()
+        # Settings are frozen for the life of the process; read them once.
+        settings = getattr(bot, "settings", None)
+        min_m = int(getattr(settings, "bump_reminder_min_minutes", 20))
+        max_m = int(getattr(settings, "bump_reminder_max_minutes", 120))
+        if max_m < min_m:
+            min_m, max_m = max_m, min_m
+        self._min_delay = min_m * 60
+        self._max_delay = max_m * 60
+        self._channel_name: str = getattr(settings, "bump_reminder_channel_name", "general-chat")
+        self._base_message: str = getattr(
+            settings,
+            "bump_reminder_message",
+            "Hey! Don't forget to use '!d Bump' to help the server grow!",
+        )
 
     @commands.Cog.listener()
     async def on_ready(self) -> None:
@@ -48,53 +65,43 @@ class BumpReminderCog(commands.Cog):
             except Exception as exc:  # noqa: BLE001
                 log.exception("Bump reminder tick failed: %s", exc)
 
-            settings = getattr(self.bot, "settings", None)
-            min_m = int(getattr(settings, "bump_reminder_min_minutes", 20))
-            max_m = int(getattr(settings, "bump_reminder_max_minutes", 120))
-            if max_m < min_m:
-                min_m, max_m = max_m, min_m
-            delay = random.randint(min_m * 60, max_m * 60)
+            delay = self._min_delay + self._rng.random() * (self._max_delay - self._min_delay)
             await asyncio.sleep(delay)
 
     async def _tick_all_guilds(self) -> None:
-        settings = getattr(self.bot, "settings", None)
-        channel_name = getattr(settings, "bump_reminder_channel_name", "general-chat")
-        base_message = getattr(
-            settings,
-            "bump_reminder_message",
-            "Hey! Don't forget to use '!d Bump' to help the server grow!",
+        # Each guild posts to its own channel (and rate-limit bucket), so the
+        # sends can run concurrently.
+        guilds = tuple(self.bot.guilds)
+        results = await asyncio.gather(
+            *(self._tick_one_guild(g) for g in guilds), return_exceptions=True
         )
+        for guild, result in zip(guilds, results, strict=True):
+            if isinstance(result, Exception):
+                log.error("Bump reminder failed for guild %s", guild.id, exc_info=result)
 
-        for guild in list(self.bot.guilds):
-            try:
-                ch = find_text_channel_fuzzy(guild, channel_name)
-                if not isinstance(ch, discord.TextChannel):
-                    continue
+    async def _tick_one_guild(self, guild: discord.Guild) -> None:
+        ch = find_text_channel(guild, self._channel_name)
+        if not isinstance(ch, discord.TextChannel):
+            return
 
-                member = await self._pick_random_member(guild)
-                if not member:
-                    continue
+        member = await self._pick_random_member(guild)
+        if not member:
+            return
 
-                msg = f"{member.mention} {base_message}".strip()
-                await ch.send(msg)
-            except discord.Forbidden:
-                continue
-            except discord.HTTPException:
-                continue
+        msg = f"{member.mention} {self._base_message}".strip()
+        with suppress(discord.HTTPException):
+            await ch.send(msg)
 
     async def _pick_random_member(self, guild: discord.Guild) -> discord.Member | None:
-        # Prefer cached members when available, otherwise fetch.
-        members = [m for m in guild.members if not m.bot]
-        if not members:
-            try:
-                members = [m async for m in guild.fetch_members(limit=None) if not m.bot]
-            except discord.Forbidden:
-                return None
-            except discord.HTTPException:
-                return None
-        if not members:
+        # Pick from the member cache only; never page the full member list
+        # just to ping one person.
+        humans = [m for m in guild.members if not m.bot]
+        if not humans:
+            if guild.id not in self._empty_cache_logged:
+                self._empty_cache_logged.add(guild.id)
+                log.info("No cached non-bot members for guild %s; skipping bump reminder", guild.id)
             return None
-        return random.choice(members)
+        return self._rng.choice(humans)
 
 
 async def setup(bot: commands.Bot) -> None:
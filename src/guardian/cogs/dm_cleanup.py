@@ -10,6 +10,9 @@ from discord.ext import commands
 from ..utils import safe_embed, success_embed, error_embed, warning_embed
 from ..constants import COLORS
 
+# Deletes in flight at once per DM channel; discord.py paces the route bucket.
+_DELETE_CONCURRENCY = 5
+
 
 class DMCleanupCog(commands.Cog):
     """Cog for cleaning up bot messages in direct messages."""
@@ -78,43 +81,24 @@ class DMCleanupCog(commands.Cog):
     
     async def _cleanup_dm_messages(self, dm_channel: discord.DMChannel) -> int:
         """Systematically delete all bot messages in the DM channel."""
-        deleted_count = 0
+        # Collect first (up to 1000 messages to be thorough) so deletes don't
+        # race the history paginator. Forbidden/HTTPException while fetching
+        # history propagate to the caller.
+        messages = [m async for m in dm_channel.history(limit=1000) if m.author == self.bot.user]
+        # DMs have no bulk-delete endpoint, so overlap single deletes instead.
+        semaphore = asyncio.Semaphore(_DELETE_CONCURRENCY)
         
-        try:
-            # Get message history (up to 1000 messages to be thorough)
-            async for message in dm_channel.history(limit=1000):
-                # Check if message is from bot
-                if message.author == self.bot.user:
-                    try:
-                        await message.delete()
-                        deleted_count += 1
-                        # Add small delay to avoid rate limits
-                        await asyncio.sleep(0.1)
-                    except discord.NotFound:
-                        # Message already deleted
-                        continue
-                    except discord.Forbidden:
-                        # Cannot delete this specific message
-                        continue
-                    except discord.HTTPException:
-                        # Rate limited or other API error
-                        await asyncio.sleep(1)
-                        continue
-                    except Exception:
-                        # Unexpected error with this message
-                        continue
-                        
-        except discord.Forbidden:
-            # Cannot access message history
-            raise
-        except discord.HTTPException:
-            # API error fetching history
-            raise
-        except Exception:
-            # Unexpected error
-            raise
+        async def _delete(message: discord.Message) -> int:
+            async with semaphore:
+                try:
+                    await message.delete()
+                    return 1
+                except discord.HTTPException:
+                    # Already deleted (NotFound), not deletable (Forbidden) or an
+                    # API error; discord.py has already waited out any 429s.
+                    return 0
         
-        return deleted_count
+        return sum(await asyncio.gather(*(_delete(m) for m in messages)))
     
     @app_commands.command(
         name="dm_cleanup_bulk",
@@ -5,6 +5,7 @@ from discord import app_commands
 from discord.ext import commands
 import logging
 import time
+from functools import lru_cache
 from typing import Optional
 
 from ..permissions import require_verified, validate_command_permissions, list_commands_by_tier
@@ -12,6 +13,18 @@ from ..permissions import require_verified, validate_command_permissions, list_c
 log = logging.getLogger("guardian.health_check")
 
 
+@lru_cache(maxsize=64)
+def _format_duration(total_minutes: int) -> str:
+    """Format minutes as ``"1d 2h 3m"``, dropping leading zero units."""
+    hours, minutes = divmod(total_minutes, 60)
+    days, hours = divmod(hours, 24)
+    parts = []
+    for value, unit in ((days, "d"), (hours, "h"), (minutes, "m")):
+        if parts or value or unit == "m":
+            parts.append(f"{value}{unit}")
+    return " ".join(parts)
+
+
 class HealthCheckCog(commands.Cog):
     """Health check and diagnostics cog."""
     
@@ -52,9 +65,9 @@ class HealthCheckCog(commands.Cog):
             activity_cog = self.bot.get_cog('ActivityCog')
             if activity_cog and hasattr(activity_cog, 'activity_manager'):
                 activity_status = "✅ Available"
-                if hasattr(activity_cog.activity_manager, '_last_activity_update'):
-                    last_activity_time = time.strftime('%Y-%m-%d %H:%M:%S', 
-                                                time.localtime(activity_cog.activity_manager._last_activity_update))
+                last_update = getattr(activity_cog.activity_manager, '_last_activity_update', None)
+                if last_update is not None:
+                    last_activity_time = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(last_update))
             
             # Check critical cogs
             critical_cogs = {
@@ -180,17 +193,7 @@ class HealthCheckCog(commands.Cog):
     def _get_uptime(self) -> str:
         """Get formatted bot uptime."""
         if hasattr(self.bot, 'launch_time'):
-            uptime = time.time() - self.bot.launch_time
-            days = int(uptime // 86400)
-            hours = int((uptime % 86400) // 3600)
-            minutes = int((uptime % 3600) // 60)
-            
-            if days > 0:
-                return f"{days}d {hours}h {minutes}m"
-            elif hours > 0:
-                return f"{hours}h {minutes}m"
-            else:
-                return f"{minutes}m"
+            return _format_duration(int(time.time() - self.bot.launch_time) // 60)
         else:
             return "Unknown"
     
@@ -3,19 +3,33 @@ from __future__ import annotations
 import json
 import random
 import time
+from contextlib import suppress
+
 import discord
 from discord import app_commands
 from discord.ext import commands
 
 from ..services.levels_config_store import LevelsConfig
 from ..services.levels_store import LevelsStore
+from ..services.cache import TTLCache
 from ..permissions import require_verified
 
+# Reply for leaderboards with no rows yet.
+_NO_DATA = "No data yet."
+
+# How often expired XP cooldown entries are swept out of memory.
+_COOLDOWN_PRUNE_INTERVAL_SECONDS = 600
+
 
 class LevelsCog(commands.Cog):
     def __init__(self, bot: commands.Bot) -> None:
         self.bot = bot  # type: ignore[assignment]
-        self._cooldowns: dict[tuple[int, int], float] = {}
+        # (guild_id, user_id) present = still cooling down. Entries expire with
+        # the guild's cooldown and are pruned periodically so members who stop
+        # chatting don't stay in memory for the life of the process.
+        self._cooldowns: TTLCache[tuple[int, int], bool] = TTLCache(default_ttl_seconds=60)
+        self._next_cooldown_prune = 0.0
+        self._rng = random.Random()
 
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
@@ -25,6 +39,12 @@ class LevelsCog(commands.Cog):
         if len(content) < 5:
             return
 
+        # Members still cooling down are the common case on a busy channel;
+        # reject them from memory before touching the config store.
+        key = (message.guild.id, message.author.id)
+        if self._cooldowns.get(key):
+            return
+
         cfg = await self.bot.levels_config_store.get(message.guild.id)  # type: ignore[attr-defined]
         if not cfg.enabled:
             return
@@ -36,18 +56,17 @@ class LevelsCog(commands.Cog):
         if message.channel.id in ignored:
             return
 
-        key = (message.guild.id, message.author.id)
+        self._cooldowns.set(key, True, ttl_seconds=max(5, cfg.cooldown_seconds))
         now = time.time()
-        last = self._cooldowns.get(key, 0.0)
-        if now - last < max(5, cfg.cooldown_seconds):
-            return
-        self._cooldowns[key] = now
+        if now >= self._next_cooldown_prune:
+            self._cooldowns.prune()
+            self._next_cooldown_prune = now + _COOLDOWN_PRUNE_INTERVAL_SECONDS
 
         earned_today = await self.bot.levels_ledger_store.get_for_today(message.guild.id, message.author.id)  # type: ignore[attr-defined]
         if earned_today >= cfg.daily_cap:
             return
 
-        xp_gain = random.randint(cfg.xp_min, cfg.xp_max)
+        xp_gain = self._rng.randint(cfg.xp_min, cfg.xp_max)
         xp_gain = min(xp_gain, max(0, cfg.daily_cap - earned_today))
         if xp_gain <= 0:
             return
@@ -60,15 +79,11 @@ class LevelsCog(commands.Cog):
             for rid in role_ids:
                 role = message.guild.get_role(rid)
                 if role:
-                    try:
+                    with suppress(discord.HTTPException):
                         await message.author.add_roles(role, reason="Level reward (833's Guardian)")
-                    except discord.HTTPException:
-                        pass
             if cfg.announce:
-                try:
+                with suppress(discord.HTTPException):
                     await message.channel.send(f"🎉 {message.author.mention} reached **level {level}**!")
-                except discord.HTTPException:
-                    pass
 
     @app_commands.command(name="rank", description="Show a member's level and XP.")
     @require_verified()
@@ -89,11 +104,12 @@ class LevelsCog(commands.Cog):
         await interaction.response.defer(ephemeral=True)
         rows = await self.bot.levels_store.leaderboard(interaction.guild.id, int(limit))  # type: ignore[attr-defined]
         if not rows:
-            await interaction.followup.send("No data yet.", ephemeral=True)
+            await interaction.followup.send(_NO_DATA, ephemeral=True)
             return
+        get_member = interaction.guild.get_member
         lines = []
         for i, (uid, lvl, txp) in enumerate(rows, start=1):
-            m = interaction.guild.get_member(uid)
+            m = get_member(uid)
             name = m.display_name if m else str(uid)
             lines.append(f"**{i}.** {name} — L{lvl} • {txp} XP")
         await interaction.followup.send("🏆 **Leaderboard**\n" + "\n".join(lines), ephemeral=True)
@@ -104,11 +120,12 @@ class LevelsCog(commands.Cog):
         await interaction.response.defer(ephemeral=True)
         rows = await self.bot.levels_ledger_store.top_week(interaction.guild.id, int(limit))  # type: ignore[attr-defined]
         if not rows:
-            await interaction.followup.send("No data yet.", ephemeral=True)
+            await interaction.followup.send(_NO_DATA, ephemeral=True)
             return
+        get_member = interaction.guild.get_member
         lines = []
         for i, (uid, total) in enumerate(rows, start=1):
-            m = interaction.guild.get_member(uid)
+            m = get_member(uid)
             name = m.display_name if m else str(uid)
             lines.append(f"**{i}.** {name} — {total} XP")
         await interaction.followup.send("📅 **Weekly XP**\n" + "\n".join(lines), ephemeral=True)
@@ -2,11 +2,13 @@ from __future__ import annotations
 
 import difflib
 import random
+from contextlib import suppress
 from typing import Optional
 
 import discord
 from discord.ext import commands
 
+from ..services.server_config_store import ServerConfig
 
 class PrefixCommunityCog(commands.Cog):
     """Non-moderation prefix commands gated by verification and level.
@@ -18,34 +20,26 @@ class PrefixCommunityCog(commands.Cog):
 
     def __init__(self, bot: commands.Bot) -> None:
         self.bot = bot  # type: ignore[assignment]
-        self._vibes: list[str] = [
-            "Drop one win from today.",
-            "What are you building right now?",
-            "Share a song you have on repeat.",
-            "If you could add one channel to 833s, what would it be?",
-            "Rate today 1-10 and why.",
-        ]
-
         self._help_catalog: dict[str, dict[str, object]] = {
             "profile": {"category": "Profile", "syntax": "!profile [@member]", "desc": "Show a public community profile.", "min_level": 0, "verified": True},
             "rank": {"category": "Community", "syntax": "!rank [@member]", "desc": "Show level, XP, reputation, and title.", "min_level": 0, "verified": True},
             "thanks": {"category": "Community", "syntax": "!thanks @member [reason]", "desc": "Give +1 reputation (cooldown).", "min_level": 1, "verified": True},
         }
 
-    async def _is_verified(self, guild: discord.Guild, member: discord.Member) -> bool:
-        cfg = await self.bot.server_config_store.get(guild.id)  # type: ignore[attr-defined]
+    @staticmethod
+    def _is_verified(cfg: ServerConfig, member: discord.Member) -> bool:
         role_id = cfg.autorole_id
         if not role_id:
             return True
 
-        return any(r.id == role_id for r in member.roles)
+        return member.get_role(role_id) is not None
 
     async def _level(self, guild_id: int, user_id: int) -> int:
         _, _, lvl = await self.bot.levels_store.get(guild_id, user_id)  # type: ignore[attr-defined]
         return int(lvl)
 
-    async def _channel_allowed(self, guild: discord.Guild, channel_id: int) -> bool:
-        cfg = await self.bot.server_config_store.get(guild.id)  # type: ignore[attr-defined]
+    @staticmethod
+    def _channel_allowed(cfg: ServerConfig, channel_id: int) -> bool:
         # If configured, only allow in bot commands channel.
         if cfg.bot_commands_channel_id:
             return int(channel_id) == int(cfg.bot_commands_channel_id)
@@ -60,28 +54,24 @@ class PrefixCommunityCog(commands.Cog):
     ) -> bool:
         if not ctx.guild or not isinstance(ctx.author, discord.Member):
             return False
-        if not await self._channel_allowed(ctx.guild, ctx.channel.id):  # type: ignore[union-attr]
-            try:
+        # Both gates read the same row; fetch it once per command.
+        cfg = await self.bot.server_config_store.get(ctx.guild.id)  # type: ignore[attr-defined]
+        if not self._channel_allowed(cfg, ctx.channel.id):  # type: ignore[union-attr]
+            with suppress(discord.HTTPException):
                 await ctx.reply("Use this in the bot commands channel.")
-            except Exception:
-                pass
             return False
 
         if requires_verified:
-            ok = await self._is_verified(ctx.guild, ctx.author)
+            ok = self._is_verified(cfg, ctx.author)
             if not ok:
-                try:
+                with suppress(discord.HTTPException):
                     await ctx.reply("You must be verified to use this command.")
-                except Exception:
-                    pass
                 return False
 
         lvl = await self._level(ctx.guild.id, ctx.author.id)
         if lvl < min_level:
-            try:
+            with suppress(discord.HTTPException):
                 await ctx.reply(f"Requires level {min_level} (you are level {lvl}).")
-            except Exception:
-                pass
             return False
         return True
 
@@ -95,11 +85,12 @@ class PrefixCommunityCog(commands.Cog):
         if not ctx.guild or not isinstance(ctx.author, discord.Member):
             return (False, "This command can only be used in a server.")
 
-        if not await self._channel_allowed(ctx.guild, ctx.channel.id):  # type: ignore[union-attr]
+        cfg = await self.bot.server_config_store.get(ctx.guild.id)  # type: ignore[attr-defined]
+        if not self._channel_allowed(cfg, ctx.channel.id):  # type: ignore[union-attr]
             return (False, "Use this in the bot commands channel.")
 
         if requires_verified:
-            ok = await self._is_verified(ctx.guild, ctx.author)
+            ok = self._is_verified(cfg, ctx.author)
             if not ok:
                 return (False, "You must be verified to use this command.")
 
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+
 import discord
 from discord import app_commands, ui
 from discord.ext import commands
@@ -8,6 +10,7 @@ import re
 
 from ..services.reaction_roles_store_new import ReactionRolesStore
 from ..services.panel_store import PanelStore
+from ..services.discord_safety import safe_send
 from ..security.permissions import admin_command
 from ..utils import info_embed, error_embed, success_embed
 
@@ -44,15 +47,16 @@ def find_text_channel_fuzzy(guild: discord.Guild, target: str) -> discord.TextCh
 class ReactionRolesManagerView(ui.View):
     """Admin management view following Discord.py best practices."""
     
-    def __init__(self, cog: 'ReactionRolesCog', author: discord.User):
+    def __init__(self, cog: 'ReactionRolesCog', author_id: int):
         super().__init__(timeout=300)  # 5 minutes timeout
         self.cog = cog
-        self.author = author
+        # Only the id is needed; don't pin the User object for the view's lifetime.
+        self.author_id = author_id
         self.message = None
 
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
         """Ensure only the command author can interact."""
-        if interaction.user.id != self.author.id:
+        if interaction.user.id != self.author_id:
             await interaction.response.send_message(
                 "You cannot interact with this management panel.", 
                 ephemeral=True
@@ -62,34 +66,8 @@ class ReactionRolesManagerView(ui.View):
 
     async def on_error(self, interaction: discord.Interaction, error: Exception, item: ui.Item) -> None:
         """Handle view errors gracefully."""
-        log.error(f"ReactionRolesManagerView error: {error}", exc_info=True)
-        try:
-            if interaction.response.is_done():
-                await interaction.followup.send(
-                    "❌ An error occurred. Please try again.", 
-                    ephemeral=True
-                )
-            else:
-                await interaction.response.send_message(
-                    "❌ An error occurred. Please try again.", 
-                    ephemeral=True
-                )
-        except discord.Forbidden:
-            await interaction.followup.send(
-                "❌ I don't have permission to manage your roles.", 
-                ephemeral=True
-                )
-        except discord.HTTPException:
-            await interaction.followup.send(
-                "❌ Discord API error. Please try again.", 
-                ephemeral=True
-                )
-        except Exception as e:
-            log.error(f"ReactionRolesManagerView error callback: {e}", exc_info=True)
-            await interaction.followup.send(
-                "❌ Failed to handle error.", 
-                ephemeral=True
-                )
+        log.error("ReactionRolesManagerView error: %s", error, exc_info=error)
+        await safe_send(interaction, "❌ An error occurred. Please try again.")
 
     async def on_timeout(self) -> None:
         """Handle view timeout by disabling all components."""
@@ -238,7 +216,7 @@ class ReactionRolesManagerView(ui.View):
                         ephemeral=True
                         )
                 except Exception as e:
-                    log.error(f"Add roles confirm error: {e}", exc_info=True)
+                    log.exception("Add roles confirm error: %s", e)
                     await confirm_interaction.followup.send(
                         "❌ Operation failed. Please try again.", 
                         ephemeral=True
@@ -269,7 +247,7 @@ class ReactionRolesManagerView(ui.View):
                 ephemeral=True
                 )
         except Exception as e:
-            log.error(f"Add roles error: {e}", exc_info=True)
+            log.exception("Add roles error: %s", e)
             await interaction.followup.send(
                 "❌ Failed to open role selection.", 
                 ephemeral=True
@@ -350,7 +328,7 @@ class ReactionRolesManagerView(ui.View):
                         ephemeral=True
                         )
                 except Exception as e:
-                    log.error(f"Remove roles confirm error: {e}", exc_info=True)
+                    log.exception("Remove roles confirm error: %s", e)
                     await confirm_interaction.followup.send(
                         "❌ Operation failed. Please try again.", 
                         ephemeral=True
@@ -380,7 +358,7 @@ class ReactionRolesManagerView(ui.View):
                 ephemeral=True
                 )
         except Exception as e:
-            log.error(f"Remove roles error: {e}", exc_info=True)
+            log.exception("Remove roles error: %s", e)
             await interaction.followup.send(
                 "❌ Failed to open role removal.", 
                 ephemeral=True
@@ -404,7 +382,7 @@ class ReactionRolesManagerView(ui.View):
                 ephemeral=True
                 )
         except Exception as e:
-            log.error(f"Publish panel error: {e}", exc_info=True)
+            log.exception("Publish panel error: %s", e)
             await interaction.followup.send(
                 "❌ Failed to publish panel.", 
                 ephemeral=True
@@ -431,7 +409,7 @@ class ReactionRolesManagerView(ui.View):
                 ephemeral=True
                 )
         except Exception as e:
-            log.error(f"Close panel error: {e}", exc_info=True)
+            log.exception("Close panel error: %s", e)
             await interaction.followup.send(
                 "❌ Failed to close panel.", 
                 ephemeral=True
@@ -452,34 +430,8 @@ class ReactionRolesMemberView(ui.View):
 
     async def on_error(self, interaction: discord.Interaction, error: Exception, item: ui.Item) -> None:
         """Handle member view errors gracefully."""
-        log.error(f"ReactionRolesMemberView error: {error}", exc_info=True)
-        try:
-            if interaction.response.is_done():
-                await interaction.followup.send(
-                    "❌ Failed to update roles. Please try again.", 
-                    ephemeral=True
-                )
-            else:
-                await interaction.response.send_message(
-                    "❌ Failed to update roles. Please try again.", 
-                    ephemeral=True
-                )
-        except discord.Forbidden:
-            await interaction.followup.send(
-                "❌ I don't have permission to manage your roles.", 
-                ephemeral=True
-                )
-        except discord.HTTPException:
-            await interaction.followup.send(
-                "❌ Discord API error. Please try again.", 
-                ephemeral=True
-                )
-        except Exception as e:
-            log.error(f"Member role selection error: {e}", exc_info=True)
-            await interaction.followup.send(
-                "❌ Failed to update roles. Please try again.", 
-                ephemeral=True
-                )
+        log.error("ReactionRolesMemberView error: %s", error, exc_info=error)
+        await safe_send(interaction, "❌ Failed to update roles. Please try again.")
 
     def build_select_menus(self, guild: discord.Guild, all_roles: dict[str, list[int]]) -> bool:
         """Build select menus for role groups. Returns False if any group exceeds 25 roles."""
@@ -528,15 +480,15 @@ class ReactionRolesMemberView(ui.View):
                         return
 
                     member = interaction.user
-                    selected_role_ids = [int(rid) for rid in interaction.data['values']]
+                    selected_role_ids = {int(rid) for rid in interaction.data['values']}
                     
                     # Get current roles in this group
                     current_role_ids = {role.id for role in member.roles}
                     group_role_ids = set(role_ids)
                     
                     # Determine roles to add and remove
-                    roles_to_add = [rid for rid in selected_role_ids if rid not in current_role_ids]
-                    roles_to_remove = [rid for rid in group_role_ids if rid in current_role_ids and rid not in selected_role_ids]
+                    roles_to_add = selected_role_ids - current_role_ids
+                    roles_to_remove = (group_role_ids & current_role_ids) - selected_role_ids
                     
                     # Apply role changes
                     if roles_to_remove:
@@ -570,7 +522,7 @@ class ReactionRolesMemberView(ui.View):
                         ephemeral=True
                     )
                 except Exception as e:
-                    log.error(f"Member role selection error: {e}", exc_info=True)
+                    log.exception("Member role selection error: %s", e)
                     await interaction.followup.send(
                         "❌ Failed to update roles. Please try again.", 
                         ephemeral=True
@@ -589,16 +541,19 @@ class ReactionRolesCog(commands.Cog):
         self.bot = bot
         self.store = None
         self.panel_store = None
+        # Settings are frozen for the life of the process; read them once.
+        self._panel_key: str = getattr(bot.settings, "reaction_roles_panel_key", "reaction_roles_panel")
+        self._channel_name: str = getattr(bot.settings, "reaction_roles_channel_name", REACTION_ROLES_CHANNEL)
 
     async def cog_load(self):
         """Initialize stores and register persistent views."""
         # NOTE: This cog must never fail during load.
         # Any exception here prevents the cog (and its slash commands) from registering,
         # which cascades into startup self-check failures.
-        settings = self.bot.settings
-        self.store = ReactionRolesStore(settings.sqlite_path)
+        database = getattr(self.bot, "db_pool", None) or self.bot.settings.sqlite_path
+        self.store = ReactionRolesStore(database)
         # Use the bot-wide PanelStore to avoid duplicate table init / cache divergence.
-        self.panel_store = getattr(self.bot, "panel_store", PanelStore(settings.sqlite_path))
+        self.panel_store = getattr(self.bot, "panel_store", None) or PanelStore(database)
 
         await self.store.init()
 
@@ -618,15 +573,21 @@ class ReactionRolesCog(commands.Cog):
             log.info("Reaction roles disabled by settings; skipping restoration")
             return
 
-        # Best-effort restoration per guild.
-        for guild in list(getattr(self.bot, "guilds", [])):
-            try:
-                await self._restore_member_panel_for_guild(guild)
-            except Exception:
-                log.exception("Failed to restore reaction roles panel for guild %s", getattr(guild, "id", None))
+        # Best-effort restoration per guild. Guilds are restored concurrently,
+        # capped so the message fetches stay within Discord's rate limits.
+        semaphore = asyncio.Semaphore(8)
+
+        async def _restore(guild: discord.Guild) -> None:
+            async with semaphore:
+                try:
+                    await self._restore_member_panel_for_guild(guild)
+                except Exception:
+                    log.exception("Failed to restore reaction roles panel for guild %s", getattr(guild, "id", None))
+
+        await asyncio.gather(*(_restore(g) for g in getattr(self.bot, "guilds", ())))
 
     async def _restore_member_panel_for_guild(self, guild: discord.Guild) -> None:
-        panel_key = getattr(self.bot.settings, "reaction_roles_panel_key", "reaction_roles_panel")
+        panel_key = self._panel_key
         rec = await self.panel_store.get(guild.id, panel_key)
         if not rec:
             return
@@ -699,7 +660,7 @@ class ReactionRolesCog(commands.Cog):
                 ephemeral=True
                 )
         except Exception as e:
-            log.error(f"Reaction roles command error: {e}", exc_info=True)
+            log.exception("Reaction roles command error: %s", e)
             await interaction.followup.send(
                 "❌ Command failed. Please try again.", 
                 ephemeral=True
@@ -730,7 +691,7 @@ class ReactionRolesCog(commands.Cog):
             panel_status = "Missing"
             last_publish = "Never"
             try:
-                panel_key = getattr(self.bot.settings, "reaction_roles_panel_key", "reaction_roles_panel")
+                panel_key = self._panel_key
                 rec = await self.panel_store.get(interaction.guild.id, panel_key)
                 if rec and rec.get("message_id"):
                     channel = interaction.guild.get_channel(rec["channel_id"]) or self.bot.get_channel(rec["channel_id"])
@@ -755,7 +716,7 @@ class ReactionRolesCog(commands.Cog):
             embed.add_field(name="Last Publish", value=last_publish)
 
             # Create and send view
-            view = ReactionRolesManagerView(self, interaction.user)
+            view = ReactionRolesManagerView(self, interaction.user.id)
             message = await interaction.followup.send(embed=embed, view=view, ephemeral=True)
             view.message = message
             
@@ -772,7 +733,7 @@ class ReactionRolesCog(commands.Cog):
                 ephemeral=True
                 )
         except Exception as e:
-            log.error(f"Open manager error: {e}", exc_info=True)
+            log.exception("Open manager error: %s", e)
             await interaction.followup.send(
                 "❌ Failed to open manager.", 
                 ephemeral=True
@@ -809,7 +770,7 @@ class ReactionRolesCog(commands.Cog):
                     return
 
             # Find or create the configured channel for the member panel.
-            target_name = getattr(self.bot.settings, "reaction_roles_channel_name", REACTION_ROLES_CHANNEL)
+            target_name = self._channel_name
             channel = find_text_channel_fuzzy(guild, target_name)
             if not channel:
                 try:
@@ -849,7 +810,7 @@ class ReactionRolesCog(commands.Cog):
             )
 
             # Check if panel already exists
-            panel_key = getattr(self.bot.settings, "reaction_roles_panel_key", "reaction_roles_panel")
+            panel_key = self._panel_key
             rec = await self.panel_store.get(guild.id, panel_key)
             if rec and rec.get("message_id"):
                 try:
@@ -905,7 +866,7 @@ class ReactionRolesCog(commands.Cog):
                 ephemeral=True
                 )
         except Exception as e:
-            log.error(f"Publish panel error: {e}", exc_info=True)
+            log.exception("Publish panel error: %s", e)
             await interaction.followup.send(
                 "❌ Failed to publish panel.", 
                 ephemeral=True
@@ -962,7 +923,7 @@ class ReactionRolesCog(commands.Cog):
                 ephemeral=True
                 )
         except Exception as e:
-            log.error(f"List roles error: {e}", exc_info=True)
+            log.exception("List roles error: %s", e)
             await interaction.followup.send(
                 "❌ Failed to list roles.", 
                 ephemeral=True
@@ -1021,7 +982,7 @@ class ReactionRolesCog(commands.Cog):
                 ephemeral=True
                 )
         except Exception as e:
-            log.error(f"Clear user roles error: {e}", exc_info=True)
+            log.exception("Clear user roles error: %s", e)
             await interaction.followup.send(
                 "❌ Failed to clear roles.", 
                 ephemeral=True
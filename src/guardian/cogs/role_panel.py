@@ -116,19 +116,17 @@ class PersistentRoleSelect(discord.ui.Select):
         selected_role_ids = set(int(v) for v in self.values)
         available_role_ids = set(int(config.role_id) for config in self.role_configs.values())
         
-        to_add = []
-        to_remove = []
+        current_role_ids = {role.id for role in member.roles}
         
         # Determine which roles to add/remove
-        for role_id in available_role_ids:
-            role = interaction.guild.get_role(role_id)
-            if not role:
-                continue
-                
-            if role_id in selected_role_ids and role not in member.roles:
-                to_add.append(role)
-            elif role_id not in selected_role_ids and role in member.roles:
-                to_remove.append(role)
+        to_add = [
+            role for role_id in (available_role_ids & selected_role_ids) - current_role_ids
+            if (role := interaction.guild.get_role(role_id))
+        ]
+        to_remove = [
+            role for role_id in (available_role_ids & current_role_ids) - selected_role_ids
+            if (role := interaction.guild.get_role(role_id))
+        ]
         
         # Apply role changes
         try:
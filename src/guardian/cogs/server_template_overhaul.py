@@ -1,17 +1,50 @@
 from __future__ import annotations
 
+import io
 import logging
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Awaitable, Dict, Iterable, List, Optional, Protocol, Tuple, TypeVar
 
 import discord
 import asyncio
 from discord import app_commands
 from discord.ext import commands
 
+from ..utils import run_batch
+
 
 log = logging.getLogger(__name__)
 
+# Minimum spacing between progress message edits during an overhaul.
+_PROGRESS_MIN_INTERVAL_SECONDS = 2.0
+# Discord rejects message content over 2000 characters; longer reports go out as a file.
+_MAX_MESSAGE_LEN = 2000
+_REPORT_PREVIEW_LEN = 1900
+# Deletes during the nuke phase are independent; this many run at once.
+_NUKE_BATCH_SIZE = 5
+
+
+class _HasName(Protocol):
+    name: str
+
+
+_Named = TypeVar("_Named", bound=_HasName)
+
+
+async def _best_effort(coro: Awaitable[object], label: str) -> bool:
+    """Await a non-fatal Discord call, logging API errors instead of raising.
+
+    Only discord.HTTPException (incl. Forbidden/NotFound) is swallowed, so
+    cancellation and programming errors still surface. Returns True on success.
+    """
+    try:
+        await coro
+    except discord.HTTPException as e:
+        log.warning("%s: %s", label, e)
+        return False
+    return True
+
 
 # NOTE: This cog implements the user's "DISCORD SERVER TEMPLATE — 833s" as an idempotent
 # overhaul command. It creates/matches roles, categories, channels, and core guild settings.
@@ -81,7 +114,11 @@ class ServerTemplateOverhaulCog(commands.Cog):
     # Template definition
     # ------------------------
 
-    def _role_defs(self) -> List[RoleDef]:
+    # The template is static; build it once per process and share the
+    # immutable result across invocations.
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _role_defs() -> Tuple[RoleDef, ...]:
         # Colors are intentionally opinionated defaults.
         # Change them here if you want a different palette.
         C = {
@@ -177,7 +214,7 @@ class ServerTemplateOverhaulCog(commands.Cog):
         veteran = RoleDef(name="Veteran", perms=discord.Permissions.none(), color=C["Veteran"])
 
         # Order here is the intended hierarchy top -> bottom.
-        return [
+        return (
             owner,
             admin,
             moderator,
@@ -193,10 +230,12 @@ class ServerTemplateOverhaulCog(commands.Cog):
             regular,
             active,
             veteran,
-        ]
+        )
 
-    def _category_defs(self) -> List[CategoryDef]:
-        return [
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _category_defs() -> Tuple[CategoryDef, ...]:
+        return (
             CategoryDef(
                 name="📌 START HERE",
                 everyone_view=False,
@@ -342,31 +381,24 @@ class ServerTemplateOverhaulCog(commands.Cog):
                     TextChannelDef("reports-queue"),
                 ),
             ),
-        ]
+        )
 
     # ------------------------
     # Helpers
     # ------------------------
 
     @staticmethod
-    def _role_by_name(guild: discord.Guild, name: str) -> Optional[discord.Role]:
-        return discord.utils.get(guild.roles, name=name)
-
-    @staticmethod
-    def _category_by_name(guild: discord.Guild, name: str) -> Optional[discord.CategoryChannel]:
-        return discord.utils.get(guild.categories, name=name)
-
-    @staticmethod
-    def _text_by_name(guild: discord.Guild, name: str) -> Optional[discord.TextChannel]:
-        return discord.utils.get(guild.text_channels, name=name)
+    def _index_by_name(items: Iterable[_Named]) -> Dict[str, _Named]:
+        """Map name -> object, keeping the first match like discord.utils.get would."""
+        index: Dict[str, _Named] = {}
+        for item in items:
+            index.setdefault(item.name, item)
+        return index
 
     @staticmethod
-    def _voice_by_name(guild: discord.Guild, name: str) -> Optional[discord.VoiceChannel]:
-        return discord.utils.get(guild.voice_channels, name=name)
-
-    def _staff_roles(self, guild: discord.Guild) -> List[discord.Role]:
+    def _staff_roles(roles_by_name: Dict[str, discord.Role]) -> List[discord.Role]:
         names = ["Owner", "Admin", "Moderator", "Helper"]
-        roles = [r for r in (self._role_by_name(guild, n) for n in names) if r]
+        roles = [r for r in (roles_by_name.get(n) for n in names) if r]
         return roles
 
     def _build_overwrites(
@@ -375,11 +407,11 @@ class ServerTemplateOverhaulCog(commands.Cog):
         cat: CategoryDef,
         verified_role: discord.Role,
         muted_role: discord.Role,
+        staff_roles: List[discord.Role],
     ) -> Dict[discord.abc.Snowflake, discord.PermissionOverwrite]:
         ow: Dict[discord.abc.Snowflake, discord.PermissionOverwrite] = {}
 
         everyone = guild.default_role
-        staff_roles = self._staff_roles(guild)
 
         # Base overwrites
         ow[everyone] = discord.PermissionOverwrite(view_channel=cat.everyone_view)
@@ -409,6 +441,43 @@ class ServerTemplateOverhaulCog(commands.Cog):
                 ow[sr] = discord.PermissionOverwrite(view_channel=True, send_messages=True)
         return ow
 
+    @staticmethod
+    def _channel_overwrites(
+        ow: Dict[discord.abc.Snowflake, discord.PermissionOverwrite],
+        tcd: TextChannelDef,
+        verified_role: discord.Role,
+        admin_role: Optional[discord.Role],
+    ) -> Dict[discord.abc.Snowflake, discord.PermissionOverwrite]:
+        # Read-only channels: prevent verified sending
+        if tcd.read_only_for_verified:
+            o = ow.get(verified_role, discord.PermissionOverwrite())
+            o.send_messages = False
+            o.add_reactions = False
+            o.create_public_threads = False
+            o.create_private_threads = False
+            o.send_messages_in_threads = False
+            ow[verified_role] = o
+
+        # Admin-only send (announcements): verified can view, but not send
+        if tcd.admin_only_send:
+            o = ow.get(verified_role, discord.PermissionOverwrite())
+            o.send_messages = False
+            o.send_messages_in_threads = False
+            ow[verified_role] = o
+            if admin_role:
+                oa = ow.get(admin_role, discord.PermissionOverwrite())
+                oa.send_messages = True
+                oa.send_messages_in_threads = True
+                ow[admin_role] = oa
+
+        # Discord does not expose a channel-level "threads enabled" toggle; it's permission-based.
+        if tcd.threads_enabled:
+            o = ow.get(verified_role, discord.PermissionOverwrite())
+            o.create_public_threads = True
+            o.send_messages_in_threads = True
+            ow[verified_role] = o
+        return ow
+
     # ------------------------
     # Command
     # ------------------------
@@ -419,6 +488,12 @@ class ServerTemplateOverhaulCog(commands.Cog):
     )
     @app_commands.checks.has_permissions(manage_guild=True)
     async def overhaul(self, interaction: discord.Interaction) -> None:
+        # Reject bad invocations with a direct reply before paying for defer + DM setup.
+        guild = interaction.guild
+        if guild is None:
+            await interaction.response.send_message("Guild context missing.", ephemeral=True)
+            return
+
         # Ephemeral response so progress updates remain editable even if we delete the channel
         # the command was invoked from.
         await interaction.response.defer(ephemeral=True, thinking=True)
@@ -429,41 +504,68 @@ class ServerTemplateOverhaulCog(commands.Cog):
         except Exception:
             progress_msg = None
 
-        async def _progress(step: int, total: int, label: str) -> None:
-            """Update the progress message.
+        async def _write_status(content: str, *, report: Optional[bytes] = None) -> None:
+            """Write to the progress message.
 
             We cannot rely on interaction.edit_original_response because the invocation channel
             may be deleted during the overhaul, which deletes the original response message.
             We instead write progress to the invoker's DM (and fall back to the original response).
             """
-            width = 20
-            filled = int((step / max(total, 1)) * width)
-            bar = "█" * filled + "░" * (width - filled)
-            content = f"[{bar}] {step}/{total}  {label}"
+            def _edit_kwargs() -> Dict[str, object]:
+                # A File is consumed on upload, so each attempt gets a fresh one over the
+                # same encoded buffer.
+                if report is None:
+                    return {"content": content}
+                return {
+                    "content": content,
+                    "attachments": [discord.File(io.BytesIO(report), filename="overhaul_report.txt")],
+                }
+
             # Prefer DM progress message.
             if progress_msg is not None:
                 try:
-                    await progress_msg.edit(content=content)
+                    await progress_msg.edit(**_edit_kwargs())
                     return
                 except Exception:
                     pass
             try:
-                await interaction.edit_original_response(content=content)
+                await interaction.edit_original_response(**_edit_kwargs())
             except Exception:
                 # If the original response is gone (channel deleted), just stop updating there.
                 return
 
+        # Progress edits run in the background so they don't hold up the overhaul's own
+        # requests. Only the newest line is kept; the flusher exits once nothing is pending.
+        pending_progress: Optional[str] = None
+        progress_task: Optional[asyncio.Task[None]] = None
+
+        async def _flush_progress() -> None:
+            nonlocal pending_progress
+            while pending_progress is not None:
+                content, pending_progress = pending_progress, None
+                await _write_status(content)
+                await asyncio.sleep(_PROGRESS_MIN_INTERVAL_SECONDS)
+
+        async def _progress(step: int, total: int, label: str) -> None:
+            nonlocal pending_progress, progress_task
+            width = 20
+            filled = int((step / max(total, 1)) * width)
+            bar = "█" * filled + "░" * (width - filled)
+            pending_progress = f"[{bar}] {step}/{total}  {label}"
+            if progress_task is None or progress_task.done():
+                progress_task = asyncio.create_task(_flush_progress())
+
         async def _final(summary: str) -> None:
-            if progress_msg is not None:
-                try:
-                    await progress_msg.edit(content=summary)
-                    return
-                except Exception:
-                    pass
-            try:
-                await interaction.edit_original_response(content=summary)
-            except Exception:
+            # Drop any queued progress line so it can't overwrite the summary.
+            if progress_task is not None and not progress_task.done():
+                progress_task.cancel()
+            if len(summary) <= _MAX_MESSAGE_LEN:
+                await _write_status(summary)
                 return
+            # Long warning lists overflow a single message; show the head and attach the
+            # full report, encoding it once.
+            preview = summary[:_REPORT_PREVIEW_LEN] + "\n\n... (truncated, full report attached)"
+            await _write_status(preview, report=summary.encode("utf-8"))
 
         async def _unset_system_channels() -> None:
             # Unset channels like rules/public updates/system that can prevent deletion on Community servers.
@@ -479,11 +581,6 @@ class ServerTemplateOverhaulCog(commands.Cog):
                 warnings.append(f'Failed unsetting system channels before nuke: {type(e).__name__}')
 
 
-        guild = interaction.guild
-        if guild is None:
-            await interaction.followup.send("Guild context missing.", ephemeral=True)
-            return
-
         results: List[str] = []
         warnings: List[str] = []
         # Clear persisted panel records for this guild before rebuilding to avoid restoring
@@ -521,20 +618,22 @@ class ServerTemplateOverhaulCog(commands.Cog):
                 [c for c in guild.channels if not isinstance(c, discord.CategoryChannel)],
                 key=lambda c: (str(c.type), c.position),
             )
-            for ch in channels:
+
+            async def _delete_channel(ch: discord.abc.GuildChannel) -> None:
                 try:
                     await ch.delete(reason="833s template overhaul (nuke)")
-                    # Reduce rate-limit pressure during large wipes.
-                    await asyncio.sleep(0.2)
                 except discord.Forbidden:
                     warnings.append(f"Forbidden deleting channel: {getattr(ch, 'name', ch.id)}")
-                except discord.HTTPException as e:
+                except discord.HTTPException:
                     failed_http.append(ch)
                     warnings.append(f"Failed deleting channel {getattr(ch, 'name', ch.id)}: HTTPException")
-                    await asyncio.sleep(1.0)
                 except Exception as e:
                     warnings.append(f"Failed deleting channel {getattr(ch, 'name', ch.id)}: {type(e).__name__}")
 
+            # A few deletes in flight at a time instead of a fixed pause after each one;
+            # discord.py paces us if the bucket runs dry.
+            await run_batch(channels, _delete_channel, batch_size=_NUKE_BATCH_SIZE)
+
 
 
             # Retry deleting channels that commonly fail if they were set as rules/updates channels.
@@ -544,42 +643,34 @@ class ServerTemplateOverhaulCog(commands.Cog):
             for ch in [c for c in guild.channels if not isinstance(c, discord.CategoryChannel)]:
                 if getattr(ch, "name", "") not in retry_names:
                     continue
-                # Skip if already deleted
-                try:
-                    _ = ch.id
-                except Exception:
-                    continue
-                try:
-                    await ch.delete(reason="833s template overhaul (nuke retry)")
-                    await asyncio.sleep(0.2)
-                except Exception:
-                    pass
+                await _best_effort(
+                    ch.delete(reason="833s template overhaul (nuke retry)"),
+                    f"Retry deleting channel {ch.name}",
+                )
 
 
 
             # Retry channel deletions once after detaching system channels and a short delay.
             if failed_http:
-                try:
-                    await asyncio.sleep(1.5)
-                except Exception:
-                    pass
+                await asyncio.sleep(1.5)
                 for ch in list(failed_http):
-                    try:
-                        await ch.delete(reason="833s template overhaul (nuke retry)")
+                    if await _best_effort(
+                        ch.delete(reason="833s template overhaul (nuke retry)"),
+                        f"Retry deleting channel {getattr(ch, 'name', ch.id)}",
+                    ):
                         failed_http.remove(ch)
-                        await asyncio.sleep(0.2)
-                    except Exception:
-                        continue
             # Then delete categories
             cats = sorted(list(guild.categories), key=lambda c: c.position)
-            for cat in cats:
+
+            async def _delete_category(cat: discord.CategoryChannel) -> None:
                 try:
                     await cat.delete(reason="833s template overhaul (nuke)")
-                    await asyncio.sleep(0.2)
                 except discord.Forbidden:
                     warnings.append(f"Forbidden deleting category: {cat.name}")
                 except Exception as e:
                     warnings.append(f"Failed deleting category {cat.name}: {type(e).__name__}")
+
+            await run_batch(cats, _delete_category, batch_size=_NUKE_BATCH_SIZE)
         except Exception as e:
             warnings.append(f"Channel/category deletion pass failed: {type(e).__name__}")
 
@@ -589,22 +680,21 @@ class ServerTemplateOverhaulCog(commands.Cog):
         try:
             me = guild.me
             top_pos = me.top_role.position if me else 0
-            roles = sorted(guild.roles, key=lambda r: r.position, reverse=True)
-            for role in roles:
-                if role == guild.default_role:
-                    continue
-                if role.managed:
-                    continue
-                if role.position >= top_pos:
-                    # Can't delete roles at/above bot.
-                    continue
+            # Skip @everyone, managed roles, and roles at/above the bot (can't delete those).
+            roles = [
+                r for r in guild.roles
+                if r != guild.default_role and not r.managed and r.position < top_pos
+            ]
+
+            async def _delete_role(role: discord.Role) -> None:
                 try:
                     await role.delete(reason="833s template overhaul (nuke)")
-                    await asyncio.sleep(0.2)
                 except discord.Forbidden:
                     warnings.append(f"Forbidden deleting role: {role.name}")
                 except Exception as e:
                     warnings.append(f"Failed deleting role {role.name}: {type(e).__name__}")
+
+            await run_batch(roles, _delete_role, batch_size=_NUKE_BATCH_SIZE)
         except Exception as e:
             warnings.append(f"Role deletion pass failed: {type(e).__name__}")
 
@@ -630,48 +720,70 @@ class ServerTemplateOverhaulCog(commands.Cog):
         role_defs = self._role_defs()
         created_roles = 0
         updated_roles = 0
+        # One pass over guild.roles instead of a scan per template role; new roles are
+        # added as they are created so later lookups don't depend on gateway events.
+        roles_by_name = self._index_by_name(guild.roles)
 
+        async def _create_role(rd: RoleDef) -> None:
+            nonlocal created_roles
+            try:
+                role = await guild.create_role(
+                    name=rd.name,
+                    permissions=rd.perms,
+                    colour=rd.color or discord.Colour.default(),
+                    mentionable=rd.mentionable,
+                    reason="833s template overhaul",
+                )
+                roles_by_name[rd.name] = role
+                created_roles += 1
+            except discord.Forbidden:
+                warnings.append(f"Forbidden creating role: {rd.name}")
+            except Exception as e:
+                warnings.append(f"Failed creating role {rd.name}: {type(e).__name__}")
+
+        async def _update_role(rd: RoleDef) -> None:
+            nonlocal updated_roles
+            role = roles_by_name[rd.name]
+            # Collect every drifted field and send them in one PATCH.
+            changes: Dict[str, object] = {}
+            if role.permissions != rd.perms:
+                changes["permissions"] = rd.perms
+            if rd.color is not None and role.colour != rd.color:
+                changes["colour"] = rd.color
+            if role.mentionable != rd.mentionable:
+                changes["mentionable"] = rd.mentionable
+            if not changes:
+                return
+            try:
+                await role.edit(**changes, reason="833s template overhaul")
+                updated_roles += 1
+            except discord.Forbidden:
+                warnings.append(f"Forbidden updating role: {rd.name}")
+            except Exception as e:
+                warnings.append(f"Failed updating role {rd.name}: {type(e).__name__}")
+
+        # Missing roles are created one at a time, top to bottom: each new role lands just
+        # above @everyone, so creation order alone yields the template hierarchy even when
+        # the reorder step below is rejected.
+        existing_defs = []
         for rd in role_defs:
-            role = self._role_by_name(guild, rd.name)
-            if role is None:
-                try:
-                    role = await guild.create_role(
-                        name=rd.name,
-                        permissions=rd.perms,
-                        colour=rd.color or discord.Colour.default(),
-                        mentionable=rd.mentionable,
-                        reason="833s template overhaul",
-                    )
-                    created_roles += 1
-                except discord.Forbidden:
-                    warnings.append(f"Forbidden creating role: {rd.name}")
-                except Exception as e:
-                    warnings.append(f"Failed creating role {rd.name}: {type(e).__name__}")
+            if rd.name in roles_by_name:
+                existing_defs.append(rd)
             else:
-                try:
-                    changed = False
-                    if role.permissions != rd.perms:
-                        await role.edit(permissions=rd.perms, reason="833s template overhaul")
-                        changed = True
-                    if rd.color is not None and role.colour != rd.color:
-                        await role.edit(colour=rd.color, reason="833s template overhaul")
-                        changed = True
-                    if role.mentionable != rd.mentionable:
-                        await role.edit(mentionable=rd.mentionable, reason="833s template overhaul")
-                        changed = True
-                    if changed:
-                        updated_roles += 1
-                except discord.Forbidden:
-                    warnings.append(f"Forbidden updating role: {rd.name}")
-                except Exception as e:
-                    warnings.append(f"Failed updating role {rd.name}: {type(e).__name__}")
+                await _create_role(rd)
+
+        # Edits to existing roles are independent PATCHes; overlap them in bounded batches.
+        results = await run_batch(existing_defs, _update_role)
+        for rd, result in zip(existing_defs, results, strict=True):
+            if isinstance(result, BaseException):
+                log.error("Updating role %s failed", rd.name, exc_info=result)
+                warnings.append(f"Failed updating role {rd.name}: {type(result).__name__}")
 
         # 2.1) Reorder roles to match hierarchy (best-effort)
         step += 1
         await _progress(step, total_steps, "Applying role order...")
         try:
-            name_to_role = {r.name: r for r in guild.roles}
-            desired = [name_to_role.get(rd.name) for rd in role_defs]
+            desired = [roles_by_name.get(rd.name) for rd in role_defs]
             desired = [r for r in desired if r is not None and r != guild.default_role]
 
             # Keep @everyone at bottom; move desired roles above it in specified order.
@@ -689,9 +801,10 @@ class ServerTemplateOverhaulCog(commands.Cog):
             # Non-fatal. Many guilds disallow reordering depending on role placement.
             warnings.append("Role ordering could not be applied (non-fatal).")
 
-        verified_role = self._role_by_name(guild, "Verified")
-        muted_role = self._role_by_name(guild, "Muted")
-        admin_role = self._role_by_name(guild, "Admin")
+        verified_role = roles_by_name.get("Verified")
+        muted_role = roles_by_name.get("Muted")
+        admin_role = roles_by_name.get("Admin")
+        staff_roles = self._staff_roles(roles_by_name)
 
         if verified_role is None or muted_role is None:
             await interaction.followup.send(
@@ -708,10 +821,13 @@ class ServerTemplateOverhaulCog(commands.Cog):
         created_text = 0
         created_voice = 0
         updated_overwrites = 0
+        categories_by_name = self._index_by_name(guild.categories)
+        text_by_name = self._index_by_name(guild.text_channels)
+        voice_by_name = self._index_by_name(guild.voice_channels)
 
         for cd in cat_defs:
-            category = self._category_by_name(guild, cd.name)
-            overwrites = self._build_overwrites(guild, cd, verified_role, muted_role)
+            category = categories_by_name.get(cd.name)
+            overwrites = self._build_overwrites(guild, cd, verified_role, muted_role, staff_roles)
             if category is None:
                 try:
                     category = await guild.create_category(
@@ -719,6 +835,7 @@ class ServerTemplateOverhaulCog(commands.Cog):
                         overwrites=overwrites,
                         reason="833s template overhaul",
                     )
+                    categories_by_name[cd.name] = category
                     created_cats += 1
                 except discord.Forbidden:
                     warnings.append(f"Forbidden creating category: {cd.name}")
@@ -736,75 +853,47 @@ class ServerTemplateOverhaulCog(commands.Cog):
 
             # Text channels
             for tcd in cd.text_channels:
-                chan = self._text_by_name(guild, tcd.name)
+                chan = text_by_name.get(tcd.name)
+                # Build the final overwrites first so they ride along with the create/edit
+                # instead of costing separate PATCHes. A new channel starts from its
+                # category's overwrites (copied: the per-channel tweaks mutate them).
+                if chan is not None:
+                    base = dict(chan.overwrites)
+                else:
+                    base = {t: discord.PermissionOverwrite.from_pair(*o.pair()) for t, o in overwrites.items()}
+                ow = self._channel_overwrites(base, tcd, verified_role, admin_role)
                 if chan is None:
                     try:
                         chan = await guild.create_text_channel(
                             tcd.name,
                             category=category,
+                            overwrites=ow,
+                            slowmode_delay=tcd.slowmode_seconds,
                             reason="833s template overhaul",
                         )
+                        text_by_name[tcd.name] = chan
                         created_text += 1
                     except discord.Forbidden:
                         warnings.append(f"Forbidden creating text channel: {tcd.name}")
-                        continue
                     except Exception as e:
                         warnings.append(f"Failed creating text channel {tcd.name}: {type(e).__name__}")
-                        continue
-                else:
-                    # Ensure it is in the right category
-                    if chan.category_id != (category.id if category else None):
-                        try:
-                            await chan.edit(category=category, reason="833s template overhaul")
-                        except Exception:
-                            warnings.append(f"Failed moving channel {tcd.name} into {cd.name}")
+                    continue
 
-                # Apply per-channel overwrites
+                edit_kwargs: Dict[str, object] = {"slowmode_delay": tcd.slowmode_seconds, "overwrites": ow}
+                # Ensure it is in the right category
+                if chan.category_id != (category.id if category else None):
+                    edit_kwargs["category"] = category
                 try:
-                    ow = dict(chan.overwrites)
-
-                    # Read-only channels: prevent verified sending
-                    if tcd.read_only_for_verified:
-                        o = ow.get(verified_role, discord.PermissionOverwrite())
-                        o.send_messages = False
-                        o.add_reactions = False
-                        o.create_public_threads = False
-                        o.create_private_threads = False
-                        o.send_messages_in_threads = False
-                        ow[verified_role] = o
-
-                    # Admin-only send (announcements): verified can view, but not send
-                    if tcd.admin_only_send:
-                        o = ow.get(verified_role, discord.PermissionOverwrite())
-                        o.send_messages = False
-                        o.send_messages_in_threads = False
-                        ow[verified_role] = o
-                        if admin_role:
-                            oa = ow.get(admin_role, discord.PermissionOverwrite())
-                            oa.send_messages = True
-                            oa.send_messages_in_threads = True
-                            ow[admin_role] = oa
-
-                    await chan.edit(
-                        slowmode_delay=tcd.slowmode_seconds,
-                        reason="833s template overhaul",
-                    )
-                    # Discord does not expose a channel-level "threads enabled" toggle; it's permission-based.
-                    if tcd.threads_enabled:
-                        o = ow.get(verified_role, discord.PermissionOverwrite())
-                        o.create_public_threads = True
-                        o.send_messages_in_threads = True
-                        ow[verified_role] = o
-                    await chan.edit(overwrites=ow, reason="833s template overhaul")
+                    await chan.edit(**edit_kwargs, reason="833s template overhaul")
                 except Exception:
                     warnings.append(f"Failed applying settings/overwrites for channel: {tcd.name}")
 
             # Voice channels
             for vcd in cd.voice_channels:
-                v = self._voice_by_name(guild, vcd.name)
+                v = voice_by_name.get(vcd.name)
                 if v is None:
                     try:
-                        await guild.create_voice_channel(
+                        voice_by_name[vcd.name] = await guild.create_voice_channel(
                             vcd.name,
                             category=category,
                             reason="833s template overhaul",
@@ -408,9 +408,9 @@ class SimpleReactionRolesCog(commands.Cog):
 
     async def cog_load(self):
         """Initialize stores and register persistent views."""
-        settings = self.bot.settings
-        self.store = SimpleReactionRolesStore(settings.sqlite_path)
-        self.panel_store = PanelStore(settings.sqlite_path)
+        database = getattr(self.bot, "db_pool", None) or self.bot.settings.sqlite_path
+        self.store = SimpleReactionRolesStore(database)
+        self.panel_store = PanelStore(database)
         
         await self.store.init()
         
@@ -4,6 +4,7 @@ import logging
 from typing import Optional, Dict, Any, List
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+import time
 
 import discord
 from discord import app_commands
@@ -18,6 +19,11 @@ from ..lookup import find_text_channel, find_role, find_category
 log = logging.getLogger("guardian.ticket_system")
 
 
+def _fmt_ts(dt: datetime) -> str:
+    """Format a UTC datetime as ``YYYY-MM-DD HH:MM:SS`` without strftime."""
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+
+
 @dataclass
 class TicketConfig:
     """Configuration for ticket system."""
@@ -186,7 +192,7 @@ class TicketSystemCog(commands.Cog):
             self._active_tickets[ticket_channel.id] = {
                 "user_id": interaction.user.id,
                 "guild_id": interaction.guild.id,
-                "created_at": datetime.utcnow(),
+                "created_at": discord.utils.utcnow(),
                 "channel_id": ticket_channel.id,
                 "ticket_number": ticket_number
             }
@@ -210,7 +216,7 @@ class TicketSystemCog(commands.Cog):
                 name="🔧 Ticket Information",
                 value=(
                     f"**Ticket Number:** #{ticket_number:04d}\n"
-                    f"**Created:** <t:{int(datetime.utcnow().timestamp())}:R>\n"
+                    f"**Created:** <t:{int(time.time())}:R>\n"
                     f"**User:** {interaction.user.mention}\n"
                     f"**Status:** 🟢 Open"
                 ),
@@ -296,7 +302,7 @@ class TicketSystemCog(commands.Cog):
                     f"**Ticket Information:**\n"
                     f"• **Number:** #{ticket_info['ticket_number']:04d}\n"
                     f"• **Created:** <t:{int(ticket_info['created_at'].timestamp())}:R>\n"
-                    f"• **Closed:** <t:{int(datetime.utcnow().timestamp())}:R>\n"
+                    f"• **Closed:** <t:{int(time.time())}:R>\n"
                     f"• **Closed by:** {interaction.user.mention}"
                 ),
                 color=discord.Color.red()
@@ -419,7 +425,7 @@ class TicketSystemCog(commands.Cog):
                 if message.system_content:
                     continue
                 
-                timestamp = message.created_at.strftime("%Y-%m-%d %H:%M:%S")
+                timestamp = _fmt_ts(message.created_at)
                 author = message.author.display_name
                 
                 if message.attachments:
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import asyncio
+from contextlib import suppress
+
 import discord
 from discord.ext import commands
 
@@ -20,12 +22,10 @@ class WelcomeCog(commands.Cog):
         if cfg.autorole_id:
             role = member.guild.get_role(cfg.autorole_id)
             if role:
-                try:
+                with suppress(discord.HTTPException):
                     await member.add_roles(role, reason="833's Guardian autorole")
                     self.bot.stats.roles_assigned += 1  # type: ignore[attr-defined]
                     await asyncio.sleep(0.2)
-                except (discord.Forbidden, discord.HTTPException):
-                    pass
 
         # Welcome message (send DM instead of public channel)
         try:
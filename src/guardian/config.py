@@ -31,6 +31,8 @@ class Settings:
     queue_max_size: int
     cache_default_ttl_seconds: int
     sqlite_path: str
+    # Read-only connections opened alongside the shared writer connection.
+    sqlite_readers: int
     log_level: str
     anti_spam_max_msgs: int
     anti_spam_window_seconds: int
@@ -83,6 +85,7 @@ def load_settings() -> Settings:
         queue_max_size=_get_int("QUEUE_MAX_SIZE", 10_000),
         cache_default_ttl_seconds=_get_int("CACHE_DEFAULT_TTL_SECONDS", 120),
         sqlite_path=(os.getenv("SQLITE_PATH", "guardian.sqlite3").strip() or "guardian.sqlite3"),
+        sqlite_readers=max(0, _get_int("SQLITE_READERS", 2)),
         log_level=(os.getenv("LOG_LEVEL", "INFO").strip() or "INFO"),
         anti_spam_max_msgs=_get_int("ANTI_SPAM_MAX_MSGS", 6),
         anti_spam_window_seconds=_get_int("ANTI_SPAM_WINDOW_SECONDS", 5),
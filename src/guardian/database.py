@@ -1,34 +1,222 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import List
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, AsyncIterator, Awaitable, Callable, List, Optional
 
 import aiosqlite
 
-from .services.base import BaseService
+if TYPE_CHECKING:
+    from .services.base import BaseService
 
 log = logging.getLogger("guardian.database")
 
+# Per-connection settings; these do not persist in the database file, so
+# they are applied to every connection the pool opens.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-131072",  # 128MB
+    "PRAGMA mmap_size=268435456",  # 256MB
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA foreign_keys=ON",
+)
+# Sent as one script so a new connection costs a single trip to its thread.
+_CONNECTION_PRAGMA_SCRIPT = ";\n".join(_CONNECTION_PRAGMAS) + ";"
 
-async def initialize_database(sqlite_path: str, stores: List[BaseService]) -> None:
+# Properties of the database file itself; set once at startup.
+_FILE_PRAGMAS = (
+    "PRAGMA journal_size_limit=67108864",  # 64MB cap on the idle WAL file
+)
+
+# How often the pool asks SQLite to refresh planner statistics.
+OPTIMIZE_INTERVAL_SECONDS = 15 * 60
+
+ConnectHook = Callable[[aiosqlite.Connection], Awaitable[None]]
+
+
+async def apply_connection_pragmas(db: aiosqlite.Connection) -> None:
+    """Apply the per-connection SQLite tuning to a freshly opened connection."""
+    await db.executescript(_CONNECTION_PRAGMA_SCRIPT)
+
+
+class SqlitePool:
+    """Long-lived SQLite connections shared by every store.
+
+    One read-write connection serves all writes (serialized by a lock so each
+    ``rw()`` block is its own transaction) and ``readers`` read-only
+    connections serve ``ro()`` blocks, each checked out by one block at a
+    time. The writer opens its transactions with ``BEGIN IMMEDIATE`` so it
+    takes the write lock up front instead of failing with ``SQLITE_BUSY`` on
+    a read-to-write upgrade. Until :meth:`open` is called, both
+    context managers fall back to a short-lived connection, so stores keep
+    working outside the bot (scripts, dry runs).
+
+    ``on_connect`` runs on every new connection, transient ones included.
+    """
+
+    def __init__(
+        self,
+        sqlite_path: str,
+        readers: int = 0,
+        on_connect: Optional[ConnectHook] = apply_connection_pragmas,
+    ) -> None:
+        self.path = sqlite_path
+        self._reader_count = max(0, int(readers))
+        self._on_connect = on_connect
+        self._writer: Optional[aiosqlite.Connection] = None
+        self._readers: list[aiosqlite.Connection] = []
+        self._idle_readers: asyncio.Queue[aiosqlite.Connection] = asyncio.Queue()
+        self._write_lock = asyncio.Lock()
+        self._optimize_task: Optional[asyncio.Task] = None
+
+    @property
+    def is_open(self) -> bool:
+        return self._writer is not None
+
+    async def open(self) -> None:
+        """Open the writer and reader connections."""
+        if self._writer is not None:
+            return
+
+        self._writer = await self._connect(self.path, isolation_level="IMMEDIATE")
+        if self._reader_count and self.path != ":memory:":
+            uri = f"{Path(self.path).resolve().as_uri()}?mode=ro"
+            for _ in range(self._reader_count):
+                db = await self._connect(uri, uri=True)
+                self._readers.append(db)
+                self._idle_readers.put_nowait(db)
+
+        log.info("Opened SQLite pool at %s (1 writer, %d readers)", self.path, len(self._readers))
+
+    async def close(self) -> None:
+        """Close every pooled connection."""
+        await self.stop_optimizer()
+        readers, self._readers = self._readers, []
+        self._idle_readers = asyncio.Queue()
+        writer, self._writer = self._writer, None
+        for db in readers:
+            await db.close()
+        if writer is not None:
+            await writer.close()
+
+    async def optimize(self) -> None:
+        """Run ``PRAGMA optimize`` so the query planner has fresh statistics."""
+        async with self.rw() as db:
+            await db.execute("PRAGMA optimize")
+            await db.commit()
+
+    def start_optimizer(self, interval_seconds: int = OPTIMIZE_INTERVAL_SECONDS) -> None:
+        """Run :meth:`optimize` every ``interval_seconds`` until the pool closes."""
+        if self._optimize_task is None or self._optimize_task.done():
+            self._optimize_task = asyncio.create_task(
+                self._optimize_loop(interval_seconds), name="sqlite-optimize"
+            )
+
+    async def stop_optimizer(self) -> None:
+        """Cancel the periodic optimize task, if running."""
+        task, self._optimize_task = self._optimize_task, None
+        if task is None or task.done():
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _optimize_loop(self, interval_seconds: int) -> None:
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                await self.optimize()
+            except Exception as e:
+                log.warning("PRAGMA optimize failed: %s", e)
+
+    async def _connect(self, database: str, **kwargs) -> aiosqlite.Connection:
+        db = await aiosqlite.connect(database, **kwargs)
+        db.row_factory = aiosqlite.Row
+        if self._on_connect is not None:
+            await self._on_connect(db)
+        return db
+
+    @asynccontextmanager
+    async def _transient(self) -> AsyncIterator[aiosqlite.Connection]:
+        async with aiosqlite.connect(self.path, isolation_level="IMMEDIATE") as db:
+            db.row_factory = aiosqlite.Row
+            if self._on_connect is not None:
+                await self._on_connect(db)
+            yield db
+
+    @asynccontextmanager
+    async def rw(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow the writer connection.
+
+        Work left uncommitted when the block exits is rolled back, matching
+        the old behaviour of closing a per-call connection.
+        """
+        if self._writer is None:
+            async with self._transient() as db:
+                yield db
+            return
+
+        async with self._write_lock:
+            db = self._writer
+            try:
+                yield db
+            finally:
+                if db.in_transaction:
+                    await db.rollback()
+
+    @asynccontextmanager
+    async def ro(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a connection for reads only.
+
+        Waits for an idle reader rather than sharing one between concurrent
+        blocks, so a slow leaderboard scan never queues other reads behind it.
+        """
+        if self._readers:
+            db = await self._idle_readers.get()
+            try:
+                yield db
+            finally:
+                self._idle_readers.put_nowait(db)
+        elif self._writer is not None:
+            # No readers configured: share the writer, but never inside
+            # another task's open rw() transaction.
+            async with self._write_lock:
+                yield self._writer
+        else:
+            async with self._transient() as db:
+                yield db
+
+
+async def initialize_database(pool: SqlitePool, stores: List[BaseService]) -> None:
     """Initialize the database with all stores."""
     try:
-        # Apply SQLite optimizations
-        async with aiosqlite.connect(sqlite_path) as db:
-            await db.execute("PRAGMA journal_mode=WAL")
-            await db.execute("PRAGMA synchronous=NORMAL")
-            await db.execute("PRAGMA foreign_keys=ON")
-            await db.execute("PRAGMA cache_size=10000")
-            await db.execute("PRAGMA temp_store=MEMORY")
-            await db.execute("PRAGMA mmap_size=268435456")  # 256MB
+        # journal_mode and journal_size_limit are properties of the database
+        # file, so they are set once here; per-connection pragmas are applied
+        # by the pool's on_connect hook.
+        async with pool.rw() as db:
+            async with db.execute("PRAGMA journal_mode=WAL") as cur:
+                row = await cur.fetchone()
+            for pragma in _FILE_PRAGMAS:
+                await db.execute(pragma)
             await db.commit()
         
-        log.info("Applied SQLite optimizations")
+        log.info("Applied SQLite optimizations (journal_mode=%s)", row[0] if row else "unknown")
         
-        # Initialize all stores
-        for store in stores:
+        # Initialize all stores; their schemas are independent, so the
+        # round-trips are overlapped rather than awaited one by one.
+        async def _init_store(store: BaseService) -> None:
             await store.init()
-            log.info(f"Initialized {store.__class__.__name__}")
+            log.info("Initialized %s", type(store).__name__)
+
+        await asyncio.gather(*(_init_store(store) for store in stores))
+
+        # Refresh planner statistics for the freshly created tables/indexes.
+        await pool.optimize()
         
         log.info("Database initialization completed")
         
@@ -85,10 +273,11 @@ async def optimize_database(sqlite_path: str) -> None:
         raise
 
 
-async def get_database_info(sqlite_path: str) -> dict:
+async def get_database_info(database: SqlitePool | str) -> dict:
     """Get information about the database."""
+    pool = database if isinstance(database, SqlitePool) else SqlitePool(database)
     try:
-        async with aiosqlite.connect(sqlite_path) as db:
+        async with pool.ro() as db:
             # Get page count and page size
             cursor = await db.execute("PRAGMA page_count")
             page_count = (await cursor.fetchone())[0]
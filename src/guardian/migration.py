@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 
-import aiosqlite
+from .database import SqlitePool
 
 log = logging.getLogger("guardian.migration")
 
@@ -36,8 +36,9 @@ class Migration:
 class MigrationManager:
     """Manages database migrations with safety and rollback capabilities."""
     
-    def __init__(self, db_path: str):
-        self.db_path = db_path
+    def __init__(self, database: SqlitePool | str):
+        self._pool = database if isinstance(database, SqlitePool) else SqlitePool(database)
+        self.db_path = self._pool.path
         self.migrations: Dict[str, Migration] = {}
         self._register_standard_migrations()
     
@@ -152,7 +153,7 @@ class MigrationManager:
     
     async def ensure_migration_table(self):
         """Ensure the migration tracking table exists."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.rw() as db:
             await db.execute("""
                 CREATE TABLE IF NOT EXISTS migrations (
                     version TEXT PRIMARY KEY,
@@ -169,7 +170,7 @@ class MigrationManager:
         """Get list of applied migration versions."""
         await self.ensure_migration_table()
         
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.ro() as db:
             cursor = await db.execute("SELECT version FROM migrations ORDER BY version")
             rows = await cursor.fetchall()
             return [row[0] for row in rows]
@@ -187,7 +188,7 @@ class MigrationManager:
         
         log.info(f"Applying migration {migration.version}: {migration.description}")
         
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.rw() as db:
             try:
                 # Start transaction
                 await db.execute("BEGIN TRANSACTION")
@@ -240,7 +241,7 @@ class MigrationManager:
         
         log.info(f"Rolling back migration {migration.version}")
         
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.rw() as db:
             try:
                 # Start transaction
                 await db.execute("BEGIN TRANSACTION")
@@ -332,13 +333,14 @@ class MigrationManager:
 class ConfigManager:
     """Manages configuration with versioning and migration support."""
     
-    def __init__(self, db_path: str):
-        self.db_path = db_path
+    def __init__(self, database: SqlitePool | str):
+        self._pool = database if isinstance(database, SqlitePool) else SqlitePool(database)
+        self.db_path = self._pool.path
         self.config_version = "1.0.0"
     
     async def ensure_config_table(self):
         """Ensure the config table exists."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.rw() as db:
             await db.execute("""
                 CREATE TABLE IF NOT EXISTS guild_configs (
                     guild_id INTEGER PRIMARY KEY,
@@ -354,7 +356,7 @@ class ConfigManager:
         """Get configuration for a guild with migration support."""
         await self.ensure_config_table()
         
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.ro() as db:
             cursor = await db.execute(
                 "SELECT config_data, config_version FROM guild_configs WHERE guild_id = ?",
                 (guild_id,)
@@ -382,7 +384,7 @@ class ConfigManager:
         
         config_json = self._serialize_config(config)
         
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._pool.rw() as db:
             await db.execute("""
                 INSERT OR REPLACE INTO guild_configs (guild_id, config_version, config_data, updated_at)
                 VALUES (?, ?, ?, CURRENT_TIMESTAMP)
@@ -446,11 +448,11 @@ migration_manager = None
 config_manager = None
 
 
-def initialize_migration_system(db_path: str):
+def initialize_migration_system(database: SqlitePool | str):
     """Initialize the migration system."""
     global migration_manager, config_manager
-    migration_manager = MigrationManager(db_path)
-    config_manager = ConfigManager(db_path)
+    migration_manager = MigrationManager(database)
+    config_manager = ConfigManager(database)
 
 
 async def run_migrations(db_path: str) -> Dict[str, Any]:
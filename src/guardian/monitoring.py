@@ -106,7 +106,8 @@ class PerformanceMonitor:
             
             # Update database metrics
             if hasattr(self.bot, 'settings'):
-                db_info = await get_database_info(self.bot.settings.sqlite_path)
+                database = getattr(self.bot, "db_pool", None) or self.bot.settings.sqlite_path
+                db_info = await get_database_info(database)
                 self.metrics.database_size = db_info["size_mb"]
             
             # Update memory usage (simplified)
@@ -115,13 +115,13 @@ class ObservabilityManager:
         
         # Update counters
         if action == ActionType.COMMAND:
-            command_name = details.get("command", "unknown")
+            command_name = entry.details.get("command", "unknown")
             self._command_counts[command_name] = self._command_counts.get(command_name, 0) + 1
         elif action == ActionType.ERROR:
             error_key = f"{error_type or 'unknown'}:{message}"
             self._error_counts[error_key] = self._error_counts.get(error_key, 0) + 1
         elif action == ActionType.API_CALL:
-            api_operation = details.get("operation", "unknown")
+            api_operation = entry.details.get("operation", "unknown")
             self._api_call_counts[api_operation] = self._api_call_counts.get(api_operation, 0) + 1
     
     def log_command(
@@ -243,9 +243,14 @@ class ObservabilityManager:
         # Update health status - add new components dynamically
         self._health_status[component] = (status == "OK")
     
-    def log_startup_complete(self, total_duration_ms: float):
-        """Log complete startup summary."""
-        all_healthy = all(self._health_status.values())
+    def log_startup_complete(self, total_duration_ms: float, pending: tuple[str, ...] = ()):
+        """Log complete startup summary.
+
+        Components listed in ``pending`` are still finishing in the background
+        and are reported separately rather than counted as unhealthy.
+        """
+        checked = {name: ok for name, ok in self._health_status.items() if name not in pending}
+        all_healthy = all(checked.values())
         
         self.log_structured(
             level=LogLevel.INFO if all_healthy else LogLevel.WARNING,
@@ -254,8 +259,9 @@ class ObservabilityManager:
             details={
                 "duration_ms": total_duration_ms,
                 "health_status": self._health_status,
-                "components_healthy": sum(self._health_status.values()),
-                "components_total": len(self._health_status)
+                "pending": list(pending),
+                "components_healthy": sum(checked.values()),
+                "components_total": len(checked)
             },
             duration_ms=total_duration_ms,
             success=all_healthy
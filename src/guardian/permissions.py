@@ -8,6 +8,7 @@ from functools import wraps
 import discord
 
 from .lookup import find_role
+from .services.discord_safety import safe_send
 from discord import app_commands
 from discord.ext import commands
 
@@ -169,13 +170,8 @@ def require_tier(min_tier: PermissionTier):
 async def _send_permission_error(interaction_or_ctx: Union[discord.Interaction, commands.Context], message: str):
     """Send permission error message."""
     if isinstance(interaction_or_ctx, discord.Interaction):
-        try:
-            if interaction_or_ctx.response.is_done():
-                await interaction_or_ctx.followup.send(f"❌ {message}", ephemeral=True)
-            else:
-                await interaction_or_ctx.response.send_message(f"❌ {message}", ephemeral=True)
-        except Exception as e:
-            log.error(f"Failed to send permission error for interaction: {e}")
+        if not await safe_send(interaction_or_ctx, f"❌ {message}"):
+            log.error("Failed to send permission error for interaction")
     elif isinstance(interaction_or_ctx, commands.Context):
         try:
             await interaction_or_ctx.reply(f"❌ {message}")
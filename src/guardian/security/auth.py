@@ -4,6 +4,8 @@ import discord
 from discord.ext import commands
 from typing import Union, Optional
 
+from ..services.discord_safety import safe_send
+
 
 async def get_application_owner_ids(bot: commands.Bot) -> set[int]:
     """Get the set of application owner IDs (owner + team members)."""
@@ -101,10 +103,7 @@ def root_only():
             if isinstance(ctx, commands.Context):
                 await ctx.send("❌ This command requires root-level access.", ephemeral=True)
             else:  # Interaction
-                if ctx.response.is_done():
-                    await ctx.followup.send("❌ This command requires root-level access.", ephemeral=True)
-                else:
-                    await ctx.response.send_message("❌ This command requires root-level access.", ephemeral=True)
+                await safe_send(ctx, "❌ This command requires root-level access.")
             return False
         
         return True
@@ -3,12 +3,13 @@ from __future__ import annotations
 import time
 import aiosqlite
 
+from ..database import SqlitePool
 from .base import BaseService
 
 
 class AchievementsStore(BaseService):
-    def __init__(self, sqlite_path: str, cache_ttl: int = 300) -> None:
-        super().__init__(sqlite_path, cache_ttl)
+    def __init__(self, database: SqlitePool | str, cache_ttl: int = 300) -> None:
+        super().__init__(database, cache_ttl)
 
     async def _create_tables(self, db: aiosqlite.Connection) -> None:
         await db.execute(
@@ -35,7 +36,7 @@ class AchievementsStore(BaseService):
 
     async def unlock(self, guild_id: int, user_id: int, code: str, *, meta: str = "") -> bool:
         now = int(time.time())
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             cur = await db.execute(
                 """
                 INSERT OR IGNORE INTO achievements_unlocked (guild_id, user_id, code, unlocked_at, meta)
@@ -46,23 +47,44 @@ class AchievementsStore(BaseService):
             await db.commit()
             return cur.rowcount > 0
 
-    async def list_user(self, guild_id: int, user_id: int) -> list[tuple[str, int, str]]:
-        async with aiosqlite.connect(self._path) as db:
-            cur = await db.execute(
-                """
-                SELECT code, unlocked_at, meta
-                FROM achievements_unlocked
-                WHERE guild_id=? AND user_id=?
-                ORDER BY unlocked_at ASC
-                """,
-                (guild_id, user_id),
-            )
+    async def list_user(
+        self, guild_id: int, user_id: int, *, limit: int | None = None
+    ) -> list[tuple[str, int, str]]:
+        """Return a user's unlocks, oldest first.
+
+        With ``limit``, only the most recent ``limit`` unlocks are fetched;
+        SQLite walks idx_ach_g_u backwards and stops early.
+        """
+        async with self._pool.ro() as db:
+            if limit is None:
+                cur = await db.execute(
+                    """
+                    SELECT code, unlocked_at, meta
+                    FROM achievements_unlocked
+                    WHERE guild_id=? AND user_id=?
+                    ORDER BY unlocked_at ASC
+                    """,
+                    (guild_id, user_id),
+                )
+            else:
+                cur = await db.execute(
+                    """
+                    SELECT code, unlocked_at, meta
+                    FROM achievements_unlocked
+                    WHERE guild_id=? AND user_id=?
+                    ORDER BY unlocked_at DESC
+                    LIMIT ?
+                    """,
+                    (guild_id, user_id, int(limit)),
+                )
             rows = await cur.fetchall()
             await cur.close()
+            if limit is not None:
+                rows.reverse()
             return [(str(r[0]), int(r[1]), str(r[2] or "")) for r in rows]
 
     async def leaderboard(self, guild_id: int, limit: int = 10) -> list[tuple[int, int]]:
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.ro() as db:
             cur = await db.execute(
                 """
                 SELECT user_id, COUNT(*) AS cnt
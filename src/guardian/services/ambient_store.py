@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import aiosqlite
 
+from ..database import SqlitePool
 from .base import BaseService
 
 
@@ -12,8 +13,8 @@ class AmbientStore(BaseService):
     Cooldowns/counters are enforced in-memory to avoid excessive writes.
     """
 
-    def __init__(self, sqlite_path: str, cache_ttl: int = 300) -> None:
-        super().__init__(sqlite_path, cache_ttl)
+    def __init__(self, database: SqlitePool | str, cache_ttl: int = 300) -> None:
+        super().__init__(database, cache_ttl)
 
     async def _create_tables(self, db: aiosqlite.Connection) -> None:
         await db.execute(
@@ -36,7 +37,7 @@ class AmbientStore(BaseService):
         return "SELECT * FROM ambient_prefs WHERE guild_id = ? AND user_id = ?"
 
     async def set_pings_opt_in(self, guild_id: int, user_id: int, enabled: bool) -> None:
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             await db.execute(
                 """
                 INSERT INTO ambient_prefs (guild_id, user_id, pings_opt_in)
@@ -49,7 +50,7 @@ class AmbientStore(BaseService):
             await db.commit()
 
     async def get_pings_opt_in(self, guild_id: int, user_id: int) -> bool:
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.ro() as db:
             async with db.execute(
                 "SELECT pings_opt_in FROM ambient_prefs WHERE guild_id=? AND user_id=?",
                 (int(guild_id), int(user_id)),
@@ -174,6 +174,36 @@ class APIWrapper:
             retry_after=retry_after
         )
     
+    async def call(
+        self,
+        operation: str,
+        func: Callable[..., Any],
+        *args,
+        guild_id: Optional[int] = None,
+        **kwargs
+    ) -> Any:
+        """Await ``func``, retrying transient failures, and re-raise the final error.
+
+        Only for idempotent edits/deletes: a create that hits a 5xx after the
+        server applied it would be duplicated. Callers already handle discord
+        exceptions, so non-retryable errors (Forbidden, NotFound, other 4xx)
+        are raised straight away without logging.
+        """
+        attempt = 0
+        while True:
+            try:
+                return await func(*args, **kwargs)
+            except Exception as error:
+                if not self._should_retry(error, attempt):
+                    raise
+                delay = self._get_backoff_delay(attempt, getattr(error, 'retry_after', None))
+                log.info(
+                    "API operation %s retrying in %.2fs (attempt %d/%d) guild=%s",
+                    operation, delay, attempt + 1, self.max_retries + 1, guild_id
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+    
     def get_error_summary(self) -> Dict[str, int]:
         """Get a summary of error counts for observability."""
         return dict(self._error_counts)
@@ -5,6 +5,7 @@ import logging
 from abc import ABC, abstractmethod
 from typing import Generic, TypeVar, Optional, Any
 
+from ..database import SqlitePool
 from .cache import TTLCache
 
 T = TypeVar("T")
@@ -14,14 +15,17 @@ log = logging.getLogger("guardian.base_service")
 class BaseService(ABC, Generic[T]):
     """Base class for all SQLite-backed services with caching."""
     
-    def __init__(self, sqlite_path: str, cache_ttl_seconds: int = 120) -> None:
-        self._path = sqlite_path
+    def __init__(self, database: SqlitePool | str, cache_ttl_seconds: int = 120) -> None:
+        # Stores built from a bare path get a private, unopened pool, which
+        # falls back to short-lived connections.
+        self._pool = database if isinstance(database, SqlitePool) else SqlitePool(database)
+        self._path = self._pool.path
         self._cache: TTLCache[int, T] = TTLCache(default_ttl_seconds=cache_ttl_seconds)
         self._logger = logging.getLogger(f"guardian.{self.__class__.__name__.lower()}")
     
     async def init(self) -> None:
         """Initialize the database schema."""
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             await self._create_tables(db)
             await db.commit()
     
@@ -41,8 +45,7 @@ class BaseService(ABC, Generic[T]):
         if cached is not None:
             return cached
         
-        async with aiosqlite.connect(self._path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._pool.ro() as db:
             async with db.execute(self._get_query, (key,)) as cur:
                 row = await cur.fetchone()
                 if row is None:
@@ -33,7 +33,7 @@ class BootstrapStateStore(BaseService):
         return row
 
     async def is_done(self, guild_id: int, key: str) -> bool:
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.ro() as db:
             async with db.execute(
                 "SELECT done FROM bootstrap_state WHERE guild_id=? AND key=?",
                 (int(guild_id), str(key)),
@@ -42,7 +42,7 @@ class BootstrapStateStore(BaseService):
         return bool(row[0]) if row else False
 
     async def mark_done(self, guild_id: int, key: str) -> None:
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             await db.execute(
                 """
                 INSERT INTO bootstrap_state (guild_id, key, done, updated_at)
@@ -3,6 +3,7 @@ from __future__ import annotations
 import aiosqlite
 from dataclasses import dataclass
 
+from ..database import SqlitePool
 from .base import BaseService
 
 
@@ -18,8 +19,8 @@ class Case:
 
 
 class CasesStore(BaseService):
-    def __init__(self, sqlite_path: str, cache_ttl: int = 300) -> None:
-        super().__init__(sqlite_path, cache_ttl)
+    def __init__(self, database: SqlitePool | str, cache_ttl: int = 300) -> None:
+        super().__init__(database, cache_ttl)
 
     async def _create_tables(self, db: aiosqlite.Connection) -> None:
         await db.execute(
@@ -54,7 +55,7 @@ class CasesStore(BaseService):
         return "SELECT * FROM cases WHERE guild_id = ? AND case_id = ?"
 
     async def next_id(self, guild_id: int) -> int:
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.ro() as db:
             async with db.execute(
                 "SELECT COALESCE(MAX(case_id), 0) + 1 FROM cases WHERE guild_id=?",
                 (int(guild_id),),
@@ -64,7 +65,7 @@ class CasesStore(BaseService):
 
     async def add(self, guild_id: int, user_id: int, actor_id: int, action: str, reason: str | None, created_at: int) -> int:
         cid = await self.next_id(guild_id)
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             await db.execute(
                 "INSERT INTO cases (guild_id, case_id, user_id, actor_id, action, reason, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
                 (int(guild_id), int(cid), int(user_id), int(actor_id), str(action), reason, int(created_at)),
@@ -73,7 +74,7 @@ class CasesStore(BaseService):
         return cid
 
     async def list_for_user(self, guild_id: int, user_id: int, limit: int = 10) -> list[Case]:
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.ro() as db:
             async with db.execute(
                 "SELECT case_id, actor_id, action, reason, created_at FROM cases WHERE guild_id=? AND user_id=? ORDER BY created_at DESC LIMIT ?",
                 (int(guild_id), int(user_id), int(limit)),
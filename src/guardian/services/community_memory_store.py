@@ -5,6 +5,7 @@ from dataclasses import dataclass
 import json
 from typing import Any, Sequence
 
+from ..database import SqlitePool
 from .base import BaseService
 
 
@@ -18,8 +19,8 @@ class MemoryEntry:
 
 
 class CommunityMemoryStore(BaseService):
-    def __init__(self, sqlite_path: str, cache_ttl: int = 300) -> None:
-        super().__init__(sqlite_path, cache_ttl)
+    def __init__(self, database: SqlitePool | str, cache_ttl: int = 300) -> None:
+        super().__init__(database, cache_ttl)
 
     async def _create_tables(self, db: aiosqlite.Connection) -> None:
         await db.execute(
@@ -56,7 +57,7 @@ class CommunityMemoryStore(BaseService):
         if not kind:
             raise ValueError("empty kind")
         payload = json.dumps(data or {}, ensure_ascii=False)[:4000]
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             cur = await db.execute(
                 "INSERT INTO community_memory (guild_id, kind, data_json) VALUES (?, ?, ?)",
                 (int(guild_id), kind, payload),
@@ -66,7 +67,7 @@ class CommunityMemoryStore(BaseService):
 
     async def latest(self, guild_id: int, limit: int = 10) -> Sequence[MemoryEntry]:
         limit = max(1, min(int(limit), 25))
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.ro() as db:
             cur = await db.execute(
                 "SELECT entry_id, guild_id, kind, ts, data_json FROM community_memory WHERE guild_id=? ORDER BY entry_id DESC LIMIT ?",
                 (int(guild_id), int(limit)),
@@ -86,7 +87,7 @@ class CommunityMemoryStore(BaseService):
         # SQLite strftime month/day from unix epoch in seconds.
         mm = f"{int(month):02d}"
         dd = f"{int(day):02d}"
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.ro() as db:
             cur = await db.execute(
                 """
                 SELECT entry_id, guild_id, kind, ts, data_json
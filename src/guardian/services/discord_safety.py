@@ -30,11 +30,18 @@ async def safe_send(
     ephemeral: bool = True,
     view: discord.ui.View | None = None,
 ) -> bool:
+    # Omit unset embed/view: discord.py rejects an explicit view=None.
+    kwargs: dict[str, Any] = {"content": content, "ephemeral": ephemeral}
+    if embed is not None:
+        kwargs["embed"] = embed
+    if view is not None:
+        kwargs["view"] = view
+    if interaction.response.is_done():
+        sender = interaction.followup.send
+    else:
+        sender = interaction.response.send_message
     try:
-        if not interaction.response.is_done():
-            await interaction.response.send_message(content=content, embed=embed, ephemeral=ephemeral, view=view)
-            return True
-        await interaction.followup.send(content=content, embed=embed, ephemeral=ephemeral, view=view)
+        await sender(**kwargs)
         return True
     except (discord.NotFound, discord.HTTPException):
         return False
@@ -31,7 +31,7 @@ class DriftVerifier:
     async def _run(self) -> None:
         while not self._stop.is_set():
             await asyncio.sleep(self.interval)
-            for guild in list(getattr(self.bot, "guilds", [])):
+            for guild in getattr(self.bot, "guilds", ()):
                 try:
                     schema = canonical_schema()
                     builder = SchemaBuilder(self.bot)
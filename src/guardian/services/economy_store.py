@@ -3,6 +3,7 @@ from __future__ import annotations
 import time
 import aiosqlite
 
+from ..database import SqlitePool
 from .base import BaseService
 
 
@@ -14,11 +15,11 @@ class EconomyStore(BaseService):
       - economy_ledger: immutable transaction history
     """
 
-    def __init__(self, sqlite_path: str, cache_ttl: int = 300) -> None:
-        super().__init__(sqlite_path, cache_ttl)
+    def __init__(self, database: SqlitePool | str, cache_ttl: int = 300) -> None:
+        super().__init__(database, cache_ttl)
 
     async def init(self) -> None:
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             await self._create_tables(db)
             await db.commit()
 
@@ -74,7 +75,7 @@ class EconomyStore(BaseService):
 
     async def get_wallet(self, guild_id: int, user_id: int) -> tuple[int, int, int, int, int]:
         """Returns (balance, daily_streak, daily_last_at, work_last_at, updated_at)."""
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             await self._ensure_row(db, guild_id, user_id)
             cur = await db.execute(
                 """
@@ -95,7 +96,7 @@ class EconomyStore(BaseService):
             return bal
 
         now = int(time.time())
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             await self._ensure_row(db, guild_id, user_id)
             await db.execute(
                 """
@@ -123,7 +124,7 @@ class EconomyStore(BaseService):
 
     async def set_daily_claim(self, guild_id: int, user_id: int, *, new_streak: int) -> None:
         now = int(time.time())
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             await self._ensure_row(db, guild_id, user_id)
             await db.execute(
                 """
@@ -137,7 +138,7 @@ class EconomyStore(BaseService):
 
     async def set_work_claim(self, guild_id: int, user_id: int) -> None:
         now = int(time.time())
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             await self._ensure_row(db, guild_id, user_id)
             await db.execute(
                 """
@@ -150,7 +151,7 @@ class EconomyStore(BaseService):
             await db.commit()
 
     async def top_balances(self, guild_id: int, limit: int = 10) -> list[tuple[int, int]]:
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.ro() as db:
             cur = await db.execute(
                 """
                 SELECT user_id, balance
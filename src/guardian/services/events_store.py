@@ -5,6 +5,7 @@ import aiosqlite
 from dataclasses import dataclass
 from typing import Sequence
 
+from ..database import SqlitePool
 from .base import BaseService
 
 log = logging.getLogger("guardian.events_store")
@@ -24,8 +25,8 @@ class Event:
 
 
 class EventsStore(BaseService):
-    def __init__(self, sqlite_path: str, cache_ttl: int = 300) -> None:
-        super().__init__(sqlite_path, cache_ttl)
+    def __init__(self, database: SqlitePool | str, cache_ttl: int = 300) -> None:
+        super().__init__(database, cache_ttl)
 
     async def _create_tables(self, db: aiosqlite.Connection) -> None:
         await db.execute(
@@ -74,12 +75,12 @@ class EventsStore(BaseService):
         return "SELECT * FROM events WHERE event_id = ?"
 
     async def init(self) -> None:
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             await self._create_tables(db)
             await db.commit()
 
     async def active_count(self, guild_id: int) -> int:
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.ro() as db:
             cur = await db.execute("SELECT COUNT(1) FROM events WHERE guild_id=? AND active=1", (int(guild_id),))
             row = await cur.fetchone()
             return int(row[0] or 0)
@@ -98,7 +99,7 @@ class EventsStore(BaseService):
         description = (description or "").strip()[:700]
         if not title:
             raise ValueError("empty title")
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             cur = await db.execute(
                 "INSERT INTO events (guild_id, creator_id, title, description, start_ts, channel_id) VALUES (?, ?, ?, ?, ?, ?)",
                 (int(guild_id), int(creator_id), title, description, int(start_ts), int(channel_id)),
@@ -107,7 +108,7 @@ class EventsStore(BaseService):
             return int(cur.lastrowid)
 
     async def get(self, guild_id: int, event_id: int) -> Event | None:
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.ro() as db:
             cur = await db.execute(
                 "SELECT event_id, guild_id, creator_id, title, description, start_ts, channel_id, created_at, active FROM events WHERE guild_id=? AND event_id=?",
                 (int(guild_id), int(event_id)),
@@ -119,7 +120,7 @@ class EventsStore(BaseService):
 
     async def list_active(self, guild_id: int, limit: int = 10) -> Sequence[Event]:
         limit = max(1, min(int(limit), 25))
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.ro() as db:
             cur = await db.execute(
                 "SELECT event_id, guild_id, creator_id, title, description, start_ts, channel_id, created_at, active FROM events WHERE guild_id=? AND active=1 ORDER BY start_ts ASC LIMIT ?",
                 (int(guild_id), int(limit)),
@@ -128,12 +129,12 @@ class EventsStore(BaseService):
             return [Event(int(r[0]), int(r[1]), int(r[2]), str(r[3]), str(r[4]), int(r[5]), int(r[6]), int(r[7]), bool(int(r[8]))) for r in rows]
 
     async def set_active(self, guild_id: int, event_id: int, active: bool) -> None:
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             await db.execute("UPDATE events SET active=? WHERE guild_id=? AND event_id=?", (1 if active else 0, int(guild_id), int(event_id)))
             await db.commit()
 
     async def join(self, guild_id: int, event_id: int, user_id: int) -> bool:
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             try:
                 cur = await db.execute(
                     "INSERT OR IGNORE INTO event_participants (event_id, guild_id, user_id) VALUES (?, ?, ?)",
@@ -146,7 +147,7 @@ class EventsStore(BaseService):
                 return False
 
     async def leave(self, guild_id: int, event_id: int, user_id: int) -> bool:
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             cur = await db.execute(
                 "DELETE FROM event_participants WHERE event_id=? AND guild_id=? AND user_id=?",
                 (int(event_id), int(guild_id), int(user_id)),
@@ -155,7 +156,7 @@ class EventsStore(BaseService):
             return (cur.rowcount or 0) > 0
 
     async def participants_count(self, guild_id: int, event_id: int) -> int:
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.ro() as db:
             cur = await db.execute(
                 "SELECT COUNT(1) FROM event_participants WHERE guild_id=? AND event_id=?",
                 (int(guild_id), int(event_id)),
@@ -3,12 +3,13 @@ from __future__ import annotations
 import aiosqlite
 import json
 
+from ..database import SqlitePool
 from .base import BaseService
 
 
 class GiveawaysStore(BaseService):
-    def __init__(self, sqlite_path: str, cache_ttl: int = 300) -> None:
-        super().__init__(sqlite_path, cache_ttl)
+    def __init__(self, database: SqlitePool | str, cache_ttl: int = 300) -> None:
+        super().__init__(database, cache_ttl)
 
     async def _create_tables(self, db: aiosqlite.Connection) -> None:
         await db.execute(
@@ -37,7 +38,7 @@ class GiveawaysStore(BaseService):
         return "SELECT * FROM giveaways WHERE guild_id = ? AND message_id = ?"
 
     async def create(self, guild_id: int, channel_id: int, message_id: int, ends_ts: int, winners: int, prize: str) -> None:
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             await db.execute(
                 "INSERT OR REPLACE INTO giveaways (guild_id, channel_id, message_id, ends_ts, winners, prize, entries_json, ended) "
                 "VALUES (?, ?, ?, ?, ?, ?, '[]', 0)",
@@ -46,7 +47,7 @@ class GiveawaysStore(BaseService):
             await db.commit()
 
     async def add_entry(self, guild_id: int, message_id: int, user_id: int) -> int:
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             async with db.execute(
                 "SELECT entries_json FROM giveaways WHERE guild_id=? AND message_id=?",
                 (int(guild_id), int(message_id)),
@@ -66,7 +67,7 @@ class GiveawaysStore(BaseService):
         return len(entries)
 
     async def remove_entry(self, guild_id: int, message_id: int, user_id: int) -> int:
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             async with db.execute(
                 "SELECT entries_json FROM giveaways WHERE guild_id=? AND message_id=?",
                 (int(guild_id), int(message_id)),
@@ -86,7 +87,7 @@ class GiveawaysStore(BaseService):
         return len(entries)
 
     async def due(self, now_ts: int, limit: int = 20):
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.ro() as db:
             async with db.execute(
                 "SELECT guild_id, channel_id, message_id, ends_ts, winners, prize, entries_json FROM giveaways "
                 "WHERE ended=0 AND ends_ts <= ? ORDER BY ends_ts ASC LIMIT ?",
@@ -95,7 +96,7 @@ class GiveawaysStore(BaseService):
                 return await cur.fetchall()
 
     async def list_open(self, limit: int = 200):
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.ro() as db:
             async with db.execute(
                 "SELECT guild_id, message_id FROM giveaways WHERE ended=0 ORDER BY ends_ts ASC LIMIT ?",
                 (int(limit),),
@@ -103,7 +104,7 @@ class GiveawaysStore(BaseService):
                 return await cur.fetchall()
 
     async def mark_ended(self, guild_id: int, message_id: int) -> None:
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             await db.execute(
                 "UPDATE giveaways SET ended=1 WHERE guild_id=? AND message_id=?",
                 (int(guild_id), int(message_id)),
@@ -1,14 +1,33 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+from contextlib import suppress
+
 import discord
 
 log = logging.getLogger("guardian.guild_logger")
 
+# Discord rejects message content over 2000 characters.
+_MAX_MESSAGE_LEN = 2000
+_MAX_QUEUED_PER_CHANNEL = 500
+
 
 class GuildLogger:
+    """Posts log lines to guild channels.
+
+    Lines are queued per channel and drained by a background worker that
+    joins whatever is already waiting into one message, so a burst of
+    events costs a handful of requests instead of one per event. The
+    worker never waits for more lines to arrive before sending, and it
+    exits once its queue is empty.
+    """
+
     def __init__(self, bot: discord.Client) -> None:
         self._bot = bot
+        self._queues: dict[int, asyncio.Queue[str]] = {}
+        self._workers: dict[int, asyncio.Task[None]] = {}
+        self.dropped = 0
 
     async def send(self, guild: discord.Guild, channel_id: int | None, message: str) -> None:
         if not channel_id:
@@ -16,7 +35,64 @@ class GuildLogger:
         channel = guild.get_channel(channel_id)
         if not isinstance(channel, discord.TextChannel):
             return
+
+        queue = self._queues.get(channel_id)
+        if queue is None:
+            queue = self._queues[channel_id] = asyncio.Queue(maxsize=_MAX_QUEUED_PER_CHANNEL)
         try:
-            await channel.send(message)
-        except discord.HTTPException:
-            log.exception("Failed to send guild log message")
+            queue.put_nowait(message[:_MAX_MESSAGE_LEN])
+        except asyncio.QueueFull:
+            self.dropped += 1
+            log.warning("Guild log queue full for channel %s; dropped %d so far", channel_id, self.dropped)
+            return
+
+        worker = self._workers.get(channel_id)
+        if worker is None or worker.done():
+            self._workers[channel_id] = asyncio.create_task(
+                self._flush_worker(channel, queue), name=f"guild-logger-{channel_id}"
+            )
+
+    async def _flush_worker(self, channel: discord.TextChannel, queue: asyncio.Queue[str]) -> None:
+        carry: str | None = None
+        # Exit once the queue is drained; send() starts a new worker when
+        # the next line arrives.
+        while carry is not None or not queue.empty():
+            first = carry if carry is not None else queue.get_nowait()
+            carry = None
+            batch = [first]
+            size = len(first)
+            # Only coalesce lines that are already queued; a line that would
+            # overflow the message starts the next batch.
+            while not queue.empty():
+                line = queue.get_nowait()
+                if size + 1 + len(line) > _MAX_MESSAGE_LEN:
+                    carry = line
+                    break
+                batch.append(line)
+                size += 1 + len(line)
+            try:
+                await channel.send("\n".join(batch))
+            except (discord.NotFound, discord.Forbidden):
+                # The channel is gone or closed to us; every later send would
+                # fail the same way, so drop what is queued for it.
+                log.warning("Guild log channel %s is unavailable; dropping its queued lines", channel.id)
+                break
+            except discord.HTTPException:
+                log.exception("Failed to send guild log message")
+        self._forget(channel.id, queue)
+
+    def _forget(self, channel_id: int, queue: asyncio.Queue[str]) -> None:
+        # A later send() may already have replaced this queue; leave that one.
+        if self._queues.get(channel_id) is queue:
+            del self._queues[channel_id]
+            self._workers.pop(channel_id, None)
+
+    async def close(self) -> None:
+        workers = list(self._workers.values())
+        self._workers.clear()
+        self._queues.clear()
+        for task in workers:
+            task.cancel()
+        for task in workers:
+            with suppress(asyncio.CancelledError, Exception):
+                await task
@@ -59,7 +59,7 @@ class GuildStore(BaseService[GuildConfig]):
         return "SELECT * FROM guild_config WHERE guild_id = ?"
 
     async def init(self) -> None:
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             await self._create_tables(db)
 
             # Best-effort migrations for older databases
@@ -88,7 +88,7 @@ class GuildStore(BaseService[GuildConfig]):
         if cached:
             return cached
 
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.ro() as db:
             async with db.execute(self._get_query, (guild_id,)) as cur:
                 row = await cur.fetchone()
 
@@ -110,7 +110,7 @@ class GuildStore(BaseService[GuildConfig]):
         return cfg
 
     async def upsert(self, cfg: GuildConfig) -> None:
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             await db.execute(
                 """
                 INSERT INTO guild_config (
@@ -2,12 +2,13 @@ from __future__ import annotations
 
 import aiosqlite
 
+from ..database import SqlitePool
 from .base import BaseService
 
 
 class LevelRewardsStore(BaseService):
-    def __init__(self, sqlite_path: str, cache_ttl: int = 300) -> None:
-        super().__init__(sqlite_path, cache_ttl)
+    def __init__(self, database: SqlitePool | str, cache_ttl: int = 300) -> None:
+        super().__init__(database, cache_ttl)
 
     async def _create_tables(self, db: aiosqlite.Connection) -> None:
         await db.execute(
@@ -31,7 +32,7 @@ class LevelRewardsStore(BaseService):
         return "SELECT * FROM level_rewards WHERE guild_id = ? AND level = ?"
 
     async def add(self, guild_id: int, level: int, role_id: int) -> None:
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             await db.execute(
                 "INSERT OR IGNORE INTO level_rewards (guild_id, level, role_id) VALUES (?, ?, ?)",
                 (int(guild_id), int(level), int(role_id)),
@@ -39,7 +40,7 @@ class LevelRewardsStore(BaseService):
             await db.commit()
 
     async def remove(self, guild_id: int, level: int, role_id: int) -> None:
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             await db.execute(
                 "DELETE FROM level_rewards WHERE guild_id=? AND level=? AND role_id=?",
                 (int(guild_id), int(level), int(role_id)),
@@ -47,7 +48,7 @@ class LevelRewardsStore(BaseService):
             await db.commit()
 
     async def list(self, guild_id: int) -> list[tuple[int, int]]:
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.ro() as db:
             async with db.execute(
                 "SELECT level, role_id FROM level_rewards WHERE guild_id=? ORDER BY level ASC",
                 (int(guild_id),),
@@ -56,7 +57,7 @@ class LevelRewardsStore(BaseService):
         return [(int(lvl), int(rid)) for (lvl, rid) in rows]
 
     async def roles_for_level(self, guild_id: int, level: int) -> list[int]:
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.ro() as db:
             async with db.execute(
                 "SELECT role_id FROM level_rewards WHERE guild_id=? AND level=?",
                 (int(guild_id), int(level)),
@@ -3,6 +3,7 @@ from __future__ import annotations
 import aiosqlite
 from dataclasses import dataclass
 
+from ..database import SqlitePool
 from .base import BaseService
 
 
@@ -19,8 +20,8 @@ class LevelsConfig:
 
 
 class LevelsConfigStore(BaseService):
-    def __init__(self, sqlite_path: str, cache_ttl: int = 300) -> None:
-        super().__init__(sqlite_path, cache_ttl)
+    def __init__(self, database: SqlitePool | str, cache_ttl: int = 300) -> None:
+        super().__init__(database, cache_ttl)
 
     async def _create_tables(self, db: aiosqlite.Connection) -> None:
         await db.execute(
@@ -47,7 +48,12 @@ class LevelsConfigStore(BaseService):
         return "SELECT * FROM levels_config WHERE guild_id = ?"
 
     async def get(self, guild_id: int) -> LevelsConfig:
-        async with aiosqlite.connect(self._path) as db:
+        # Read on every XP-eligible message, so serve it from the TTL cache.
+        cached = self._cache.get(guild_id)
+        if cached:
+            return cached
+
+        async with self._pool.ro() as db:
             async with db.execute(
                 """
                 SELECT enabled, announce, xp_min, xp_max, cooldown_seconds, daily_cap, ignore_channels_json
@@ -62,7 +68,7 @@ class LevelsConfigStore(BaseService):
             await self.upsert(cfg)
             return cfg
 
-        return LevelsConfig(
+        cfg = LevelsConfig(
             guild_id=int(guild_id),
             enabled=bool(row[0]),
             announce=bool(row[1]),
@@ -72,9 +78,11 @@ class LevelsConfigStore(BaseService):
             daily_cap=int(row[5]),
             ignore_channels_json=str(row[6] or "[]"),
         )
+        self._cache.set(guild_id, cfg)
+        return cfg
 
     async def upsert(self, cfg: LevelsConfig) -> None:
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             await db.execute(
                 """
                 INSERT INTO levels_config (guild_id, enabled, announce, xp_min, xp_max, cooldown_seconds, daily_cap, ignore_channels_json)
@@ -100,3 +108,5 @@ class LevelsConfigStore(BaseService):
                 ),
             )
             await db.commit()
+
+        self._cache.set(cfg.guild_id, cfg)
@@ -1,15 +1,28 @@
 from __future__ import annotations
 
-from datetime import date
+import time
+from datetime import date, datetime, timedelta
 
 import aiosqlite
 
+from ..database import SqlitePool
 from .base import BaseService
 
 
 class LevelsLedgerStore(BaseService):
-    def __init__(self, sqlite_path: str, cache_ttl: int = 300) -> None:
-        super().__init__(sqlite_path, cache_ttl)
+    def __init__(self, database: SqlitePool | str, cache_ttl: int = 300) -> None:
+        super().__init__(database, cache_ttl)
+        # Today's ledger key and the timestamp of the next local midnight; the
+        # key is only reformatted when the day rolls over.
+        self._day_key = ""
+        self._day_rollover = 0.0
+
+    def _today(self) -> str:
+        if time.time() >= self._day_rollover:
+            today = date.today()
+            self._day_key = today.isoformat()
+            self._day_rollover = datetime.combine(today + timedelta(days=1), datetime.min.time()).timestamp()
+        return self._day_key
 
     async def _create_tables(self, db: aiosqlite.Connection) -> None:
         await db.execute(
@@ -34,8 +47,8 @@ class LevelsLedgerStore(BaseService):
         return "SELECT * FROM xp_ledger WHERE guild_id = ? AND user_id = ? AND day = ?"
 
     async def add_for_today(self, guild_id: int, user_id: int, amount: int) -> int:
-        today = date.today().isoformat()
-        async with aiosqlite.connect(self._path) as db:
+        today = self._today()
+        async with self._pool.rw() as db:
             async with db.execute(
                 "SELECT xp FROM xp_ledger WHERE guild_id=? AND user_id=? AND day=?",
                 (int(guild_id), int(user_id), today),
@@ -55,8 +68,8 @@ class LevelsLedgerStore(BaseService):
         return int(new_xp)
 
     async def get_for_today(self, guild_id: int, user_id: int) -> int:
-        today = date.today().isoformat()
-        async with aiosqlite.connect(self._path) as db:
+        today = self._today()
+        async with self._pool.ro() as db:
             async with db.execute(
                 "SELECT xp FROM xp_ledger WHERE guild_id=? AND user_id=? AND day=?",
                 (int(guild_id), int(user_id), today),
@@ -65,7 +78,7 @@ class LevelsLedgerStore(BaseService):
         return int(row[0]) if row else 0
 
     async def top_week(self, guild_id: int, limit: int = 10) -> list[tuple[int, int]]:
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.ro() as db:
             async with db.execute(
                 """
                 SELECT user_id, SUM(xp) AS total
@@ -2,12 +2,13 @@ from __future__ import annotations
 
 import aiosqlite
 
+from ..database import SqlitePool
 from .base import BaseService
 
 
 class LevelsStore(BaseService):
-    def __init__(self, sqlite_path: str, cache_ttl: int = 300) -> None:
-        super().__init__(sqlite_path, cache_ttl)
+    def __init__(self, database: SqlitePool | str, cache_ttl: int = 300) -> None:
+        super().__init__(database, cache_ttl)
 
     async def _create_tables(self, db: aiosqlite.Connection) -> None:
         await db.execute(
@@ -53,7 +54,7 @@ class LevelsStore(BaseService):
 
     async def add_xp(self, guild_id: int, user_id: int, amount: int) -> tuple[int, int, bool]:
         amount = max(0, int(amount))
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             async with db.execute(
                 "SELECT total_xp, xp, level FROM levels WHERE guild_id=? AND user_id=?",
                 (int(guild_id), int(user_id)),
@@ -85,7 +86,7 @@ class LevelsStore(BaseService):
         return int(xp), int(level), bool(leveled)
 
     async def get(self, guild_id: int, user_id: int) -> tuple[int, int, int]:
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.ro() as db:
             async with db.execute(
                 "SELECT total_xp, xp, level FROM levels WHERE guild_id=? AND user_id=?",
                 (int(guild_id), int(user_id)),
@@ -94,7 +95,7 @@ class LevelsStore(BaseService):
         return (int(row[0]), int(row[1]), int(row[2])) if row else (0, 0, 0)
 
     async def reset_user(self, guild_id: int, user_id: int) -> None:
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             await db.execute(
                 "DELETE FROM levels WHERE guild_id=? AND user_id=?",
                 (int(guild_id), int(user_id)),
@@ -102,12 +103,12 @@ class LevelsStore(BaseService):
             await db.commit()
 
     async def reset_guild(self, guild_id: int) -> None:
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             await db.execute("DELETE FROM levels WHERE guild_id=?", (int(guild_id),))
             await db.commit()
 
     async def leaderboard(self, guild_id: int, limit: int = 10) -> list[tuple[int, int, int]]:
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.ro() as db:
             async with db.execute(
                 """
                 SELECT user_id, level, total_xp
@@ -123,7 +124,7 @@ class LevelsStore(BaseService):
 
     async def set_role_reward(self, guild_id: int, level: int, role_id: int) -> None:
         """Set a role reward for reaching a specific level."""
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             await db.execute(
                 """
                 INSERT OR REPLACE INTO level_role_rewards (guild_id, level, role_id)
@@ -135,7 +136,7 @@ class LevelsStore(BaseService):
 
     async def get_role_rewards(self, guild_id: int) -> dict[int, int]:
         """Get all role rewards for a guild."""
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.ro() as db:
             async with db.execute(
                 "SELECT level, role_id FROM level_role_rewards WHERE guild_id=?",
                 (int(guild_id),)
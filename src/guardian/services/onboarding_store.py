@@ -3,6 +3,7 @@ from __future__ import annotations
 import aiosqlite
 from dataclasses import dataclass
 
+from ..database import SqlitePool
 from .base import BaseService
 
 
@@ -17,8 +18,8 @@ class OnboardingState:
 
 
 class OnboardingStore(BaseService):
-    def __init__(self, sqlite_path: str, cache_ttl: int = 300) -> None:
-        super().__init__(sqlite_path, cache_ttl)
+    def __init__(self, database: SqlitePool | str, cache_ttl: int = 300) -> None:
+        super().__init__(database, cache_ttl)
 
     async def _create_tables(self, db: aiosqlite.Connection) -> None:
         await db.execute(
@@ -50,7 +51,7 @@ class OnboardingStore(BaseService):
         return "SELECT * FROM onboarding WHERE guild_id = ? AND user_id = ?"
 
     async def get(self, guild_id: int, user_id: int) -> OnboardingState:
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.ro() as db:
             async with db.execute(
                 "SELECT step, language, interests_json, completed FROM onboarding WHERE guild_id=? AND user_id=?",
                 (int(guild_id), int(user_id)),
@@ -63,7 +64,7 @@ class OnboardingStore(BaseService):
         return OnboardingState(int(guild_id), int(user_id), int(row[0]), row[1], row[2], bool(row[3]))
 
     async def upsert(self, st: OnboardingState) -> None:
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             await db.execute(
                 """
                 INSERT INTO onboarding (guild_id, user_id, step, language, interests_json, completed)
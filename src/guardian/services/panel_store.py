@@ -5,6 +5,7 @@ from datetime import datetime
 from typing import Optional, List, Dict, Any
 import logging
 
+from ..database import SqlitePool
 from .base import BaseService
 from ..interfaces import PanelStore as PanelStoreProtocol, validate_panel_store, DatabaseSafety
 
@@ -50,8 +51,8 @@ class PanelRecord:
 class PanelStore(BaseService[PanelRecord]):
     """SQLite storage for persistent UI panels."""
     
-    def __init__(self, db_path: str):
-        super().__init__(db_path, cache_ttl_seconds=300)  # 5 minutes cache
+    def __init__(self, database: SqlitePool | str):
+        super().__init__(database, cache_ttl_seconds=300)  # 5 minutes cache
         
         # Validate interface compliance at runtime
         validate_panel_store(self)
@@ -73,9 +74,7 @@ class PanelStore(BaseService[PanelRecord]):
     async def _execute(self, sql: str, params: tuple = ()) -> None:
         """Execute SQL with parameters and commit."""
         async def _db_op():
-            async with aiosqlite.connect(self._path) as db:
-                await db.execute("PRAGMA journal_mode=WAL")
-                await db.execute("PRAGMA foreign_keys=ON")
+            async with self._pool.rw() as db:
                 await db.execute(sql, params)
                 await db.commit()
         
@@ -83,13 +82,13 @@ class PanelStore(BaseService[PanelRecord]):
     
     async def _fetchone(self, sql: str, params: tuple = ()) -> Optional[tuple]:
         """Execute SQL and fetch one row."""
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.ro() as db:
             cursor = await db.execute(sql, params)
             return await cursor.fetchone()
     
     async def _fetchall(self, sql: str, params: tuple = ()) -> List[tuple]:
         """Execute SQL and fetch all rows."""
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.ro() as db:
             cursor = await db.execute(sql, params)
             return await cursor.fetchall()
     
@@ -135,8 +134,7 @@ class PanelStore(BaseService[PanelRecord]):
         if cached is not None:
             return cached.to_dict()
         
-        async with aiosqlite.connect(self._path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._pool.ro() as db:
             cur = await db.execute(self._get_query(), (guild_id, panel_key))
             row = await cur.fetchone()
             await cur.close()
@@ -155,8 +153,7 @@ class PanelStore(BaseService[PanelRecord]):
     
     async def list_guild_panels(self, guild_id: int) -> List[PanelRecord]:
         """List all panels for a guild."""
-        async with aiosqlite.connect(self._path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._pool.ro() as db:
             cur = await db.execute("SELECT * FROM panels WHERE guild_id = ?", (guild_id,))
             rows = await cur.fetchall()
             await cur.close()
@@ -164,8 +161,7 @@ class PanelStore(BaseService[PanelRecord]):
     
     async def list_all_panels(self) -> List[PanelRecord]:
         """List all panels across all guilds."""
-        async with aiosqlite.connect(self._path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._pool.ro() as db:
             cur = await db.execute("SELECT * FROM panels")
             rows = await cur.fetchall()
             await cur.close()
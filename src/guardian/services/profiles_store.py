@@ -4,6 +4,7 @@ import aiosqlite
 from dataclasses import dataclass
 from typing import Iterable
 
+from ..database import SqlitePool
 from .base import BaseService
 
 
@@ -18,8 +19,8 @@ class Profile:
 
 
 class ProfilesStore(BaseService):
-    def __init__(self, sqlite_path: str, cache_ttl: int = 300) -> None:
-        super().__init__(sqlite_path, cache_ttl)
+    def __init__(self, database: SqlitePool | str, cache_ttl: int = 300) -> None:
+        super().__init__(database, cache_ttl)
 
     async def _create_tables(self, db: aiosqlite.Connection) -> None:
         await db.execute(
@@ -87,7 +88,7 @@ class ProfilesStore(BaseService):
         return ", ".join(cleaned)
 
     async def get(self, guild_id: int, user_id: int) -> Profile:
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.ro() as db:
             cur = await db.execute(
                 "SELECT about, pronouns, interests, is_public FROM profiles WHERE guild_id=? AND user_id=?",
                 (int(guild_id), int(user_id)),
@@ -122,7 +123,7 @@ class ProfilesStore(BaseService):
         interests_v = current.interests if interests is None else interests
         is_public_v = current.is_public if is_public is None else bool(is_public)
 
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             await db.execute(
                 """
                 INSERT INTO profiles (guild_id, user_id, about, pronouns, interests, is_public, updated_at)
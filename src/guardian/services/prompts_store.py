@@ -4,6 +4,7 @@ import aiosqlite
 from dataclasses import dataclass
 from typing import Sequence
 
+from ..database import SqlitePool
 from .base import BaseService
 
 
@@ -27,8 +28,8 @@ class PromptAnswer:
 
 
 class PromptsStore(BaseService):
-    def __init__(self, sqlite_path: str, cache_ttl: int = 300) -> None:
-        super().__init__(sqlite_path, cache_ttl)
+    def __init__(self, database: SqlitePool | str, cache_ttl: int = 300) -> None:
+        super().__init__(database, cache_ttl)
 
     async def _create_tables(self, db: aiosqlite.Connection) -> None:
         await db.execute(
@@ -68,7 +69,7 @@ class PromptsStore(BaseService):
         text = (text or "").strip()[:700]
         if not text:
             raise ValueError("empty prompt")
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             cur = await db.execute(
                 "INSERT INTO prompts (guild_id, author_id, text) VALUES (?, ?, ?)",
                 (int(guild_id), int(author_id), text),
@@ -80,7 +81,7 @@ class PromptsStore(BaseService):
         text = (text or "").strip()[:700]
         if not text:
             raise ValueError("empty answer")
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             cur = await db.execute(
                 "INSERT INTO prompt_answers (prompt_id, guild_id, author_id, text) VALUES (?, ?, ?, ?)",
                 (int(prompt_id), int(guild_id), int(author_id), text),
@@ -89,7 +90,7 @@ class PromptsStore(BaseService):
             return int(cur.lastrowid)
 
     async def get_current(self, guild_id: int) -> Prompt | None:
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.ro() as db:
             cur = await db.execute(
                 "SELECT prompt_id, guild_id, author_id, text, created_at FROM prompts WHERE guild_id=? ORDER BY prompt_id DESC LIMIT 1",
                 (int(guild_id),),
@@ -101,7 +102,7 @@ class PromptsStore(BaseService):
 
     async def history(self, guild_id: int, limit: int = 10) -> Sequence[Prompt]:
         limit = max(1, min(int(limit), 25))
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.ro() as db:
             cur = await db.execute(
                 "SELECT prompt_id, guild_id, author_id, text, created_at FROM prompts WHERE guild_id=? ORDER BY prompt_id DESC LIMIT ?",
                 (int(guild_id), int(limit)),
@@ -111,7 +112,7 @@ class PromptsStore(BaseService):
 
     async def answers_for(self, guild_id: int, prompt_id: int, limit: int = 20) -> Sequence[PromptAnswer]:
         limit = max(1, min(int(limit), 50))
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.ro() as db:
             cur = await db.execute(
                 "SELECT answer_id, prompt_id, guild_id, author_id, text, created_at FROM prompt_answers WHERE guild_id=? AND prompt_id=? ORDER BY answer_id ASC LIMIT ?",
                 (int(guild_id), int(prompt_id), int(limit)),
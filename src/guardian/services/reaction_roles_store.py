@@ -5,6 +5,7 @@ import logging
 from typing import List, Optional, Dict, Any
 from dataclasses import dataclass
 
+from ..database import SqlitePool
 from .base import BaseService
 
 log = logging.getLogger("guardian.reaction_roles_store")
@@ -22,8 +23,8 @@ class ReactionRoleConfig:
 class ReactionRolesStore(BaseService[ReactionRoleConfig]):
     """Store for reaction roles configuration."""
     
-    def __init__(self, sqlite_path: str, cache_ttl_seconds: int = 300) -> None:
-        super().__init__(sqlite_path, cache_ttl_seconds)
+    def __init__(self, database: SqlitePool | str, cache_ttl_seconds: int = 300) -> None:
+        super().__init__(database, cache_ttl_seconds)
 
     async def _create_tables(self, db: aiosqlite.Connection) -> None:
         """Create reaction roles configuration table."""
@@ -65,7 +66,7 @@ class ReactionRolesStore(BaseService[ReactionRoleConfig]):
         """Add multiple roles to configuration."""
         errors = []
         
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             # Get current max order_index for this guild
             cursor = await db.execute(
                 "SELECT COALESCE(MAX(order_index), -1) as max_order FROM reaction_roles_config WHERE guild_id = ?",
@@ -102,7 +103,7 @@ class ReactionRolesStore(BaseService[ReactionRoleConfig]):
         """Remove roles from configuration."""
         errors = []
         
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             for role_id in role_ids:
                 try:
                     await db.execute(
@@ -119,7 +120,7 @@ class ReactionRolesStore(BaseService[ReactionRoleConfig]):
     async def set_enabled(self, guild_id: int, role_id: int, enabled: bool) -> bool:
         """Toggle role enabled status."""
         try:
-            async with aiosqlite.connect(self._path) as db:
+            async with self._pool.rw() as db:
                 await db.execute(
                     "UPDATE reaction_roles_config SET enabled = ? WHERE guild_id = ? AND role_id = ?",
                     (int(enabled), guild_id, role_id)
@@ -133,7 +134,7 @@ class ReactionRolesStore(BaseService[ReactionRoleConfig]):
     async def set_group(self, guild_id: int, role_id: int, group_key: str) -> bool:
         """Change role group."""
         try:
-            async with aiosqlite.connect(self._path) as db:
+            async with self._pool.rw() as db:
                 await db.execute(
                     "UPDATE reaction_roles_config SET group_key = ? WHERE guild_id = ? AND role_id = ?",
                     (group_key, guild_id, role_id)
@@ -147,7 +148,7 @@ class ReactionRolesStore(BaseService[ReactionRoleConfig]):
     async def set_label(self, guild_id: int, role_id: int, label: Optional[str]) -> bool:
         """Set role label."""
         try:
-            async with aiosqlite.connect(self._path) as db:
+            async with self._pool.rw() as db:
                 await db.execute(
                     "UPDATE reaction_roles_config SET label = ? WHERE guild_id = ? AND role_id = ?",
                     (label, guild_id, role_id)
@@ -161,7 +162,7 @@ class ReactionRolesStore(BaseService[ReactionRoleConfig]):
     async def set_emoji(self, guild_id: int, role_id: int, emoji: Optional[str]) -> bool:
         """Set role emoji."""
         try:
-            async with aiosqlite.connect(self._path) as db:
+            async with self._pool.rw() as db:
                 await db.execute(
                     "UPDATE reaction_roles_config SET emoji = ? WHERE guild_id = ? AND role_id = ?",
                     (emoji, guild_id, role_id)
@@ -175,7 +176,7 @@ class ReactionRolesStore(BaseService[ReactionRoleConfig]):
     async def move_role(self, guild_id: int, role_id: int, direction: str) -> bool:
         """Move role up or down in order."""
         try:
-            async with aiosqlite.connect(self._path) as db:
+            async with self._pool.rw() as db:
                 # Get current role and adjacent role
                 cursor = await db.execute(
                     """
@@ -220,7 +221,7 @@ class ReactionRolesStore(BaseService[ReactionRoleConfig]):
 
     async def list_roles(self, guild_id: int) -> List[ReactionRoleConfig]:
         """List all configured roles for a guild."""
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.ro() as db:
             async with db.execute(
                 """
                 SELECT * FROM reaction_roles_config 
@@ -234,7 +235,7 @@ class ReactionRolesStore(BaseService[ReactionRoleConfig]):
 
     async def list_group(self, guild_id: int, group_key: str) -> List[ReactionRoleConfig]:
         """List roles in a specific group."""
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.ro() as db:
             async with db.execute(
                 """
                 SELECT * FROM reaction_roles_config 
@@ -248,7 +249,7 @@ class ReactionRolesStore(BaseService[ReactionRoleConfig]):
 
     async def get_groups(self, guild_id: int) -> List[str]:
         """Get all group keys for a guild."""
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.ro() as db:
             async with db.execute(
                 "SELECT DISTINCT group_key FROM reaction_roles_config WHERE guild_id = ? ORDER BY group_key",
                 (guild_id,)
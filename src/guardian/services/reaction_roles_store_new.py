@@ -4,6 +4,7 @@ import aiosqlite
 import logging
 from typing import List, Dict, Any
 
+from ..database import SqlitePool
 from .base import BaseService
 
 log = logging.getLogger("guardian.reaction_roles_store")
@@ -25,8 +26,8 @@ class ReactionRolesStore(BaseService[dict]):
         # Minimal conversion; not used by this store.
         return dict(row)
     
-    def __init__(self, sqlite_path: str, cache_ttl_seconds: int = 300) -> None:
-        super().__init__(sqlite_path, cache_ttl_seconds)
+    def __init__(self, database: SqlitePool | str, cache_ttl_seconds: int = 300) -> None:
+        super().__init__(database, cache_ttl_seconds)
 
     async def _create_tables(self, db: aiosqlite.Connection) -> None:
         """Create reaction roles configuration table."""
@@ -46,7 +47,7 @@ class ReactionRolesStore(BaseService[dict]):
 
     async def init(self):
         """Initialize database schema."""
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             await self._create_tables(db)
             await db.commit()
         log.info("ReactionRolesStore initialized")
@@ -55,7 +56,7 @@ class ReactionRolesStore(BaseService[dict]):
         """Add multiple roles to a group with detailed feedback."""
         results = {"added": [], "skipped": [], "errors": []}
         
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             for role_id in role_ids:
                 try:
                     await db.execute(
@@ -74,7 +75,7 @@ class ReactionRolesStore(BaseService[dict]):
         """Remove multiple roles with detailed feedback."""
         results = {"removed": [], "errors": []}
         
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             for role_id in role_ids:
                 try:
                     cursor = await db.execute(
@@ -94,7 +95,7 @@ class ReactionRolesStore(BaseService[dict]):
 
     async def get_roles_by_group(self, guild_id: int, group_key: str) -> List[int]:
         """Get all role IDs in a specific group."""
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.ro() as db:
             async with db.execute(
                 "SELECT role_id FROM reaction_roles_config WHERE guild_id = ? AND group_key = ? AND enabled = 1 ORDER BY role_id",
                 (guild_id, group_key)
@@ -104,7 +105,7 @@ class ReactionRolesStore(BaseService[dict]):
 
     async def get_all_roles(self, guild_id: int) -> Dict[str, List[int]]:
         """Get all roles grouped by group."""
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.ro() as db:
             async with db.execute(
                 "SELECT group_key, role_id FROM reaction_roles_config WHERE guild_id = ? AND enabled = 1 ORDER BY group_key, role_id",
                 (guild_id,)
@@ -121,7 +122,7 @@ class ReactionRolesStore(BaseService[dict]):
 
     async def get_configured_count(self, guild_id: int) -> int:
         """Get total configured roles count."""
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.ro() as db:
             async with db.execute(
                 "SELECT COUNT(*) FROM reaction_roles_config WHERE guild_id = ?",
                 (guild_id,)
@@ -2,12 +2,13 @@ from __future__ import annotations
 
 import aiosqlite
 
+from ..database import SqlitePool
 from .base import BaseService
 
 
 class RemindersStore(BaseService):
-    def __init__(self, sqlite_path: str, cache_ttl: int = 300) -> None:
-        super().__init__(sqlite_path, cache_ttl)
+    def __init__(self, database: SqlitePool | str, cache_ttl: int = 300) -> None:
+        super().__init__(database, cache_ttl)
 
     async def _create_tables(self, db: aiosqlite.Connection) -> None:
         await db.execute(
@@ -33,7 +34,7 @@ class RemindersStore(BaseService):
         return "SELECT * FROM reminders WHERE id = ?"
 
     async def add(self, user_id: int, channel_id: int, guild_id: int | None, due_ts: int, message: str) -> int:
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             cur = await db.execute(
                 "INSERT INTO reminders (user_id, channel_id, guild_id, due_ts, message) VALUES (?, ?, ?, ?, ?)",
                 (int(user_id), int(channel_id), int(guild_id) if guild_id else None, int(due_ts), message),
@@ -42,7 +43,7 @@ class RemindersStore(BaseService):
             return int(cur.lastrowid)
 
     async def due(self, now_ts: int, limit: int = 50):
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.ro() as db:
             async with db.execute(
                 "SELECT id, user_id, channel_id, guild_id, due_ts, message FROM reminders WHERE due_ts <= ? ORDER BY due_ts ASC LIMIT ?",
                 (int(now_ts), int(limit)),
@@ -50,6 +51,6 @@ class RemindersStore(BaseService):
                 return await cur.fetchall()
 
     async def delete(self, reminder_id: int) -> None:
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             await db.execute("DELETE FROM reminders WHERE id=?", (int(reminder_id),))
             await db.commit()
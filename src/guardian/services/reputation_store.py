@@ -3,12 +3,13 @@ from __future__ import annotations
 import aiosqlite
 import time
 
+from ..database import SqlitePool
 from .base import BaseService
 
 
 class ReputationStore(BaseService):
-    def __init__(self, sqlite_path: str, cache_ttl: int = 300) -> None:
-        super().__init__(sqlite_path, cache_ttl)
+    def __init__(self, database: SqlitePool | str, cache_ttl: int = 300) -> None:
+        super().__init__(database, cache_ttl)
 
     async def _create_tables(self, db: aiosqlite.Connection) -> None:
         await db.execute(
@@ -32,7 +33,7 @@ class ReputationStore(BaseService):
         return "SELECT * FROM reputation WHERE guild_id = ? AND user_id = ?"
 
     async def get(self, guild_id: int, user_id: int) -> tuple[int, int]:
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.ro() as db:
             async with db.execute(
                 "SELECT score, last_given_at FROM reputation WHERE guild_id=? AND user_id=?",
                 (int(guild_id), int(user_id)),
@@ -44,7 +45,7 @@ class ReputationStore(BaseService):
         return (int(row[0]), int(row[1]))
 
     async def set(self, guild_id: int, user_id: int, score: int, last_given_at: int) -> None:
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             await db.execute(
                 """
                 INSERT INTO reputation (guild_id, user_id, score, last_given_at)
@@ -4,6 +4,7 @@ import aiosqlite
 from dataclasses import dataclass
 from typing import Optional, List
 
+from ..database import SqlitePool
 from .base import BaseService
 
 
@@ -21,8 +22,8 @@ class RoleConfig:
 class RoleConfigStore(BaseService[RoleConfig]):
     """SQLite storage for role selection configuration."""
     
-    def __init__(self, db_path: str):
-        super().__init__(db_path, cache_ttl_seconds=600)  # 10 minutes cache
+    def __init__(self, database: SqlitePool | str):
+        super().__init__(database, cache_ttl_seconds=600)  # 10 minutes cache
     
     async def _create_tables(self, db: aiosqlite.Connection) -> None:
         """Create the role_configs table."""
@@ -65,7 +66,7 @@ class RoleConfigStore(BaseService[RoleConfig]):
         enabled: bool = True
     ) -> None:
         """Insert or update a role configuration."""
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             await db.execute("""
                 INSERT OR REPLACE INTO role_configs 
                 (guild_id, role_id, label, emoji, "group", enabled)
@@ -75,8 +76,7 @@ class RoleConfigStore(BaseService[RoleConfig]):
     
     async def get_role(self, guild_id: int, role_id: int) -> Optional[RoleConfig]:
         """Get a specific role configuration."""
-        async with aiosqlite.connect(self._path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._pool.ro() as db:
             cursor = await db.execute("""
                 SELECT guild_id, role_id, label, emoji, "group", enabled
                 FROM role_configs
@@ -89,8 +89,7 @@ class RoleConfigStore(BaseService[RoleConfig]):
     
     async def list_roles(self, guild_id: int, group: Optional[str] = None) -> List[RoleConfig]:
         """List all configured roles for a guild, optionally filtered by group."""
-        async with aiosqlite.connect(self._path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._pool.ro() as db:
             if group:
                 cursor = await db.execute("""
                     SELECT guild_id, role_id, label, emoji, "group", enabled
@@ -110,7 +109,7 @@ class RoleConfigStore(BaseService[RoleConfig]):
     
     async def delete_role(self, guild_id: int, role_id: int) -> None:
         """Delete a role configuration."""
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             await db.execute("""
                 DELETE FROM role_configs
                 WHERE guild_id = ? AND role_id = ?
@@ -119,7 +118,7 @@ class RoleConfigStore(BaseService[RoleConfig]):
     
     async def get_groups(self, guild_id: int) -> List[str]:
         """Get all role groups for a guild."""
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.ro() as db:
             cursor = await db.execute("""
                 SELECT DISTINCT "group"
                 FROM role_configs
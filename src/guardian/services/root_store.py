@@ -5,6 +5,7 @@ import datetime
 from typing import List, Optional, Tuple, Any
 from dataclasses import dataclass
 
+from ..database import SqlitePool
 from .base import BaseService
 
 
@@ -29,8 +30,14 @@ class RootRequest:
 class RootStore(BaseService):
     """Persistent storage for bot root operators and pending requests."""
     
-    def __init__(self, sqlite_path: str) -> None:
-        super().__init__(sqlite_path, cache_ttl_seconds=0)  # No caching for root operations
+    def __init__(self, database: SqlitePool | str) -> None:
+        super().__init__(database, cache_ttl_seconds=0)  # No TTL caching for root operations
+        # Root ids loaded on first check. This store is the only writer, so
+        # approve/remove drop the set and the next check reloads it. The
+        # generation guards against a load that overlaps a write storing a
+        # stale snapshot.
+        self._root_ids: Optional[frozenset[int]] = None
+        self._root_ids_gen = 0
     
     async def _create_tables(self, db: aiosqlite.Connection) -> None:
         """Create database tables for root users and requests."""
@@ -77,29 +84,37 @@ class RootStore(BaseService):
     
     async def _execute(self, query: str, params: tuple = ()) -> None:
         """Execute a database query with commit."""
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             await db.execute(query, params)
             await db.commit()
     
     async def _fetchone(self, query: str, params: tuple = ()) -> Optional[tuple]:
         """Execute a query and fetch one row."""
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.ro() as db:
             cursor = await db.execute(query, params)
             return await cursor.fetchone()
     
     async def _fetchall(self, query: str, params: tuple = ()) -> List[tuple]:
         """Execute a query and fetch all rows."""
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.ro() as db:
             cursor = await db.execute(query, params)
             return await cursor.fetchall()
     
     async def is_root(self, user_id: int) -> bool:
         """Check if user is a root operator."""
-        row = await self._fetchone(
-            "SELECT 1 FROM root_users WHERE user_id = ?",
-            (user_id,)
-        )
-        return row is not None
+        root_ids = self._root_ids
+        if root_ids is None:
+            gen = self._root_ids_gen
+            rows = await self._fetchall("SELECT user_id FROM root_users")
+            root_ids = frozenset(row[0] for row in rows)
+            # Only cache if no write landed while the query was in flight.
+            if gen == self._root_ids_gen:
+                self._root_ids = root_ids
+        return user_id in root_ids
+    
+    def _invalidate_root_ids(self) -> None:
+        self._root_ids = None
+        self._root_ids_gen += 1
     
     async def request_add_root(self, target_id: int, requester_id: int) -> int:
         """Create a request to add a new root operator."""
@@ -117,7 +132,7 @@ class RootStore(BaseService):
         
         # Create new request
         now = datetime.datetime.utcnow().isoformat()
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             cursor = await db.execute(
                 """INSERT INTO root_pending (target_id, requester_id, requested_at, status)
                    VALUES (?, ?, ?, 'pending')""",
@@ -161,6 +176,7 @@ class RootStore(BaseService):
             "INSERT INTO root_users (user_id, added_by, added_at) VALUES (?, ?, ?)",
             (target_id, approver_id, now)
         )
+        self._invalidate_root_ids()
         
         # Update request
         await self._execute(
@@ -203,6 +219,7 @@ class RootStore(BaseService):
             "DELETE FROM root_users WHERE user_id = ?",
             (user_id,)
         )
+        self._invalidate_root_ids()
         
         return True
     
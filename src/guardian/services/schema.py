@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Tuple
+from functools import lru_cache
+from typing import Tuple
 
 
 @dataclass(frozen=True)
@@ -25,20 +26,26 @@ class ChannelSpec:
 @dataclass(frozen=True)
 class CategorySpec:
     name: str
-    channels: List[ChannelSpec]
+    channels: Tuple[ChannelSpec, ...]
 
 
 @dataclass(frozen=True)
 class ServerSchema:
     guild_name: str
-    roles: List[RoleSpec]
-    level_role_map: List[Tuple[int, str]]
-    categories: List[CategorySpec]
+    roles: Tuple[RoleSpec, ...]
+    level_role_map: Tuple[Tuple[int, str], ...]
+    categories: Tuple[CategorySpec, ...]
 
 
+@lru_cache(maxsize=1)
 def canonical_schema() -> ServerSchema:
+    """Return the canonical 833s server schema.
+
+    The schema is static, so it is built once and shared; every container in
+    it is a tuple so the cached instance can't be mutated by a caller.
+    """
     # NOTE: "Owner" and "Co-Owner" are NOT created by the bot. Those are manual and should remain above the bot role.
-    roles: List[RoleSpec] = [
+    roles: Tuple[RoleSpec, ...] = (
         RoleSpec("Bot", 0x5865F2, True, False, "bot"),
         RoleSpec("Head Admin", 0xED4245, True, False, "staff"),
         RoleSpec("Admin", 0xE67E22, True, False, "staff"),
@@ -78,32 +85,32 @@ def canonical_schema() -> ServerSchema:
         RoleSpec("UK/Europe", 0x99AAB5, False, False, "timezone"),
         RoleSpec("Americas", 0x99AAB5, False, False, "timezone"),
         RoleSpec("APAC", 0x99AAB5, False, False, "timezone"),
-    ]
+    )
 
-    level_role_map: List[Tuple[int, str]] = [
+    level_role_map: Tuple[Tuple[int, str], ...] = (
         (0, "Level 0 – New"),
         (5, "Level 5 – Regular"),
         (10, "Level 10 – Contributor"),
         (20, "Level 20 – Veteran"),
         (35, "Level 35 – Elite"),
         (50, "Level 50 – Core"),
-    ]
+    )
 
-    categories: List[CategorySpec] = [
-        CategorySpec("SYSTEM / CORE", [
+    categories: Tuple[CategorySpec, ...] = (
+        CategorySpec("SYSTEM / CORE", (
             ChannelSpec("bot-ops", "text", "Bot heartbeat + rebuild progress + diagnostics."),
             ChannelSpec("server-config", "text", "Read-only config snapshot (bot-posted)."),
             ChannelSpec("permission-audit", "text", "Drift reports + auto-fixes."),
             ChannelSpec("integrations", "text", "Integration notes (staff-only)."),
             ChannelSpec("incident-room", "text", "Emergency coordination (staff-only)."),
-        ]),
-        CategorySpec("ONBOARDING", [
+        )),
+        CategorySpec("ONBOARDING", (
             ChannelSpec("start-here", "text", "Start here. Complete verification in #verify."),
             ChannelSpec("rules", "text", "Rules and policies."),
             ChannelSpec("verify", "text", "Verification flow (buttons)."),
             ChannelSpec("help-verification", "text", "Quarantine-only help channel."),
-        ]),
-        CategorySpec("INFORMATION HUB", [
+        )),
+        CategorySpec("INFORMATION HUB", (
             ChannelSpec("announcements", "text", "Official announcements."),
             ChannelSpec("changelog", "text", "Updates + changelog."),
             ChannelSpec("community-guide", "text", "How the server works."),
@@ -111,8 +118,8 @@ def canonical_schema() -> ServerSchema:
             ChannelSpec("server-status", "text", "Status / incidents / maintenance."),
             ChannelSpec("resources", "text", "Curated resources."),
             ChannelSpec("partners", "text", "Partners (optional)."),
-        ]),
-        CategorySpec("COMMUNITY", [
+        )),
+        CategorySpec("COMMUNITY", (
             ChannelSpec("general", "text", "General discussion."),
             ChannelSpec("introductions", "text", "Introduce yourself."),
             ChannelSpec("media", "text", "Images/videos (keep tidy).", slowmode=4),
@@ -125,8 +132,8 @@ def canonical_schema() -> ServerSchema:
             ChannelSpec("veterans-lounge", "text", "Level 20+ lounge.", slowmode=2),
             ChannelSpec("elite-lounge", "text", "Level 35+ lounge.", slowmode=2),
             ChannelSpec("core-feedback", "text", "Level 50+ feedback.", slowmode=4),
-        ]),
-        CategorySpec("TOPICS", [
+        )),
+        CategorySpec("TOPICS", (
             ChannelSpec("gaming-chat", "text", "Gaming chat."),
             ChannelSpec("looking-for-group", "text", "LFG posts."),
             ChannelSpec("coding-chat", "text", "Coding/tech chat."),
@@ -139,45 +146,45 @@ def canonical_schema() -> ServerSchema:
             ChannelSpec("life-admin", "text", "Life admin."),
             ChannelSpec("forms-and-benefits", "text", "General guidance (no personal data).", slowmode=6),
             ChannelSpec("routines-and-tools", "text", "Routines/tools."),
-        ]),
-        CategorySpec("SUPPORT", [
+        )),
+        CategorySpec("SUPPORT", (
             ChannelSpec("support-start", "text", "Open tickets via buttons."),
             ChannelSpec("support-guidelines", "text", "Support rules."),
             ChannelSpec("ticket-transcripts", "text", "Ticket transcripts (staff read-only)."),
-        ]),
-        CategorySpec("EVENTS", [
+        )),
+        CategorySpec("EVENTS", (
             ChannelSpec("events", "text", "Event posts (read-only)."),
             ChannelSpec("event-chat", "text", "Event discussion."),
             ChannelSpec("calendar", "text", "Upcoming events (bot mirror)."),
-        ]),
-        CategorySpec("VOICE", [
+        )),
+        CategorySpec("VOICE", (
             ChannelSpec("voice-text", "text", "Links while in voice.", slowmode=2),
             ChannelSpec("General Voice", "voice"),
             ChannelSpec("Gaming Voice 1", "voice"),
             ChannelSpec("Gaming Voice 2", "voice"),
             ChannelSpec("Focus / Co-Work", "voice"),
             ChannelSpec("AFK", "voice"),
-        ]),
-        CategorySpec("STAFF", [
+        )),
+        CategorySpec("STAFF", (
             ChannelSpec("staff-announcements", "text", "Staff-only announcements."),
             ChannelSpec("staff-chat", "text", "Staff discussion."),
             ChannelSpec("mod-queue", "text", "Reports feed."),
             ChannelSpec("case-notes", "text", "Case notes (threads)."),
             ChannelSpec("staff-handbook", "text", "Handbook (read-only)."),
-        ]),
-        CategorySpec("LOGS / AUDIT", [
+        )),
+        CategorySpec("LOGS / AUDIT", (
             ChannelSpec("audit-log", "text", "Audit events (bot mirror)."),
             ChannelSpec("message-log", "text", "Message delete/edit logs."),
             ChannelSpec("join-leave-log", "text", "Join/leave logs."),
             ChannelSpec("moderation-log", "text", "Timeout/ban/kick logs."),
             ChannelSpec("anti-raid-log", "text", "Anti-raid events."),
             ChannelSpec("ticket-log", "text", "Ticket open/close events."),
-        ]),
-        CategorySpec("ARCHIVE", [
+        )),
+        CategorySpec("ARCHIVE", (
             ChannelSpec("archived-announcements", "text", "Archived announcements."),
             ChannelSpec("archived-events", "text", "Archived events."),
             ChannelSpec("archived-projects", "text", "Archived projects."),
-        ]),
-    ]
+        )),
+    )
 
     return ServerSchema(guild_name="833s", roles=roles, level_role_map=level_role_map, categories=categories)
@@ -1,12 +1,36 @@
 from __future__ import annotations
 
 import asyncio
+import time
 import discord
 from typing import Dict, Iterable
 
+from .api_wrapper import api_wrapper
 from .schema import ServerSchema
 from ..lookup import find_text_channel, find_voice_channel, find_category
 
+# Deletes during a nuke are independent; this many run at once.
+_NUKE_CONCURRENCY = 5
+_NUKE_STATUS_INTERVAL_SECONDS = 1.0
+
+# Channels where verified members can read but not post.
+_READONLY_CHANNELS = frozenset({
+    "announcements","changelog","community-guide","faq","server-status","resources","partners",
+    "events","support-guidelines","ticket-transcripts","staff-handbook",
+    "audit-log","message-log","join-leave-log","moderation-log","anti-raid-log","ticket-log",
+    "server-config","permission-audit",
+    "start-here","rules",
+})
+
+
+async def _noop_update(*args, **kwargs) -> None:
+    return None
+
+
+def _status_updater(status):
+    """Resolve ``status.update`` once so phase loops can call it unconditionally."""
+    return status.update if status else _noop_update
+
 
 def _ow(**kwargs) -> discord.PermissionOverwrite:
     return discord.PermissionOverwrite(**kwargs)
@@ -35,24 +59,10 @@ class SchemaBuilder:
         # Delete children first, then categories
         children = [c for c in chans if not isinstance(c, discord.CategoryChannel)]
         cats = [c for c in chans if isinstance(c, discord.CategoryChannel)]
+        upd = _status_updater(status)
 
-        for i, ch in enumerate(children, 1):
-            if status:
-                await status.update(guild, i, f"Nuking channels ({i}/{len(children)})")
-            try:
-                await ch.delete(reason="833s Guardian overhaul (nuke)")
-            except discord.HTTPException:
-                await asyncio.sleep(0.2)
-            await asyncio.sleep(0.25)
-
-        for i, cat in enumerate(cats, 1):
-            if status:
-                await status.update(guild, i, f"Nuking categories ({i}/{len(cats)})")
-            try:
-                await cat.delete(reason="833s Guardian overhaul (nuke)")
-            except discord.HTTPException:
-                await asyncio.sleep(0.2)
-            await asyncio.sleep(0.25)
+        await self._delete_all(guild, children, "delete_channel", "channels", upd)
+        await self._delete_all(guild, cats, "delete_category", "categories", upd)
 
         # Delete roles (keep @everyone, managed roles, and roles above bot)
         me = guild.me
@@ -60,28 +70,46 @@ class SchemaBuilder:
             return
         bot_top = me.top_role
 
-        roles = sorted(list(guild.roles), key=lambda r: r.position, reverse=True)
-        for idx, r in enumerate(roles, 1):
-            if r.is_default() or r.managed:
-                continue
-            # Can't delete roles >= bot top
-            if r >= bot_top:
-                continue
-            try:
-                await r.delete(reason="833s Guardian overhaul (nuke)")
-            except discord.HTTPException:
-                await asyncio.sleep(0.2)
-            await asyncio.sleep(0.2)
+        # Can't delete roles >= bot top
+        roles = [r for r in guild.roles if not (r.is_default() or r.managed) and r < bot_top]
+        await self._delete_all(guild, roles, "delete_role", "roles", upd)
+
+    async def _delete_all(self, guild: discord.Guild, items: list, operation: str, label: str, upd=_noop_update) -> None:
+        """Delete ``items`` with a few requests in flight at once, skipping failures."""
+        sem = asyncio.Semaphore(_NUKE_CONCURRENCY)
+        lock = asyncio.Lock()
+        done = 0
+        last_report = 0.0
+
+        async def _delete(obj) -> None:
+            nonlocal done, last_report
+            async with sem:
+                try:
+                    await api_wrapper.call(operation, obj.delete, guild_id=guild.id, reason="833s Guardian overhaul (nuke)")
+                except discord.HTTPException:
+                    pass
+            done += 1
+            # At most one status write per interval; deletes never wait on it.
+            now = time.monotonic()
+            if lock.locked() or now - last_report < _NUKE_STATUS_INTERVAL_SECONDS:
+                return
+            async with lock:
+                last_report = now
+                await upd(guild, done, f"Nuking {label} ({done}/{len(items)})")
+
+        await asyncio.gather(*(_delete(obj) for obj in items))
+        if items:
+            await upd(guild, done, f"Nuking {label} ({done}/{len(items)})")
 
     async def ensure_roles(self, guild: discord.Guild, schema: ServerSchema, *, status=None) -> Dict[str, discord.Role]:
         # Create roles bottom-up to preserve hierarchy
         existing = {r.name: r for r in guild.roles}
         created: Dict[str, discord.Role] = {}
+        upd = _status_updater(status)
 
         # Resolve desired order: as provided in schema.roles (top->bottom). We'll create reversed.
         for i, spec in enumerate(reversed(schema.roles), 1):
-            if status:
-                await status.update(guild, i, f"Ensuring roles ({i}/{len(schema.roles)})")
+            await upd(guild, i, f"Ensuring roles ({i}/{len(schema.roles)})")
             role = existing.get(spec.name)
             if role is None:
                 try:
@@ -95,18 +123,23 @@ class SchemaBuilder:
                     created[spec.name] = role
                     existing[spec.name] = role
                 except discord.HTTPException:
-                    await asyncio.sleep(0.5)
                     continue
             else:
-                try:
-                    await role.edit(
-                        colour=discord.Colour(spec.color) if spec.color is not None else discord.Colour.default(),
-                        hoist=bool(spec.hoist),
-                        mentionable=bool(spec.mentionable),
-                        reason="833s Guardian schema apply",
-                    )
-                except discord.HTTPException:
-                    pass
+                colour = discord.Colour(spec.color) if spec.color is not None else discord.Colour.default()
+                # Existing roles that already match need no PATCH at all.
+                if role.colour != colour or role.hoist != bool(spec.hoist) or role.mentionable != bool(spec.mentionable):
+                    try:
+                        await api_wrapper.call(
+                            "edit_role",
+                            role.edit,
+                            guild_id=guild.id,
+                            colour=colour,
+                            hoist=bool(spec.hoist),
+                            mentionable=bool(spec.mentionable),
+                            reason="833s Guardian schema apply",
+                        )
+                    except discord.HTTPException:
+                        pass
 
             await asyncio.sleep(0.2)
 
@@ -176,35 +209,104 @@ class SchemaBuilder:
 
             return ow
 
+        def channel_overwrites(
+            overwrites: Dict[discord.abc.Snowflake, discord.PermissionOverwrite], name: str, cat_name: str
+        ) -> Dict[discord.abc.Snowflake, discord.PermissionOverwrite]:
+            # Read-only channels
+            if name in _READONLY_CHANNELS and verified:
+                overwrites[verified] = _allow_readonly()
+            # Announcements: allow Admin/Community to post; members react only
+            if name == "announcements":
+                if community:
+                    overwrites[community] = _allow_chat()
+                for r in staff_manage:
+                    overwrites[r] = _allow_chat()
+            # Support start: members can type; transcripts read-only to support/admin
+            if name == "support-start" and verified:
+                overwrites[verified] = _allow_chat()
+                if support:
+                    overwrites[support] = _allow_chat()
+            if name == "ticket-transcripts":
+                # locked to support/admin
+                overwrites[everyone] = _deny_view()
+                if support:
+                    overwrites[support] = _allow_readonly()
+                for r in staff_manage:
+                    overwrites[r] = _allow_chat()
+            if name in {"bot-ops","incident-room","integrations"}:
+                overwrites[everyone] = _deny_view()
+                if verified:
+                    overwrites[verified] = _deny_view()
+                for r in staff_roles:
+                    overwrites[r] = _allow_chat()
+            # Onboarding channel specifics
+            if cat_name == "ONBOARDING":
+                if name in {"verify","help-verification"} and quarantine:
+                    overwrites[quarantine] = _allow_chat()
+                if name in {"verify"} and verified:
+                    overwrites[verified] = _deny_view()
+            # Level lounges: gate by level
+            if name == "contributors-lounge" and lvl10:
+                overwrites[verified] = _deny_view() if verified else overwrites.get(everyone, _deny_view())
+                overwrites[lvl10] = _allow_chat()
+                if lvl20: overwrites[lvl20] = _allow_chat()
+                if lvl35: overwrites[lvl35] = _allow_chat()
+                if lvl50: overwrites[lvl50] = _allow_chat()
+            if name == "veterans-lounge" and lvl20:
+                overwrites[verified] = _deny_view() if verified else overwrites.get(everyone, _deny_view())
+                overwrites[lvl20] = _allow_chat()
+                if lvl35: overwrites[lvl35] = _allow_chat()
+                if lvl50: overwrites[lvl50] = _allow_chat()
+            if name == "elite-lounge" and lvl35:
+                overwrites[verified] = _deny_view() if verified else overwrites.get(everyone, _deny_view())
+                overwrites[lvl35] = _allow_chat()
+                if lvl50: overwrites[lvl50] = _allow_chat()
+            if name == "core-feedback" and lvl50:
+                overwrites[verified] = _deny_view() if verified else overwrites.get(everyone, _deny_view())
+                overwrites[lvl50] = _allow_chat()
+            return overwrites
+
+        upd = _status_updater(status)
+
         # Ensure categories in locked order
         existing_cats = {c.name: c for c in guild.categories}
+        # Exact-name indexes built once; the fuzzy lookup only runs on a miss.
+        existing_text = {c.name: c for c in guild.text_channels}
+        existing_voice = {c.name: c for c in guild.voice_channels}
         for idx, cat_spec in enumerate(schema.categories, 1):
-            if status:
-                await status.update(guild, idx, f"Ensuring categories ({idx}/{len(schema.categories)})")
+            await upd(guild, idx, f"Ensuring categories ({idx}/{len(schema.categories)})")
             cat = existing_cats.get(cat_spec.name)
+            key = "ONBOARDING" if cat_spec.name == "ONBOARDING" else cat_spec.name
             if cat is None:
+                # New categories get their overwrites in the create call.
                 try:
-                    cat = await guild.create_category(name=cat_spec.name, reason="833s Guardian schema apply")
+                    cat = await guild.create_category(
+                        name=cat_spec.name, overwrites=cat_overwrites(key), reason="833s Guardian schema apply",
+                    )
                     existing_cats[cat_spec.name] = cat
                 except discord.HTTPException:
-                    await asyncio.sleep(0.5)
                     continue
-
-            # apply category overwrites
-            key = "ONBOARDING" if cat_spec.name == "ONBOARDING" else cat_spec.name
-            try:
-                await cat.edit(overwrites=cat_overwrites(key), reason="833s Guardian schema apply")
-            except discord.HTTPException:
-                pass
+            else:
+                # apply category overwrites
+                try:
+                    await api_wrapper.call(
+                        "edit_category", cat.edit, guild_id=guild.id,
+                        overwrites=cat_overwrites(key), reason="833s Guardian schema apply",
+                    )
+                except discord.HTTPException:
+                    pass
 
             await asyncio.sleep(0.25)
 
             # channels
             for ch_i, ch_spec in enumerate(cat_spec.channels, 1):
-                if status:
-                    await status.update(guild, ch_i, f"Ensuring channels in {cat_spec.name} ({ch_i}/{len(cat_spec.channels)})")
+                await upd(guild, ch_i, f"Ensuring channels in {cat_spec.name} ({ch_i}/{len(cat_spec.channels)})")
                 if ch_spec.kind == "text":
-                    ch = find_text_channel(guild, ch_spec.name)
+                    ch = existing_text.get(ch_spec.name) or find_text_channel(guild, ch_spec.name)
+                    # Overwrites go out with the create/edit itself rather than as a second PATCH.
+                    # A new channel starts from its category's overwrites, as Discord would sync them.
+                    base = dict(ch.overwrites) if ch else cat_overwrites(key)
+                    overwrites = channel_overwrites(base, ch.name if ch else ch_spec.name, cat_spec.name)
                     if not ch:
                         try:
                             ch = await guild.create_text_channel(
@@ -212,96 +314,39 @@ class SchemaBuilder:
                                 category=cat,
                                 topic=ch_spec.topic,
                                 slowmode_delay=int(ch_spec.slowmode),
+                                overwrites=overwrites,
                                 reason="833s Guardian schema apply",
                             )
+                            existing_text[ch_spec.name] = ch
                         except discord.HTTPException:
-                            await asyncio.sleep(0.5)
                             continue
                     else:
                         try:
-                            await ch.edit(category=cat, topic=ch_spec.topic, slowmode_delay=int(ch_spec.slowmode), reason="833s Guardian schema apply")
+                            await api_wrapper.call(
+                                "edit_channel", ch.edit, guild_id=guild.id,
+                                category=cat, topic=ch_spec.topic, slowmode_delay=int(ch_spec.slowmode),
+                                overwrites=overwrites, reason="833s Guardian schema apply",
+                            )
                         except discord.HTTPException:
                             pass
 
-                    # per-channel overrides
-                    overwrites = dict(ch.overwrites)
-                    # Read-only channels
-                    readonly = {
-                        "announcements","changelog","community-guide","faq","server-status","resources","partners",
-                        "events","support-guidelines","ticket-transcripts","staff-handbook",
-                        "audit-log","message-log","join-leave-log","moderation-log","anti-raid-log","ticket-log",
-                        "server-config","permission-audit",
-                        "start-here","rules",
-                    }
-                    if ch.name in readonly and verified:
-                        overwrites[verified] = _allow_readonly()
-                    # Announcements: allow Admin/Community to post; members react only
-                    if ch.name == "announcements":
-                        if community:
-                            overwrites[community] = _allow_chat()
-                        for r in staff_manage:
-                            overwrites[r] = _allow_chat()
-                    # Support start: members can type; transcripts read-only to support/admin
-                    if ch.name == "support-start" and verified:
-                        overwrites[verified] = _allow_chat()
-                        if support:
-                            overwrites[support] = _allow_chat()
-                    if ch.name == "ticket-transcripts":
-                        # locked to support/admin
-                        overwrites[everyone] = _deny_view()
-                        if support:
-                            overwrites[support] = _allow_readonly()
-                        for r in staff_manage:
-                            overwrites[r] = _allow_chat()
-                    if ch.name in {"bot-ops","incident-room","integrations"}:
-                        overwrites[everyone] = _deny_view()
-                        if verified:
-                            overwrites[verified] = _deny_view()
-                        for r in staff_roles:
-                            overwrites[r] = _allow_chat()
-                    # Onboarding channel specifics
-                    if cat_spec.name == "ONBOARDING":
-                        if ch.name in {"verify","help-verification"} and quarantine:
-                            overwrites[quarantine] = _allow_chat()
-                        if ch.name in {"verify"} and verified:
-                            overwrites[verified] = _deny_view()
-                    # Level lounges: gate by level
-                    if ch.name == "contributors-lounge" and lvl10:
-                        overwrites[verified] = _deny_view() if verified else overwrites.get(everyone, _deny_view())
-                        overwrites[lvl10] = _allow_chat()
-                        if lvl20: overwrites[lvl20] = _allow_chat()
-                        if lvl35: overwrites[lvl35] = _allow_chat()
-                        if lvl50: overwrites[lvl50] = _allow_chat()
-                    if ch.name == "veterans-lounge" and lvl20:
-                        overwrites[verified] = _deny_view() if verified else overwrites.get(everyone, _deny_view())
-                        overwrites[lvl20] = _allow_chat()
-                        if lvl35: overwrites[lvl35] = _allow_chat()
-                        if lvl50: overwrites[lvl50] = _allow_chat()
-                    if ch.name == "elite-lounge" and lvl35:
-                        overwrites[verified] = _deny_view() if verified else overwrites.get(everyone, _deny_view())
-                        overwrites[lvl35] = _allow_chat()
-                        if lvl50: overwrites[lvl50] = _allow_chat()
-                    if ch.name == "core-feedback" and lvl50:
-                        overwrites[verified] = _deny_view() if verified else overwrites.get(everyone, _deny_view())
-                        overwrites[lvl50] = _allow_chat()
-
-                    try:
-                        await ch.edit(overwrites=overwrites, reason="833s Guardian schema apply")
-                    except discord.HTTPException:
-                        pass
-
                 else:
                     # voice
-                    vc = find_voice_channel(guild, ch_spec.name)
+                    vc = existing_voice.get(ch_spec.name) or find_voice_channel(guild, ch_spec.name)
                     if not vc:
                         try:
-                            vc = await guild.create_voice_channel(name=ch_spec.name, category=cat, reason="833s Guardian schema apply")
+                            vc = await guild.create_voice_channel(
+                                name=ch_spec.name, category=cat, reason="833s Guardian schema apply",
+                            )
+                            existing_voice[ch_spec.name] = vc
                         except discord.HTTPException:
-                            await asyncio.sleep(0.5)
                             continue
                     else:
                         try:
-                            await vc.edit(category=cat, reason="833s Guardian schema apply")
+                            await api_wrapper.call(
+                                "edit_channel", vc.edit, guild_id=guild.id,
+                                category=cat, reason="833s Guardian schema apply",
+                            )
                         except discord.HTTPException:
                             pass
 
@@ -311,9 +356,12 @@ class SchemaBuilder:
         try:
             # Move categories in the exact order they appear
             for pos, cat_spec in enumerate(schema.categories):
-                cat = find_category(guild, cat_spec.name)
+                cat = existing_cats.get(cat_spec.name) or find_category(guild, cat_spec.name)
                 if cat:
-                    await cat.edit(position=pos, reason="833s Guardian schema apply")
+                    await api_wrapper.call(
+                        "edit_category", cat.edit, guild_id=guild.id,
+                        position=pos, reason="833s Guardian schema apply",
+                    )
                     await asyncio.sleep(0.15)
         except discord.HTTPException:
             pass
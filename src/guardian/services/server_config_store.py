@@ -3,6 +3,7 @@ from __future__ import annotations
 import aiosqlite
 from dataclasses import dataclass
 
+from ..database import SqlitePool
 from .base import BaseService
 
 
@@ -16,8 +17,8 @@ class ServerConfig:
 
 
 class ServerConfigStore(BaseService):
-    def __init__(self, sqlite_path: str, cache_ttl: int = 300) -> None:
-        super().__init__(sqlite_path, cache_ttl)
+    def __init__(self, database: SqlitePool | str, cache_ttl: int = 300) -> None:
+        super().__init__(database, cache_ttl)
 
     async def _create_tables(self, db: aiosqlite.Connection) -> None:
         await db.execute(
@@ -31,6 +32,15 @@ class ServerConfigStore(BaseService):
             )
             """
         )
+        # Bot-wide (not per-guild) values that must survive restarts.
+        await db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS bot_state (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            )
+            """
+        )
     
     def _from_row(self, row: aiosqlite.Row) -> ServerConfig:
         return ServerConfig(
@@ -46,7 +56,7 @@ class ServerConfigStore(BaseService):
         return "SELECT * FROM server_config WHERE guild_id = ?"
 
     async def get(self, guild_id: int) -> ServerConfig:
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.ro() as db:
             async with db.execute(
                 "SELECT welcome_channel_id, welcome_enabled, autorole_id, bot_commands_channel_id FROM server_config WHERE guild_id=?",
                 (int(guild_id),),
@@ -65,7 +75,7 @@ class ServerConfigStore(BaseService):
         )
 
     async def upsert(self, cfg: ServerConfig) -> None:
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             await db.execute(
                 """
                 INSERT INTO server_config (guild_id, welcome_channel_id, welcome_enabled, autorole_id, bot_commands_channel_id)
@@ -85,3 +95,20 @@ class ServerConfigStore(BaseService):
                 ),
             )
             await db.commit()
+
+    async def get_state(self, key: str) -> str | None:
+        async with self._pool.ro() as db:
+            async with db.execute("SELECT value FROM bot_state WHERE key=?", (str(key),)) as cur:
+                row = await cur.fetchone()
+        return str(row[0]) if row else None
+
+    async def set_state(self, key: str, value: str) -> None:
+        async with self._pool.rw() as db:
+            await db.execute(
+                """
+                INSERT INTO bot_state (key, value) VALUES (?, ?)
+                ON CONFLICT(key) DO UPDATE SET value=excluded.value
+                """,
+                (str(key), str(value)),
+            )
+            await db.commit()
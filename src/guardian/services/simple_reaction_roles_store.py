@@ -4,6 +4,7 @@ import aiosqlite
 import logging
 from typing import List, Dict, Any
 
+from ..database import SqlitePool
 from .base import BaseService
 
 log = logging.getLogger("guardian.reaction_roles_store")
@@ -18,8 +19,8 @@ class SimpleReactionRolesStore(BaseService[dict]):
     def _from_row(self, row: aiosqlite.Row) -> dict:
         return dict(row)
     
-    def __init__(self, sqlite_path: str, cache_ttl_seconds: int = 300) -> None:
-        super().__init__(sqlite_path, cache_ttl_seconds)
+    def __init__(self, database: SqlitePool | str, cache_ttl_seconds: int = 300) -> None:
+        super().__init__(database, cache_ttl_seconds)
 
     async def _create_tables(self, db: aiosqlite.Connection) -> None:
         """Create reaction roles configuration table."""
@@ -39,7 +40,7 @@ class SimpleReactionRolesStore(BaseService[dict]):
 
     async def init(self):
         """Initialize database schema."""
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             await self._create_tables(db)
             await db.commit()
         log.info("SimpleReactionRolesStore initialized")
@@ -48,7 +49,7 @@ class SimpleReactionRolesStore(BaseService[dict]):
         """Add multiple roles to a group."""
         errors = []
         
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             for role_id in role_ids:
                 try:
                     await db.execute(
@@ -66,7 +67,7 @@ class SimpleReactionRolesStore(BaseService[dict]):
         """Remove multiple roles."""
         errors = []
         
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             for role_id in role_ids:
                 try:
                     await db.execute(
@@ -82,7 +83,7 @@ class SimpleReactionRolesStore(BaseService[dict]):
 
     async def list_group(self, guild_id: int, group_key: str) -> List[int]:
         """List all role IDs in a group."""
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.ro() as db:
             async with db.execute(
                 "SELECT role_id FROM reaction_roles_config WHERE guild_id = ? AND group_key = ? AND enabled = 1 ORDER BY role_id",
                 (guild_id, group_key)
@@ -92,7 +93,7 @@ class SimpleReactionRolesStore(BaseService[dict]):
 
     async def list_all(self, guild_id: int) -> Dict[str, List[int]]:
         """List all roles grouped by group."""
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.ro() as db:
             async with db.execute(
                 "SELECT group_key, role_id FROM reaction_roles_config WHERE guild_id = ? AND enabled = 1 ORDER BY group_key, role_id",
                 (guild_id,)
@@ -109,7 +110,7 @@ class SimpleReactionRolesStore(BaseService[dict]):
 
     async def get_configured_count(self, guild_id: int) -> int:
         """Get total configured roles count."""
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.ro() as db:
             async with db.execute(
                 "SELECT COUNT(*) FROM reaction_roles_config WHERE guild_id = ?",
                 (guild_id,)
@@ -7,6 +7,7 @@ from typing import Any, Dict, Optional
 
 import aiosqlite
 
+from ..database import SqlitePool
 from .base import BaseService
 
 
@@ -19,8 +20,8 @@ class Snapshot:
 
 
 class SnapshotStore(BaseService):
-    def __init__(self, sqlite_path: str, cache_ttl: int = 300) -> None:
-        super().__init__(sqlite_path, cache_ttl)
+    def __init__(self, database: SqlitePool | str, cache_ttl: int = 300) -> None:
+        super().__init__(database, cache_ttl)
 
     async def _create_tables(self, db: aiosqlite.Connection) -> None:
         await db.execute(
@@ -51,7 +52,7 @@ class SnapshotStore(BaseService):
     async def put(self, guild_id: int, kind: str, payload: Dict[str, Any]) -> int:
         created_at = int(time.time())
         payload_json = json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             await db.execute(
                 "INSERT INTO snapshots (guild_id, created_at, kind, payload_json) VALUES (?, ?, ?, ?)",
                 (int(guild_id), int(created_at), str(kind), payload_json),
@@ -60,7 +61,7 @@ class SnapshotStore(BaseService):
         return created_at
 
     async def latest(self, guild_id: int, kind: str) -> Optional[Snapshot]:
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.ro() as db:
             async with db.execute(
                 "SELECT created_at, payload_json FROM snapshots WHERE guild_id=? AND kind=? ORDER BY created_at DESC LIMIT 1",
                 (int(guild_id), str(kind)),
@@ -2,12 +2,13 @@ from __future__ import annotations
 
 import aiosqlite
 
+from ..database import SqlitePool
 from .base import BaseService
 
 
 class StarboardStore(BaseService):
-    def __init__(self, sqlite_path: str, cache_ttl: int = 300) -> None:
-        super().__init__(sqlite_path, cache_ttl)
+    def __init__(self, database: SqlitePool | str, cache_ttl: int = 300) -> None:
+        super().__init__(database, cache_ttl)
 
     async def _create_tables(self, db: aiosqlite.Connection) -> None:
         await db.execute(
@@ -40,7 +41,7 @@ class StarboardStore(BaseService):
         return "SELECT * FROM starboard_config WHERE guild_id = ?"
 
     async def set_config(self, guild_id: int, channel_id: int, threshold: int) -> None:
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             await db.execute(
                 "INSERT INTO starboard_config (guild_id, channel_id, threshold) VALUES (?, ?, ?) "
                 "ON CONFLICT(guild_id) DO UPDATE SET channel_id=excluded.channel_id, threshold=excluded.threshold",
@@ -49,7 +50,7 @@ class StarboardStore(BaseService):
             await db.commit()
 
     async def get_config(self, guild_id: int):
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.ro() as db:
             async with db.execute(
                 "SELECT channel_id, threshold FROM starboard_config WHERE guild_id=?",
                 (int(guild_id),),
@@ -58,7 +59,7 @@ class StarboardStore(BaseService):
         return (int(row[0]), int(row[1])) if row else None
 
     async def upsert_post(self, guild_id: int, source_message_id: int, starboard_message_id: int, stars: int) -> None:
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             await db.execute(
                 "INSERT INTO starboard_posts (guild_id, source_message_id, starboard_message_id, stars) VALUES (?, ?, ?, ?) "
                 "ON CONFLICT(guild_id, source_message_id) DO UPDATE SET starboard_message_id=excluded.starboard_message_id, stars=excluded.stars",
@@ -67,7 +68,7 @@ class StarboardStore(BaseService):
             await db.commit()
 
     async def get_post(self, guild_id: int, source_message_id: int):
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.ro() as db:
             async with db.execute(
                 "SELECT starboard_message_id, stars FROM starboard_posts WHERE guild_id=? AND source_message_id=?",
                 (int(guild_id), int(source_message_id)),
@@ -3,12 +3,13 @@ from __future__ import annotations
 import time
 import aiosqlite
 
+from ..database import SqlitePool
 from .base import BaseService
 
 
 class SuggestionsStore(BaseService):
-    def __init__(self, sqlite_path: str, cache_ttl: int = 300) -> None:
-        super().__init__(sqlite_path, cache_ttl)
+    def __init__(self, database: SqlitePool | str, cache_ttl: int = 300) -> None:
+        super().__init__(database, cache_ttl)
 
     async def _create_tables(self, db: aiosqlite.Connection) -> None:
         await db.execute(
@@ -35,14 +36,14 @@ class SuggestionsStore(BaseService):
         return "SELECT * FROM suggestions WHERE guild_id = ? AND suggestion_id = ?"
 
     async def next_id(self, guild_id: int) -> int:
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.ro() as db:
             async with db.execute("SELECT COALESCE(MAX(suggestion_id),0)+1 FROM suggestions WHERE guild_id=?", (int(guild_id),)) as cur:
                 row = await cur.fetchone()
         return int(row[0]) if row else 1
 
     async def add(self, guild_id: int, author_id: int, content: str) -> int:
         sid = await self.next_id(guild_id)
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             await db.execute(
                 "INSERT INTO suggestions (guild_id, suggestion_id, author_id, content, created_at) VALUES (?, ?, ?, ?, ?)",
                 (int(guild_id), int(sid), int(author_id), str(content), int(time.time())),
@@ -51,7 +52,7 @@ class SuggestionsStore(BaseService):
         return sid
 
     async def set_message(self, guild_id: int, suggestion_id: int, message_id: int) -> None:
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             await db.execute(
                 "UPDATE suggestions SET message_id=? WHERE guild_id=? AND suggestion_id=?",
                 (int(message_id), int(guild_id), int(suggestion_id)),
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import aiosqlite
+from ..database import SqlitePool
 from .base import BaseService
 from dataclasses import dataclass
 
@@ -13,8 +14,8 @@ class TitleState:
 
 
 class TitlesStore(BaseService):
-    def __init__(self, sqlite_path: str, cache_ttl: int = 300) -> None:
-        super().__init__(sqlite_path, cache_ttl)
+    def __init__(self, database: SqlitePool | str, cache_ttl: int = 300) -> None:
+        super().__init__(database, cache_ttl)
 
     async def _create_tables(self, db: aiosqlite.Connection) -> None:
         await db.execute(
@@ -41,7 +42,7 @@ class TitlesStore(BaseService):
         return "SELECT * FROM titles WHERE guild_id = ? AND user_id = ?"
 
     async def get(self, guild_id: int, user_id: int) -> TitleState:
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.ro() as db:
             cur = await db.execute(
                 "SELECT equipped FROM titles WHERE guild_id=? AND user_id=?",
                 (int(guild_id), int(user_id)),
@@ -53,7 +54,7 @@ class TitlesStore(BaseService):
 
     async def set_equipped(self, guild_id: int, user_id: int, title: str) -> None:
         title = (title or "").strip()[:48]
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             await db.execute(
                 """
                 INSERT INTO titles (guild_id, user_id, equipped, updated_at)
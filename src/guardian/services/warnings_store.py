@@ -4,6 +4,7 @@ import aiosqlite
 from dataclasses import dataclass
 from typing import Optional
 
+from ..database import SqlitePool
 from .base import BaseService
 
 
@@ -18,8 +19,8 @@ class WarningRecord:
 
 
 class WarningsStore(BaseService):
-    def __init__(self, sqlite_path: str, cache_ttl: int = 300) -> None:
-        super().__init__(sqlite_path, cache_ttl)
+    def __init__(self, database: SqlitePool | str, cache_ttl: int = 300) -> None:
+        super().__init__(database, cache_ttl)
 
     async def _create_tables(self, db: aiosqlite.Connection) -> None:
         await db.execute(
@@ -51,7 +52,7 @@ class WarningsStore(BaseService):
         return "SELECT id, guild_id, user_id, moderator_id, reason, created_at_iso FROM warnings WHERE id = ?"
 
     async def add_warning(self, guild_id: int, user_id: int, moderator_id: int, reason: str, created_at_iso: str) -> int:
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             cur = await db.execute(
                 "INSERT INTO warnings (guild_id, user_id, moderator_id, reason, created_at_iso) VALUES (?, ?, ?, ?, ?)",
                 (guild_id, user_id, moderator_id, reason, created_at_iso),
@@ -61,8 +62,7 @@ class WarningsStore(BaseService):
 
     async def list_warnings(self, guild_id: int, user_id: int, limit: int = 20) -> list[WarningRecord]:
         limit = max(1, min(100, int(limit)))
-        async with aiosqlite.connect(self._path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._pool.ro() as db:
             async with db.execute(
                 "SELECT id, guild_id, user_id, moderator_id, reason, created_at_iso FROM warnings WHERE guild_id = ? AND user_id = ? ORDER BY id DESC LIMIT ?",
                 (guild_id, user_id, limit),
@@ -71,7 +71,7 @@ class WarningsStore(BaseService):
         return [self._from_row(row) for row in rows]
 
     async def clear_warnings(self, guild_id: int, user_id: int) -> int:
-        async with aiosqlite.connect(self._path) as db:
+        async with self._pool.rw() as db:
             cur = await db.execute("DELETE FROM warnings WHERE guild_id = ? AND user_id = ?", (guild_id, user_id))
             await db.commit()
             return int(cur.rowcount)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Optional, Any, Union
+from typing import Any, Awaitable, Callable, Iterable, Optional, TypeVar, Union
 
 import discord
 from discord import ui
@@ -20,6 +20,8 @@ from .constants import (
 
 log = logging.getLogger("guardian.utils")
 
+T = TypeVar("T")
+
 
 def safe_embed(title: str, description: str, color: int = COLORS["default"]) -> discord.Embed:
     """Create an embed with safe length limits."""
@@ -179,3 +181,22 @@ async def retry_async(
             wait_time = delay * (2 ** attempt)
             log.warning(f"Attempt {attempt + 1} failed, retrying in {wait_time}s: {e}")
             await asyncio.sleep(wait_time)
+
+
+async def run_batch(
+    items: Iterable[T],
+    op: Callable[[T], Awaitable[Any]],
+    *,
+    batch_size: int = 20,
+) -> list[Any]:
+    """Run ``op`` over ``items`` concurrently, ``batch_size`` at a time.
+
+    Results (or raised exceptions) are returned in input order; one failing
+    item never cancels the rest of its batch.
+    """
+    pending = list(items)
+    results: list[Any] = []
+    for start in range(0, len(pending), batch_size):
+        chunk = pending[start:start + batch_size]
+        results.extend(await asyncio.gather(*(op(item) for item in chunk), return_exceptions=True))
+    return results